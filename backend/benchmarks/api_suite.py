@@ -0,0 +1,219 @@
+"""
+Repeatable API benchmark over data from `manage.py seed_data`.
+
+Runs the public restaurant list/detail/search/near endpoints, the admin
+owner application queue, the superadmin user search and the single-file upload
+in-process through the full middleware stack (Django test client, real JWT
+auth). Each scenario reports p50/p95/p99 latency, queries per request and the
+peak memory Python allocated for one request (tracemalloc, measured in a
+separate pass so it doesn't skew the timings).
+
+Runs against whatever DATABASE_URL points at: local SQLite or Postgres (set
+DATABASE_SSL_REQUIRE=False for a local server).
+
+    cd backend
+    export DATABASE_URL=sqlite:////tmp/foodas-bench.db
+    python manage.py migrate && python manage.py seed_data --users 20000 --applications 5000
+    python -m benchmarks.api_suite --save before.json
+    # ...change code...
+    python -m benchmarks.api_suite --compare before.json
+
+The public-response cache (core.cache) is bypassed unless --with-cache is
+given, so repeated requests measure the database path. Uploads go to
+LocalStorage in a temporary directory, with fresh random content each time so
+deduplication doesn't short-circuit them.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+SCENARIOS = (
+    'restaurant_list', 'restaurant_list_page2', 'restaurant_detail', 'restaurant_search', 'restaurant_near',
+    'admin_queue', 'superadmin_user_search', 'file_upload',
+)
+MEMORY_SAMPLES = 5
+
+
+def _setup_django():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    import django
+    django.setup()
+    # One log line per request would dominate the timings
+    logging.getLogger('core.sql').setLevel(logging.WARNING)
+    logging.getLogger('django.request').setLevel(logging.ERROR)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def _percentile(samples, pct):
+    return statistics.quantiles(samples, n=100, method='inclusive')[pct - 1] if len(samples) > 1 else samples[0]
+
+
+class Suite:
+    def __init__(self, rng, upload_kb):
+        from django.test import Client
+        from core.management.commands.seed_data import CITIES, CUISINE_WORDS, EMAIL_DOMAIN
+        from core.models import Restaurant, User
+
+        self.rng = rng
+        self.upload_kb = upload_kb
+        self.client = Client()
+        try:
+            self.tokens = {
+                role: f'Bearer {self._access_token(User.objects.get(email=f"seed-{role}@{EMAIL_DOMAIN}"))}'
+                for role in ('admin', 'superadmin', 'owner')
+            }
+        except User.DoesNotExist:
+            raise SystemExit('No seeded data found: run `python manage.py seed_data` first.')
+        self.restaurant_ids = list(Restaurant.objects.filter(status='ACTIVE').values_list('id', flat=True))
+        self.cities = CITIES
+        self.words = CUISINE_WORDS
+        first = self.client.get('/api/restaurants/').json()
+        self.page2_cursor = first['next']
+
+    @staticmethod
+    def _access_token(user):
+        from core.views.auth_views import CustomTokenObtainPairSerializer
+        return CustomTokenObtainPairSerializer.get_token(user).access_token
+
+    def request(self, name):
+        """Issue one request for scenario `name`; returns the response."""
+        rng = self.rng
+        if name == 'restaurant_list':
+            return self.client.get('/api/restaurants/')
+        if name == 'restaurant_list_page2':
+            return self.client.get(self.page2_cursor)
+        if name == 'restaurant_detail':
+            return self.client.get(f'/api/restaurants/{rng.choice(self.restaurant_ids)}/')
+        if name == 'restaurant_search':
+            return self.client.get('/api/restaurants/', {'search': rng.choice(self.words)[:rng.randint(3, 6)]})
+        if name == 'restaurant_near':
+            _, lat, lng = rng.choice(self.cities)
+            return self.client.get('/api/restaurants/', {'near': f'{lat},{lng}', 'radius_km': 5})
+        if name == 'admin_queue':
+            return self.client.get('/api/admin/owner-applications/', HTTP_AUTHORIZATION=self.tokens['admin'])
+        if name == 'superadmin_user_search':
+            return self.client.get(
+                '/api/superadmin/users/', {'search': f'user{rng.randint(0, 999)}'},
+                HTTP_AUTHORIZATION=self.tokens['superadmin'],
+            )
+        if name == 'file_upload':
+            from django.core.files.uploadedfile import SimpleUploadedFile
+            body = b'\xff\xd8\xff\xe0' + os.urandom(self.upload_kb * 1024)
+            return self.client.post(
+                '/api/owner/upload/', {'file': SimpleUploadedFile('bench.jpg', body, 'image/jpeg')},
+                HTTP_AUTHORIZATION=self.tokens['owner'],
+            )
+        raise ValueError(name)
+
+    def run(self, name, iterations, warmup):
+        from core.instrumentation import record_queries
+
+        for _ in range(warmup):
+            self._checked(name)
+        latencies, queries = [], []
+        for _ in range(iterations):
+            with record_queries() as recorder:
+                start = time.perf_counter()
+                self._checked(name)
+                latencies.append((time.perf_counter() - start) * 1000)
+            queries.append(recorder.count)
+
+        peaks = []
+        for _ in range(MEMORY_SAMPLES):
+            tracemalloc.start()
+            self._checked(name)
+            peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+            tracemalloc.stop()
+
+        return {
+            'p50_ms': round(_percentile(latencies, 50), 2),
+            'p95_ms': round(_percentile(latencies, 95), 2),
+            'p99_ms': round(_percentile(latencies, 99), 2),
+            'mean_ms': round(statistics.fmean(latencies), 2),
+            'queries': round(statistics.fmean(queries), 1),
+            'peak_kb': round(statistics.median(peaks), 1),
+        }
+
+    def _checked(self, name):
+        response = self.request(name)
+        if response.status_code >= 400:
+            raise SystemExit(f'{name}: HTTP {response.status_code} {response.content[:200]!r}')
+        return response
+
+
+def _print_results(results, baseline=None):
+    header = f'{"scenario":<24}{"p50 ms":>9}{"p95 ms":>9}{"p99 ms":>9}{"queries":>9}{"peak KB":>9}'
+    print(header + ('   vs baseline p50 / queries' if baseline else ''))
+    for name, r in results.items():
+        line = f'{name:<24}{r["p50_ms"]:>9.2f}{r["p95_ms"]:>9.2f}{r["p99_ms"]:>9.2f}{r["queries"]:>9.1f}{r["peak_kb"]:>9.1f}'
+        before = (baseline or {}).get(name)
+        if before:
+            change = (r['p50_ms'] - before['p50_ms']) / before['p50_ms'] * 100 if before['p50_ms'] else 0.0
+            line += f'   {change:+6.1f}% / {r["queries"] - before["queries"]:+.1f}'
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--only', nargs='+', choices=SCENARIOS, help='Run a subset of scenarios')
+    parser.add_argument('--upload-kb', type=int, default=256)
+    parser.add_argument('--with-cache', action='store_true', help='Keep the public-response cache enabled')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--save', metavar='JSON', help='Write results (with commit and database) to a file')
+    parser.add_argument('--compare', metavar='JSON', help='Show changes against results saved earlier')
+    args = parser.parse_args()
+
+    _setup_django()
+    from django.db import connection
+    from django.test.utils import override_settings
+
+    overrides = {
+        'DEBUG': False,  # DEBUG keeps every query in connection.queries
+        'ALLOWED_HOSTS': ['testserver'],
+        'STORAGE_BACKEND': 'core.storage.LocalStorage',
+        'MEDIA_ROOT': tempfile.mkdtemp(prefix='foodas-bench-'),
+    }
+    if not args.with_cache:
+        from django.conf import settings
+        overrides['CACHES'] = {**settings.CACHES, 'bench-off': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+        overrides['RESTAURANT_CACHE_ALIAS'] = 'bench-off'
+
+    results = {}
+    with override_settings(**overrides):
+        suite = Suite(random.Random(args.seed), args.upload_kb)
+        print(f'{connection.vendor} database, {len(suite.restaurant_ids)} active restaurants, '
+              f'{args.iterations} requests per scenario, commit {_git_commit()}\n')
+        for name in args.only or SCENARIOS:
+            results[name] = suite.run(name, args.iterations, args.warmup)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            saved = json.load(f)
+        print(f'Baseline: commit {saved["commit"]} on {saved["database"]}')
+        baseline = saved['results']
+    _print_results(results, baseline)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'commit': _git_commit(), 'database': connection.vendor, 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
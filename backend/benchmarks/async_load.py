@@ -0,0 +1,194 @@
+"""
+Sync (WSGI, gunicorn threads) vs async (ASGI, uvicorn worker) under slow storage.
+
+For each mode this starts one server process on the seeded database, with
+Supabase storage pointed at a local stand-in that takes `--delay` seconds per
+upload. It then runs, for `--duration` seconds:
+
+- `--uploaders` clients that keep posting fresh random images to
+  /api/owner/upload/ as the seeded owner
+- `--browsers` clients that keep reading public restaurant detail pages
+
+It reports the throughput of both plus browse latency percentiles. Under WSGI
+every in-flight upload holds one of the `--threads` threads, so browsing queues
+behind them. Under ASGI an upload waiting on storage holds only a socket.
+
+    cd backend
+    export DATABASE_URL=sqlite:////tmp/foodas-bench.db
+    python manage.py migrate && python manage.py seed_data
+    python -m benchmarks.async_load --uploaders 64 --delay 0.5
+
+Needs gunicorn and uvicorn-worker (requirements.txt).
+"""
+import argparse
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+MODES = ('sync', 'async')
+STARTUP_TIMEOUT = 30
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _percentile(samples, pct):
+    if not samples:
+        return 0.0
+    return statistics.quantiles(samples, n=100, method='inclusive')[pct - 1] if len(samples) > 1 else samples[0]
+
+
+def _seed_fixtures():
+    """(owner access token, active restaurant ids) from the seeded database."""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    import django
+    django.setup()
+    from core.management.commands.seed_data import EMAIL_DOMAIN
+    from core.models import Restaurant, User
+    from core.views.auth_views import CustomTokenObtainPairSerializer
+
+    try:
+        owner = User.objects.get(email=f'seed-owner@{EMAIL_DOMAIN}')
+    except User.DoesNotExist:
+        raise SystemExit('No seeded data found: run `python manage.py seed_data` first.')
+    token = str(CustomTokenObtainPairSerializer.get_token(owner).access_token)
+    ids = list(Restaurant.objects.filter(status='ACTIVE').values_list('id', flat=True)[:500])
+    return token, ids
+
+
+def _server_command(mode, port, threads):
+    command = [sys.executable, '-m', 'gunicorn', '--workers', '1', '--bind', f'127.0.0.1:{port}']
+    if mode == 'sync':
+        return command + ['--threads', str(threads), 'config.wsgi:application']
+    return command + ['-k', 'uvicorn_worker.UvicornWorker', 'config.asgi:application']
+
+
+def _wait_until_up(base_url, process):
+    import requests
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f'Server exited with code {process.returncode}')
+        try:
+            requests.get(f'{base_url}/api/restaurants/', timeout=5)
+            return
+        except requests.ConnectionError:
+            time.sleep(0.2)
+    raise SystemExit('Server did not start')
+
+
+def _drive(base_url, token, restaurant_ids, args):
+    import requests
+
+    stop = threading.Event()
+    lock = threading.Lock()
+    uploads, browse_ms, errors = [], [], []
+
+    def uploader():
+        session = requests.Session()
+        session.headers['Authorization'] = f'Bearer {token}'
+        while not stop.is_set():
+            body = b'\xff\xd8\xff\xe0' + os.urandom(args.upload_kb * 1024)
+            try:
+                resp = session.post(f'{base_url}/api/owner/upload/', files={'file': ('bench.jpg', body, 'image/jpeg')})
+                ok = resp.status_code == 201
+            except requests.RequestException:
+                ok = False
+            with lock:
+                (uploads if ok else errors).append(1)
+
+    def browser(rng):
+        session = requests.Session()
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                resp = session.get(f'{base_url}/api/restaurants/{rng.choice(restaurant_ids)}/')
+                ok = resp.status_code == 200
+            except requests.RequestException:
+                ok = False
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                if ok:
+                    browse_ms.append(elapsed)
+                else:
+                    errors.append(1)
+
+    threads = [threading.Thread(target=uploader, daemon=True) for _ in range(args.uploaders)]
+    threads += [threading.Thread(target=browser, args=(random.Random(i),), daemon=True) for i in range(args.browsers)]
+    for t in threads:
+        t.start()
+    time.sleep(args.duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    return {
+        'uploads_per_s': len(uploads) / args.duration,
+        'browse_per_s': len(browse_ms) / args.duration,
+        'browse_p50_ms': _percentile(browse_ms, 50),
+        'browse_p95_ms': _percentile(browse_ms, 95),
+        'browse_p99_ms': _percentile(browse_ms, 99),
+        'errors': len(errors),
+    }
+
+
+def run_mode(mode, token, restaurant_ids, args):
+    from benchmarks.storage_standin import StorageStandIn
+
+    port = _free_port()
+    with StorageStandIn(delay=args.delay) as storage:
+        env = {
+            **os.environ,
+            'DEBUG': 'False',
+            'ALLOWED_HOSTS': '127.0.0.1',
+            'ASYNC_VIEWS': str(mode == 'async'),
+            'GUNICORN_THREADS': str(args.threads),
+            'STORAGE_BACKEND': 'core.storage.SupabaseStorage',
+            'SUPABASE_URL': storage.url,
+            'SUPABASE_SERVICE_KEY': 'bench',
+            'STORAGE_ASYNC_MAX_CONNECTIONS': str(max(args.uploaders, 1)),
+        }
+        process = subprocess.Popen(
+            _server_command(mode, port, args.threads), env=env,
+            stdout=subprocess.DEVNULL, stderr=None if args.server_logs else subprocess.DEVNULL,
+        )
+        try:
+            base_url = f'http://127.0.0.1:{port}'
+            _wait_until_up(base_url, process)
+            return _drive(base_url, token, restaurant_ids, args)
+        finally:
+            process.terminate()
+            process.wait(timeout=STARTUP_TIMEOUT)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--uploaders', type=int, default=32, help='Concurrent upload clients')
+    parser.add_argument('--browsers', type=int, default=4, help='Concurrent public-read clients')
+    parser.add_argument('--delay', type=float, default=0.5, help='Storage stand-in latency per upload, seconds')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds of load per mode')
+    parser.add_argument('--threads', type=int, default=8, help='gunicorn threads for the sync server')
+    parser.add_argument('--upload-kb', type=int, default=64)
+    parser.add_argument('--only', choices=MODES, help='Run one mode')
+    parser.add_argument('--server-logs', action='store_true', help="Show the servers' stderr")
+    args = parser.parse_args()
+
+    token, restaurant_ids = _seed_fixtures()
+    print(f'{args.uploaders} uploaders ({args.upload_kb} KB, storage delay {args.delay}s), '
+          f'{args.browsers} browsers, {args.duration:.0f}s per mode; sync server has {args.threads} threads\n')
+    print(f'{"mode":<8}{"uploads/s":>11}{"reads/s":>10}{"read p50":>10}{"read p95":>10}{"read p99":>10}{"errors":>8}')
+    for mode in (args.only,) if args.only else MODES:
+        r = run_mode(mode, token, restaurant_ids, args)
+        print(f'{mode:<8}{r["uploads_per_s"]:>11.1f}{r["browse_per_s"]:>10.1f}{r["browse_p50_ms"]:>8.1f}ms'
+              f'{r["browse_p95_ms"]:>8.1f}ms{r["browse_p99_ms"]:>8.1f}ms{r["errors"]:>8}')
+
+
+if __name__ == '__main__':
+    main()
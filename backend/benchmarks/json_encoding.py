@@ -0,0 +1,132 @@
+"""
+Encode time and bytes on the wire for representative API payloads.
+
+Compares rest_framework's JSONRenderer (stdlib json) with
+core.renderers.FastJSONRenderer (orjson), then the encoded size raw, gzipped
+(as core.middleware.CompressionMiddleware sends it) and brotli-compressed.
+Payloads are shaped like the serializer output of the restaurant list, admin
+owner application list and superadmin user list endpoints.
+
+    cd backend
+    python -m benchmarks.json_encoding --items 100 --repeat 200
+"""
+import argparse
+import datetime
+import decimal
+import random
+import timeit
+
+
+def _configure_django():
+    import django
+    from django.conf import settings
+    if not settings.configured:
+        settings.configure()
+    django.setup()
+
+
+def restaurant_page(n):
+    cities = ['Pune', 'Mumbai', 'Bengaluru', 'Chennai', 'Hyderabad']
+    return {
+        'next': 'https://api.example.com/api/restaurants/?cursor=eyJwIjogWyJDYWZlIiwgNDJdLCAiciI6IDF9',
+        'previous': None,
+        'results': [
+            {
+                'id': i,
+                'name': f'Restaurant {i} — Café',
+                'address': f'{i} Market Road, Near Clock Tower',
+                'city': random.choice(cities),
+                'google_maps_link': f'https://maps.google.com/?q=restaurant+{i}',
+                'latitude': f'{18 + random.random():.6f}',
+                'longitude': f'{73 + random.random():.6f}',
+                'operating_hours': '10:00-22:00',
+                'phone': '+91 98765 43210',
+                'cover_photo_url': f'https://ref.supabase.co/storage/v1/object/public/media/image/{i:064x}.image',
+                'photo_count': random.randint(0, 12),
+                'distance_km': round(random.random() * 10, 3),
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def application_list(n):
+    now = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+    return [
+        {
+            'id': i,
+            'user': i + 1000,
+            'user_email': f'owner{i}@example.com',
+            'user_name': f'Owner {i}',
+            'restaurant_name': f'Restaurant {i}',
+            'city': 'Pune',
+            'status': random.choice(['PENDING', 'APPROVED', 'REJECTED']),
+            # Native types, as they reach the renderer from non-serializer code paths
+            'submitted_at': now - datetime.timedelta(minutes=i),
+            'reviewed_at': None,
+            'score': decimal.Decimal('4.50'),
+        }
+        for i in range(n)
+    ]
+
+
+def user_list(n):
+    return [
+        {
+            'id': i,
+            'name': f'User {i}',
+            'email': f'user{i}@example.com',
+            'phone': '',
+            'role': 'USER',
+            'is_active': True,
+            'created_at': f'2026-01-01T00:{i % 60:02d}:00.000000Z',
+        }
+        for i in range(n)
+    ]
+
+
+PAYLOADS = {
+    'restaurants': restaurant_page,
+    'applications': application_list,
+    'users': user_list,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=100, help='objects per payload')
+    parser.add_argument('--repeat', type=int, default=200, help='encodes per timing')
+    args = parser.parse_args()
+
+    _configure_django()
+    from django.utils.text import compress_string
+    from rest_framework.renderers import JSONRenderer
+    from core.middleware import BROTLI_QUALITY
+    from core.renderers import FastJSONRenderer, orjson
+
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+
+    if orjson is None:
+        print('orjson is not installed: FastJSONRenderer falls back to stdlib json.\n')
+    random.seed(1)
+    print(f'{"payload":<14}{"stdlib us":>11}{"orjson us":>11}{"speedup":>9}{"raw B":>9}{"gzip B":>9}{"br B":>9}')
+    for name, build in PAYLOADS.items():
+        data = build(args.items)
+        stdlib, fast = JSONRenderer(), FastJSONRenderer()
+        assert stdlib.render(data) == fast.render(data), f'{name}: renderers disagree'
+        slow_us = timeit.timeit(lambda: stdlib.render(data), number=args.repeat) / args.repeat * 1e6
+        fast_us = timeit.timeit(lambda: fast.render(data), number=args.repeat) / args.repeat * 1e6
+        body = fast.render(data)
+        gzipped = len(compress_string(body))
+        brotlied = len(brotli.compress(body, quality=BROTLI_QUALITY)) if brotli else '-'
+        print(
+            f'{name:<14}{slow_us:>11.1f}{fast_us:>11.1f}{slow_us / fast_us:>8.1f}x'
+            f'{len(body):>9}{gzipped:>9}{brotlied:>9}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Local HTTP stand-in for Supabase Storage, for benchmarks.
+
+Accepts POST/PUT/DELETE under /storage/v1/object/..., drains the request body
+in small chunks without keeping it, and answers like Supabase does. `delay`
+adds a fixed per-request latency to imitate a slow storage round-trip.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DRAIN_CHUNK_SIZE = 64 * 1024
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: 'StorageStandIn'  # pyright: ignore[reportIncompatibleVariableOverride]
+
+    def log_message(self, format, *args):
+        pass
+
+    def _drain_body(self):
+        received = 0
+        if self.headers.get('Transfer-Encoding', '').lower() == 'chunked':
+            while True:
+                size = int(self.rfile.readline().split(b';')[0], 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                received += len(self.rfile.read(size))
+                self.rfile.readline()
+            return received
+        remaining = int(self.headers.get('Content-Length') or 0)
+        while remaining:
+            chunk = self.rfile.read(min(remaining, DRAIN_CHUNK_SIZE))
+            if not chunk:
+                break
+            received += len(chunk)
+            remaining -= len(chunk)
+        return received
+
+    def _respond(self, payload, status=200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        received = self._drain_body()
+        self.server.record(received)
+        if self.server.delay:
+            time.sleep(self.server.delay)
+        self._respond({'Key': self.path.split('/storage/v1/object/', 1)[-1]})
+
+    do_PUT = do_POST
+
+    def do_DELETE(self):
+        self._drain_body()
+        self._respond({'message': 'Successfully deleted'})
+
+
+class StorageStandIn(ThreadingHTTPServer):
+    """Run with `with StorageStandIn() as server:`; server.url is the SUPABASE_URL to use."""
+    daemon_threads = True
+
+    def __init__(self, delay=0.0, host='127.0.0.1', port=0):
+        super().__init__((host, port), _Handler)
+        self.delay = delay
+        self.requests = 0
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def record(self, received):
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += received
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,106 @@
+"""
+Peak RSS per concurrent upload: buffered (file.read()) vs streamed (ChunkedFileReader).
+
+Each mode runs in a fresh subprocess that creates N temporary uploaded files
+(what Django's multipart parser hands FileUploadView for bodies over
+FILE_UPLOAD_MAX_MEMORY_SIZE) and sends them concurrently to a local storage
+stand-in. The peak RSS growth over the post-setup baseline is divided by N.
+
+    cd backend
+    python -m benchmarks.upload_memory --concurrency 8 --size-mb 20
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+
+MODES = ('buffered', 'streamed')
+
+
+def _peak_rss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _configure_django():
+    import django
+    from django.conf import settings
+    if not settings.configured:
+        settings.configure()
+    django.setup()
+
+
+def _run_worker(mode, concurrency, size_mb, storage_url):
+    _configure_django()
+    import requests
+    from django.core.files.uploadedfile import TemporaryUploadedFile
+    from core.storage import ChunkedFileReader
+
+    block = os.urandom(1024 * 1024)
+    files = []
+    for i in range(concurrency):
+        f = TemporaryUploadedFile(f'bench_{i}.pdf', 'application/pdf', size_mb * len(block), None)
+        for _ in range(size_mb):
+            f.write(block)
+        f.flush()
+        files.append(f)
+    del block
+
+    session_url = f'{storage_url}/storage/v1/object/media/pdf/'
+    errors = []
+    barrier = threading.Barrier(concurrency)
+
+    def upload(f):
+        barrier.wait()
+        f.seek(0)
+        data = f.read() if mode == 'buffered' else ChunkedFileReader(f)
+        resp = requests.post(session_url + f.name, data=data, headers={'Content-Type': 'application/pdf'})
+        if resp.status_code != 200:
+            errors.append(resp.status_code)
+
+    baseline = _peak_rss_kb()
+    threads = [threading.Thread(target=upload, args=(f,)) for f in files]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    peak = _peak_rss_kb()
+    for f in files:
+        f.close()
+    print(json.dumps({'baseline_kb': baseline, 'peak_kb': peak, 'errors': len(errors)}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--size-mb', type=int, default=20)
+    parser.add_argument('--worker', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--storage-url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _run_worker(args.worker, args.concurrency, args.size_mb, args.storage_url)
+        return
+
+    from benchmarks.storage_standin import StorageStandIn
+
+    print(f'{args.concurrency} concurrent uploads of {args.size_mb} MB')
+    print(f'{"mode":<10} {"peak RSS growth":>16} {"per upload":>12}')
+    with StorageStandIn() as server:
+        for mode in MODES:
+            out = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.upload_memory', '--worker', mode,
+                 '--concurrency', str(args.concurrency), '--size-mb', str(args.size_mb),
+                 '--storage-url', server.url],
+                capture_output=True, text=True, check=True,
+            )
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            growth_mb = (result['peak_kb'] - result['baseline_kb']) / 1024
+            print(f'{mode:<10} {growth_mb:>13.1f} MB {growth_mb / args.concurrency:>9.2f} MB'
+                  + (f'  ({result["errors"]} failed)' if result['errors'] else ''))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@
 Django settings for restaurant owner verification system.
 """
 import os
+import sys
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -27,6 +28,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework_simplejwt',
     'corsheaders',
@@ -35,11 +37,15 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.MetricsMiddleware',
+    'core.middleware.SQLInstrumentationMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'core.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -64,21 +70,63 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
-# Database: Supabase Postgres (DATABASE_URL required)
+# Serve the upload and public restaurant endpoints with async views (core.views.async_views);
+# only useful under ASGI (gunicorn -k uvicorn_worker.UvicornWorker config.asgi:application)
+ASYNC_VIEWS = os.environ.get('ASYNC_VIEWS', 'False').lower() == 'true'
+
+# Database: Supabase Postgres (DATABASE_URL required). For local development and
+# benchmarks a sqlite:///path URL or a local Postgres with DATABASE_SSL_REQUIRE=False works too.
 _db_url = os.environ.get('DATABASE_URL')
 if not _db_url:
     raise ImproperlyConfigured(
         'DATABASE_URL environment variable is required. '
         'Please set it in your .env file or environment.'
     )
-DATABASES = {
-    'default': dj_database_url.parse(
-        _db_url,
-        conn_max_age=600,
-        ssl_require=True,
+
+
+def _database(url):
+    config = dj_database_url.parse(
+        url,
+        # Under ASGI each request's queries run on a new thread, so per-thread connections are never reused
+        conn_max_age=int(os.environ.get('DATABASE_CONN_MAX_AGE', '0' if ASYNC_VIEWS else '600')),
+        conn_health_checks=True,
     )
-}
+    if config.get('ENGINE') != 'django.db.backends.postgresql':
+        return config
+    options = config.setdefault('OPTIONS', {})
+    if os.environ.get('DATABASE_SSL_REQUIRE', 'True').lower() == 'true':
+        options['sslmode'] = 'require'
+    # Transaction-mode poolers (pgbouncer, the Supabase pooler on port 6543) can run each
+    # transaction on a different server connection, so nothing may outlive a transaction:
+    # no server-side cursors. (Prepared statements are already off: Django's psycopg 3
+    # backend, which the pool backend inherits from, defaults prepare_threshold to None.)
+    pgbouncer_default = 'True' if str(config.get('PORT')) == '6543' else 'False'
+    if os.environ.get('DATABASE_PGBOUNCER', pgbouncer_default).lower() == 'true':
+        config['DISABLE_SERVER_SIDE_CURSORS'] = True
+    # In-process pool shared by a worker's threads (core.backends.postgresql_pool)
+    pool_max_size = int(os.environ.get('DATABASE_POOL_MAX_SIZE', '0'))
+    if pool_max_size:
+        config['ENGINE'] = 'core.backends.postgresql_pool'
+        config['CONN_MAX_AGE'] = 0
+        options['pool'] = {
+            'min_size': int(os.environ.get('DATABASE_POOL_MIN_SIZE', '1')),
+            'max_size': pool_max_size,
+            'max_lifetime': float(os.environ.get('DATABASE_POOL_MAX_LIFETIME', '1800')),
+            'timeout': float(os.environ.get('DATABASE_POOL_TIMEOUT', '10')),
+        }
+    return config
+
 
+DATABASES = {'default': _database(_db_url)}
+# Optional comma-separated read replica URLs. Safe-method requests to read-only
+# views read from a replica (core.db_router), except for users who wrote something
+# within DATABASE_REPLICA_PIN_SECONDS.
+DATABASE_REPLICAS = []
+for _i, _url in enumerate(filter(None, os.environ.get('DATABASE_REPLICA_URLS', '').split(',')), start=1):
+    DATABASES[f'replica{_i}'] = {**_database(_url.strip()), 'TEST': {'MIRROR': 'default'}}
+    DATABASE_REPLICAS.append(f'replica{_i}')
+DATABASE_ROUTERS = ['core.db_router.ReplicaRouter']
+DATABASE_REPLICA_PIN_SECONDS = int(os.environ.get('DATABASE_REPLICA_PIN_SECONDS', '10'))
 
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -98,11 +146,57 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = os.environ.get('MEDIA_URL', 'media/')
 MEDIA_ROOT = BASE_DIR / 'media'
 
-# Supabase storage configuration (used by file upload view)
+# Supabase storage configuration (used by core.storage.SupabaseStorage)
 SUPABASE_URL = os.environ.get('SUPABASE_URL')  # e.g. https://your-project-ref.supabase.co
 SUPABASE_SERVICE_KEY = os.environ.get('SUPABASE_SERVICE_KEY')
 SUPABASE_MEDIA_BUCKET = os.environ.get('SUPABASE_MEDIA_BUCKET', 'media')
 
+# Upload storage backend: core.storage.SupabaseStorage or core.storage.LocalStorage
+# (MEDIA_ROOT, served under STORAGE_PUBLIC_BASE_URL + MEDIA_URL when DEBUG)
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'core.storage.SupabaseStorage')
+STORAGE_PUBLIC_BASE_URL = os.environ.get('STORAGE_PUBLIC_BASE_URL', 'http://127.0.0.1:8000/')
+# Batch uploads: files per request, and threads per worker process moving them to storage
+MAX_BATCH_UPLOAD_FILES = int(os.environ.get('MAX_BATCH_UPLOAD_FILES', '10'))
+STORAGE_UPLOAD_WORKERS = int(os.environ.get('STORAGE_UPLOAD_WORKERS', '4'))
+
+# Storage HTTP client (core.storage): one keep-alive pool per worker process,
+# sized to the worker's request threads plus its upload threads
+# (keep GUNICORN_THREADS in sync with --threads)
+GUNICORN_THREADS = int(os.environ.get('GUNICORN_THREADS', '2'))
+STORAGE_POOL_SIZE = int(os.environ.get('STORAGE_POOL_SIZE', GUNICORN_THREADS + STORAGE_UPLOAD_WORKERS))
+STORAGE_CONNECT_TIMEOUT = float(os.environ.get('STORAGE_CONNECT_TIMEOUT', '5'))
+STORAGE_READ_TIMEOUT = float(os.environ.get('STORAGE_READ_TIMEOUT', '60'))
+# Async views share one httpx pool per event loop; this caps its concurrent storage connections
+STORAGE_ASYNC_MAX_CONNECTIONS = int(os.environ.get('STORAGE_ASYNC_MAX_CONNECTIONS', '100'))
+# Retries apply to idempotent calls only (not the upload POST)
+STORAGE_MAX_RETRIES = int(os.environ.get('STORAGE_MAX_RETRIES', '3'))
+STORAGE_RETRY_BACKOFF = float(os.environ.get('STORAGE_RETRY_BACKOFF', '0.3'))
+
+# Background jobs (core.jobs, `manage.py run_jobs`)
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', '4'))
+JOB_LEASE_SECONDS = int(os.environ.get('JOB_LEASE_SECONDS', '300'))
+JOB_RETRY_BASE_SECONDS = int(os.environ.get('JOB_RETRY_BASE_SECONDS', '30'))
+
+# Cache: locmem by default (dev/tests). Set REDIS_URL in production so every
+# gunicorn worker sees the same restaurant version counters (core.cache).
+_redis_url = os.environ.get('REDIS_URL')
+if _redis_url:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': _redis_url,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+# Public restaurant list/detail payload cache (core.cache)
+RESTAURANT_CACHE_ALIAS = os.environ.get('RESTAURANT_CACHE_ALIAS', 'default')
+RESTAURANT_CACHE_TIMEOUT = int(os.environ.get('RESTAURANT_CACHE_TIMEOUT', '60'))
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'core.User'
@@ -114,18 +208,65 @@ CORS_ALLOWED_ORIGINS = [
     ).split(',') if x.strip()
 ]
 CORS_ALLOW_CREDENTIALS = True
+CORS_EXPOSE_HEADERS = ['ETag']
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'core.authentication.ClaimsJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # orjson-backed when installed (core.renderers), stdlib json otherwise
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+}
+
+# core.instrumentation: a query shape repeated this often in one request is logged as a
+# suspected N+1; SQL_N_PLUS_ONE_RAISE=True turns that into an error, the default under
+# `manage.py test` so an N+1 in any view fails the suite
+SQL_N_PLUS_ONE_THRESHOLD = int(os.environ.get('SQL_N_PLUS_ONE_THRESHOLD', '5'))
+TESTING = sys.argv[1:2] == ['test']
+SQL_N_PLUS_ONE_RAISE = os.environ.get('SQL_N_PLUS_ONE_RAISE', str(TESTING)).lower() == 'true'
+
+# Bearer token Prometheus sends to /metrics/; the endpoint refuses every request while unset
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        # core.sql logs one summary line per request at DEBUG (CORE_LOG_LEVEL=DEBUG to see them)
+        # and suspected N+1 queries at WARNING
+        'core': {'handlers': ['console'], 'level': os.environ.get('CORE_LOG_LEVEL', 'WARNING')},
+    },
 }
 
+# core.middleware.CompressionMiddleware: responses below this many bytes are sent uncompressed
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', '1024'))
+
+# Cursor-paginated list endpoints (core.pagination); ?page_size= is capped at the max
+API_PAGE_SIZE = int(os.environ.get('API_PAGE_SIZE', '20'))
+API_MAX_PAGE_SIZE = int(os.environ.get('API_MAX_PAGE_SIZE', '100'))
+
+# How long an admin's claim on an owner application lasts before others may take it (core.views.admin_views)
+REVIEW_CLAIM_SECONDS = int(os.environ.get('REVIEW_CLAIM_SECONDS', '900'))
+
 from datetime import timedelta
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=24),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
 }
+# Seconds a user's token version is cached; bounds how long a revoked access token
+# keeps working in processes that don't share the cache (core.authentication)
+AUTH_TOKEN_VERSION_TTL = int(os.environ.get('AUTH_TOKEN_VERSION_TTL', '30'))
@@ -10,6 +10,7 @@ urlpatterns = [
     path('api/admin/', include('core.urls.admin_applications')),
     path('api/restaurants/', include('core.urls.restaurants')),
     path('api/superadmin/', include('core.urls.superadmin')),
+    path('metrics/', include('core.urls.metrics')),
 ]
 
 if settings.DEBUG:
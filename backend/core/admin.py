@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from .models import User, OwnerApplication, Restaurant, RestaurantPhoto
+from .models import User, OwnerApplication, Restaurant, RestaurantPhoto, UploadedObject, BackgroundJob
 
 
 @admin.register(User)
@@ -25,6 +25,7 @@ class UserAdmin(BaseUserAdmin):
 class OwnerApplicationAdmin(admin.ModelAdmin):
     list_display = ('restaurant_name', 'user', 'status', 'submitted_at', 'reviewed_at')
     list_filter = ('status',)
+    list_select_related = ('user',)
     search_fields = ('restaurant_name', 'user__email')
     readonly_fields = ('submitted_at',)
 
@@ -38,4 +39,20 @@ class RestaurantPhotoInline(admin.TabularInline):
 class RestaurantAdmin(admin.ModelAdmin):
     list_display = ('name', 'owner', 'city', 'status', 'created_at')
     list_filter = ('status',)
+    list_select_related = ('owner',)
     inlines = [RestaurantPhotoInline]
+
+
+@admin.register(UploadedObject)
+class UploadedObjectAdmin(admin.ModelAdmin):
+    list_display = ('object_path', 'backend', 'size', 'content_type', 'created_at')
+    list_filter = ('backend', 'content_type')
+    search_fields = ('sha256', 'object_path')
+    readonly_fields = ('created_at',)
+
+
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'kind', 'status', 'attempts', 'run_after', 'created_at')
+    list_filter = ('status', 'kind')
+    readonly_fields = ('created_at',)
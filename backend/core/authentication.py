@@ -0,0 +1,92 @@
+"""
+JWT authentication without a user lookup per request.
+
+Tokens issued at login and refresh carry the user's `role`, `is_active` and
+`token_version` as claims (set_user_claims). ClaimsJWTAuthentication builds
+request.user from those claims. The result is a User instance with only id,
+role, is_active and token_version loaded. Other fields load from the database
+on first access, and the instance still works in filters and as a foreign key.
+
+Claims go stale when a user's role or active flag changes. User.save() bumps
+token_version when that happens, and a token whose version no longer matches is
+rejected with 401 code `token_revoked`. The client then refreshes and gets an
+access token with the current claims. The current (token_version, is_active) pair
+is read from the primary, never a replica that may not have the bump yet (see
+core.db_router), and cached for AUTH_TOKEN_VERSION_TTL seconds. A save clears
+the entry once its transaction commits, so with a shared cache (Redis) the
+change applies to the next request. Each process's in-memory cache can lag by at most the TTL.
+
+Tokens without these claims (issued before they existed) are authenticated
+the old way, with a user lookup.
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+User = get_user_model()
+
+VERSION_CLAIM = 'token_version'
+CLAIMS = ('role', 'is_active', VERSION_CLAIM)
+
+
+def set_user_claims(token, user):
+    token['role'] = user.role
+    token['is_active'] = user.is_active
+    token[VERSION_CLAIM] = user.token_version
+    return token
+
+
+def _state_key(user_id):
+    return f'auth:user:{user_id}:token-state'
+
+
+def token_state(user_id):
+    """(token_version, is_active) for the user, cached briefly; None if the user is gone."""
+    key = _state_key(user_id)
+    state = cache.get(key)
+    if state is None:
+        # A lagging replica would accept a revoked token and cache that answer for the TTL
+        state = User.objects.using(DEFAULT_DB_ALIAS).filter(pk=user_id).values_list(VERSION_CLAIM, 'is_active').first()
+        if state is None:
+            return None
+        cache.set(key, state, timeout=getattr(settings, 'AUTH_TOKEN_VERSION_TTL', 30))
+    return state
+
+
+def forget_token_state(user_id):
+    cache.delete(_state_key(user_id))
+
+
+def forget_token_states(user_ids):
+    """forget_token_state() for many users in one cache call, e.g. after a bulk update that skips save()."""
+    cache.delete_many([_state_key(user_id) for user_id in user_ids])
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if any(claim not in validated_token for claim in (api_settings.USER_ID_CLAIM, *CLAIMS)):
+            return super().get_user(validated_token)
+
+        # The claim is serialized as a string; request.user.pk must have the field's own type
+        try:
+            user_id = User._meta.pk.to_python(validated_token[api_settings.USER_ID_CLAIM])
+        except ValidationError:
+            raise AuthenticationFailed(_('Token contained no recognizable user identification'), code='invalid_token')
+        state = token_state(user_id)
+        if state is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+        version, is_active = state
+        if not is_active or not validated_token['is_active']:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        if validated_token[VERSION_CLAIM] != version:
+            raise AuthenticationFailed(_('Token has been revoked; refresh it.'), code='token_revoked')
+
+        loaded = {'id': user_id, 'role': validated_token['role'], 'is_active': True, VERSION_CLAIM: version}
+        names = [f.attname for f in User._meta.concrete_fields if f.attname in loaded]
+        return User.from_db(DEFAULT_DB_ALIAS, names, [loaded[name] for name in names])
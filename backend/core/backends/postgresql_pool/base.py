@@ -0,0 +1,84 @@
+"""
+PostgreSQL backend that takes connections from a psycopg_pool.ConnectionPool.
+
+Django 4.2 only has persistent per-thread connections (CONN_MAX_AGE). This
+is a backport of the connection pool Django 5.1 adds through OPTIONS['pool'],
+configured the same way:
+
+    'ENGINE': 'core.backends.postgresql_pool',
+    'CONN_MAX_AGE': 0,
+    'CONN_HEALTH_CHECKS': True,   # pool checks a connection before handing it out
+    'OPTIONS': {'pool': {'min_size': 1, 'max_size': 4, 'max_lifetime': 1800, 'timeout': 10}},
+
+The pool options go straight to ConnectionPool. There is one pool per database
+alias per process, and all of the process's threads share it. Django still
+"closes" its connection at the end of every request (CONN_MAX_AGE must be 0),
+which returns it to the pool. settings._database() builds this configuration
+from the DATABASE_POOL_* variables.
+"""
+from django.core.exceptions import ImproperlyConfigured
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base
+
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError:  # optional; only needed when this engine is configured
+    ConnectionPool = None
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    _connection_pools = {}
+
+    @property
+    def pool(self):
+        if self.alias not in self._connection_pools:
+            if ConnectionPool is None:
+                raise ImproperlyConfigured('Connection pooling needs psycopg_pool: pip install "psycopg[pool]".')
+            if self.settings_dict['CONN_MAX_AGE'] != 0:
+                raise ImproperlyConfigured('Pooled connections need CONN_MAX_AGE = 0.')
+            connect_kwargs = self.get_connection_params()
+            # Pooled connections idle in autocommit; Django sets the mode it wants on checkout.
+            connect_kwargs['autocommit'] = True
+            pool = ConnectionPool(
+                kwargs=connect_kwargs,
+                open=False,
+                check=ConnectionPool.check_connection if self.settings_dict['CONN_HEALTH_CHECKS'] else None,
+                name=self.alias,
+                **self.settings_dict['OPTIONS'].get('pool', {}),
+            )
+            # Threads racing here each build a pool; unopened ones cost nothing and the first one wins.
+            self._connection_pools.setdefault(self.alias, pool)
+        return self._connection_pools[self.alias]
+
+    def get_connection_params(self):
+        params = super().get_connection_params()
+        params.pop('pool', None)
+        return params
+
+    def get_new_connection(self, conn_params):
+        if self.alias == NO_DB_ALIAS:
+            # Short-lived maintenance connection to the `postgres` database (e.g. creating test DBs)
+            return super().get_new_connection(conn_params)
+        pool = self.pool
+        pool.open()  # no-op once open
+        connection = pool.getconn()
+        isolation_level = self.settings_dict['OPTIONS'].get('isolation_level')
+        self.isolation_level = base.IsolationLevel(isolation_level or base.IsolationLevel.READ_COMMITTED)
+        if isolation_level is not None:
+            connection.isolation_level = self.isolation_level
+        return connection
+
+    def _close(self):
+        if self.alias == NO_DB_ALIAS:
+            return super()._close()
+        if self.connection is not None:
+            # wrap_database_errors is a Django cached_property, which pyright can't see through
+            with self.wrap_database_errors:  # pyright: ignore[reportGeneralTypeIssues]
+                self.pool.putconn(self.connection)
+            # The pool may hand it to another thread now, even if close() ran inside atomic()
+            self.connection = None
+
+    def close_pool(self):
+        pool = self._connection_pools.pop(self.alias, None)
+        if pool is not None:
+            pool.close()
@@ -0,0 +1,170 @@
+"""
+Versioned cache for public restaurant payloads.
+
+Cached list/detail payloads are keyed by a version counter plus the request's
+query string. Writes never delete cached entries: they bump the counters
+(see core.signals), so the next read misses and rebuilds. Stale entries are
+never read again and expire through the normal cache timeout.
+
+- list payloads use the global counter (any restaurant/photo change bumps it)
+- detail payloads use the per-restaurant counter
+
+Each entry holds the payload with its ETag/Last-Modified (core.conditional), so
+a cache hit, whether answered 200 or 304, runs no query. A list miss runs only
+the page query: its validators are read off the rows served.
+
+The a-prefixed variants are for async views.
+"""
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import status
+from rest_framework.response import Response
+
+from .conditional import aconditional_response, conditional_response
+
+GLOBAL_VERSION_KEY = 'restaurants:version'
+
+
+def _cache():
+    return caches[getattr(settings, 'RESTAURANT_CACHE_ALIAS', 'default')]
+
+
+def _restaurant_version_key(restaurant_id):
+    return f'restaurants:{restaurant_id}:version'
+
+
+def _get_version(key):
+    cache = _cache()
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, 1, timeout=None)
+        version = cache.get(key, 1)
+    return version
+
+
+async def _aget_version(key):
+    cache = _cache()
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, 1, timeout=None)
+        version = await cache.aget(key, 1)
+    return version
+
+
+def _bump(key):
+    cache = _cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Missing counter: start above any value a concurrent reader may have seen.
+        cache.add(key, 2, timeout=None)
+
+
+def bump_restaurant_version(restaurant_id):
+    """Invalidate cached payloads that include this restaurant."""
+    _bump(_restaurant_version_key(restaurant_id))
+    _bump(GLOBAL_VERSION_KEY)
+
+
+def bump_restaurant_list_version():
+    """Invalidate every cached list payload, e.g. after bulk writes that send no signals."""
+    _bump(GLOBAL_VERSION_KEY)
+
+
+def _query_key(request):
+    params = sorted((k, v) for k, values in request.query_params.lists() for v in values)
+    raw = f'{request.get_host()}{request.path}?{urlencode(params)}'
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def list_cache_key(request):
+    return f'restaurants:list:v{_get_version(GLOBAL_VERSION_KEY)}:{_query_key(request)}'
+
+
+async def alist_cache_key(request):
+    return f'restaurants:list:v{await _aget_version(GLOBAL_VERSION_KEY)}:{_query_key(request)}'
+
+
+def detail_cache_key(request, restaurant_id):
+    version = _get_version(_restaurant_version_key(restaurant_id))
+    return f'restaurants:{restaurant_id}:detail:v{version}:{_query_key(request)}'
+
+
+async def adetail_cache_key(request, restaurant_id):
+    version = await _aget_version(_restaurant_version_key(restaurant_id))
+    return f'restaurants:{restaurant_id}:detail:v{version}:{_query_key(request)}'
+
+
+def _timeout():
+    return getattr(settings, 'RESTAURANT_CACHE_TIMEOUT', 60)
+
+
+def _cached(request, entry):
+    etag, last_modified, data = entry
+    return conditional_response(request, etag, last_modified, lambda: Response(data))
+
+
+def cached_conditional_response(request, key, validators, build):
+    """
+    conditional_response() over a cached payload. The payload is cached with its
+    ETag/Last-Modified, so a hit answers 200 or 304 without touching the
+    database; on a miss validators() and build() run and a 200 is cached.
+    """
+    cache = _cache()
+    entry = cache.get(key)
+    if entry is not None:
+        return _cached(request, entry)
+    etag, last_modified = validators()
+    response = conditional_response(request, etag, last_modified, build)
+    # Only a built response is a 200; 304/412 carry no payload
+    if isinstance(response, Response) and response.status_code == status.HTTP_200_OK:
+        cache.set(key, (etag, last_modified, response.data), timeout=_timeout())
+    return response
+
+
+async def acached_conditional_response(request, key, validators, build):
+    """cached_conditional_response() with async validators() and build()."""
+    cache = _cache()
+    entry = await cache.aget(key)
+    if entry is not None:
+        return _cached(request, entry)
+    etag, last_modified = await validators()
+    response = await aconditional_response(request, etag, last_modified, build)
+    if isinstance(response, Response) and response.status_code == status.HTTP_200_OK:
+        await cache.aset(key, (etag, last_modified, response.data), timeout=_timeout())
+    return response
+
+
+def cached_page_response(request, key, build, validators):
+    """
+    cached_conditional_response() for a list page, whose validators describe
+    the rows served (conditional.page_validators): on a miss build() fetches
+    and serializes the page, then validators() reads the fetched rows.
+    """
+    cache = _cache()
+    entry = cache.get(key)
+    if entry is not None:
+        return _cached(request, entry)
+    response = build()
+    if response.status_code != status.HTTP_200_OK:
+        return response
+    etag, last_modified = validators()
+    cache.set(key, (etag, last_modified, response.data), timeout=_timeout())
+    return conditional_response(request, etag, last_modified, lambda: response)
+
+
+async def acached_page_response(request, key, build, validators):
+    """cached_page_response() with an async build()."""
+    cache = _cache()
+    entry = await cache.aget(key)
+    if entry is not None:
+        return _cached(request, entry)
+    response = await build()
+    if response.status_code != status.HTTP_200_OK:
+        return response
+    etag, last_modified = validators()
+    await cache.aset(key, (etag, last_modified, response.data), timeout=_timeout())
+    return conditional_response(request, etag, last_modified, lambda: response)
@@ -0,0 +1,81 @@
+"""
+ETag / Last-Modified support for the public restaurant endpoints.
+
+Validators come from `updated_at` (photos touch their restaurant's updated_at,
+see core.signals). A detail's come from one indexed lookup, so a matching
+If-None-Match or If-Modified-Since is answered with 304 before anything is
+serialized. A list's come from the page actually served (its ids, updated_at
+and whether there are pages either side), so they cost no query beyond the page
+itself; an aggregate over the whole filtered set would scan the catalog on
+every search, near query and cursor. Cached payloads keep their validators
+(core.cache), so a cache hit runs no query at all.
+The a-prefixed variants are for async views.
+"""
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+
+
+def _etag(*parts):
+    return quote_etag(hashlib.sha1('|'.join(str(p) for p in parts).encode()).hexdigest())
+
+
+def page_validators(request, rows, *state):
+    """
+    (etag, last_modified) for a page of `rows` that has been fetched; `state`
+    is anything else that shapes the response, e.g. whether there is a next page.
+    """
+    last = max((row.updated_at for row in rows), default=None)
+    parts = [f'{row.pk}@{row.updated_at.isoformat()}' for row in rows]
+    return _etag(request.get_full_path(), *state, *parts), last
+
+
+def _detail_etag(request, last):
+    if last is None:
+        return None, None
+    return _etag(last.isoformat(), request.get_full_path()), last
+
+
+def detail_validators(request, queryset):
+    """(etag, last_modified) for a single object, or (None, None) if it isn't in `queryset`."""
+    return _detail_etag(request, queryset.values_list('updated_at', flat=True).first())
+
+
+async def adetail_validators(request, queryset):
+    return _detail_etag(request, await queryset.values_list('updated_at', flat=True).afirst())
+
+
+def _set_validators(response, etag, timestamp):
+    # A 304 carries the validators a 200 would, so caches can refresh their stored copy
+    if etag is not None and response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+        response['ETag'] = etag
+        if timestamp is not None:
+            response['Last-Modified'] = http_date(timestamp)
+    return response
+
+
+def _not_modified(request, etag, timestamp):
+    if etag is None:
+        return None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    return response if response is None else _set_validators(response, etag, timestamp)
+
+
+def conditional_response(request, etag, last_modified, build):
+    """304 when the client's validators match; otherwise build() with ETag/Last-Modified set."""
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    not_modified = _not_modified(request, etag, timestamp)
+    if not_modified is not None:
+        return not_modified
+    return _set_validators(build(), etag, timestamp)
+
+
+async def aconditional_response(request, etag, last_modified, build):
+    """conditional_response() with an async build()."""
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    not_modified = _not_modified(request, etag, timestamp)
+    if not_modified is not None:
+        return not_modified
+    return _set_validators(await build(), etag, timestamp)
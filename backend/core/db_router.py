@@ -0,0 +1,92 @@
+"""
+Read-replica routing.
+
+Replicas come from DATABASE_REPLICA_URLS (settings.DATABASE_REPLICAS lists
+their aliases). core.middleware.ReplicaRoutingMiddleware opens a ReadRouting
+for GET/HEAD/OPTIONS requests to read-only views, meaning views with no
+post/put/patch/delete handler. While it is open, ReplicaRouter sends reads to
+one replica chosen for the request. Everything else reads from and writes to
+`default`. That covers management commands, the job worker and views like
+MyRestaurantView that can also write.
+
+Read-your-writes: a successful write request pins its user to the primary for
+DATABASE_REPLICA_PIN_SECONDS. This covers, for example, an owner who PATCHes
+their restaurant and then opens its public page. The pin is kept in the
+default cache. Without a shared cache (REDIS_URL) it only holds within the
+gunicorn worker that served the write.
+
+Replication lag can still leak into the public response cache (core.cache). A
+list read from a lagging replica right after a version bump is cached for up to
+RESTAURANT_CACHE_TIMEOUT seconds.
+"""
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.functional import SimpleLazyObject
+
+_routing: ContextVar['ReadRouting | None'] = ContextVar('read_routing', default=None)
+
+WRITE_METHODS = ('post', 'put', 'patch', 'delete')
+
+
+def replicas():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def is_read_only_view(view_func):
+    view_class = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+    return view_class is not None and not any(hasattr(view_class, method) for method in WRITE_METHODS)
+
+
+def _pin_key(user_id):
+    return f'db:primary-pin:{user_id}'
+
+
+def pin_to_primary(user_id):
+    cache.set(_pin_key(user_id), True, timeout=getattr(settings, 'DATABASE_REPLICA_PIN_SECONDS', 10))
+
+
+class ReadRouting:
+    """Replica choice for one request; falls back to the primary once a pinned user is known."""
+
+    def __init__(self, request):
+        self.request = request
+        self.replica = random.choice(replicas())
+        self.pinned = None
+
+    def database(self):
+        if self.pinned is None:
+            # DRF replaces Django's lazy request.user once it has authenticated the
+            # request. Until then (and for the auth lookup itself) the user is unknown.
+            user = self.request.__dict__.get('user')
+            if user is None or isinstance(user, SimpleLazyObject):
+                return self.replica
+            self.pinned = bool(user.is_authenticated and cache.get(_pin_key(user.pk)))
+        return DEFAULT_DB_ALIAS if self.pinned else self.replica
+
+    def __enter__(self):
+        _routing.set(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        # Not reset(token): under ASGI process_view ran in a thread, with its own copy of the context
+        _routing.set(None)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        routing = _routing.get()
+        return routing.database() if routing is not None else DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        # Explicit: Django would otherwise write an instance back to the database it was read from
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return False if db in replicas() else None
@@ -0,0 +1,183 @@
+"""
+Sparse fieldsets for read endpoints.
+
+    ?fields=id,name     only these fields
+    ?omit=photos        every field except these
+    ?expand=user        embed the related object instead of its id
+
+SparseFieldsetsMixin trims a serializer's fields; expandable relations are
+listed in Meta.expandable_fields as {name: (SerializerClass, kwargs)}. Names
+the serializer doesn't have (or can't expand) are a 400.
+SparseQuerysetMixin does the same for the view's queryset: only() the columns
+the remaining fields read, and keep only the select_related/prefetch_related
+lookups they still need. Both apply to the top-level serializer on GET/HEAD
+requests only, so writes always validate the full field set.
+
+A SerializerMethodField is assumed to read the model field of the same name,
+if there is one. List other columns it reads in Meta.field_sources
+({field name: (model field, ...)}).
+"""
+from typing import cast
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.serializers import BaseSerializer, Serializer
+from rest_framework.utils.serializer_helpers import BindingDict
+
+
+def _param_list(request, name):
+    raw = request.query_params.get(name, '')
+    return [part.strip() for part in raw.split(',') if part.strip()]
+
+
+def _is_sparse_request(request):
+    if request is None or request.method not in SAFE_METHODS:
+        return False
+    return any(request.query_params.get(name) for name in ('fields', 'omit', 'expand'))
+
+
+def _reject_unknown(request, param, known):
+    unknown = [name for name in _param_list(request, param) if name not in known]
+    if unknown:
+        raise ValidationError({param: f'Unknown field(s): {", ".join(unknown)}.'})
+
+
+class SparseFieldsetsMixin(Serializer):
+
+    """Serializer mixin applying ?fields=, ?omit= and ?expand= (see module docstring)."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        self.is_sparse = _is_sparse_request(request)
+        if not self.is_sparse:
+            return
+        # Serializer.fields is a Django cached_property, which pyright can't see through
+        fields = cast(BindingDict, self.fields)
+        expandable = getattr(getattr(self, 'Meta', None), 'expandable_fields', {})
+        _reject_unknown(request, 'fields', fields)
+        _reject_unknown(request, 'omit', fields)
+        _reject_unknown(request, 'expand', [name for name in expandable if name in fields])
+        for name in _param_list(request, 'expand'):
+            serializer_class, options = expandable[name]
+            source = fields[name].source
+            if source != name:
+                options = {**options, 'source': source}
+            fields[name] = serializer_class(read_only=True, **options)
+        keep = set(_param_list(request, 'fields'))
+        if keep:
+            for name in set(fields) - keep:
+                fields.pop(name)
+        for name in _param_list(request, 'omit'):
+            fields.pop(name, None)
+
+
+def _lookup_paths(select_related, prefix=''):
+    """Flatten Query.select_related ({'user': {'profile': {}}}) into 'user__profile' paths."""
+    paths = []
+    for name, children in select_related.items():
+        path = f'{prefix}{name}'
+        paths.append(path)
+        paths.extend(_lookup_paths(children, f'{path}__'))
+    return paths
+
+
+def _model_field(model, name):
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+def _related_columns(model, serializer):
+    """Columns of `model` an embedded serializer reads, or None if it needs the whole row."""
+    names = []
+    for field in serializer.fields.values():
+        model_field = _model_field(model, field.source)
+        if model_field is None or model_field.is_relation:
+            return None
+        names.append(field.source)
+    return names
+
+
+def trim_queryset(queryset, serializer, required=()):
+    """
+    Restrict `queryset` to what `serializer`'s fields read. `required` names
+    extra model fields that must stay loaded (e.g. pagination ordering).
+    Returns the queryset unchanged unless the request asked for a sparse fieldset.
+    """
+    if not getattr(serializer, 'is_sparse', False):
+        return queryset
+    model = queryset.model
+    field_sources = getattr(serializer.Meta, 'field_sources', {})
+    columns = {model._meta.pk.name}
+    embedded, joined, prefetched = set(), set(), set()
+
+    def read(path, nested=None):
+        attrs = path.split('.')
+        model_field = _model_field(model, attrs[0])
+        if model_field is None:
+            return  # property or annotation
+        if model_field.one_to_many or model_field.many_to_many or (model_field.is_relation and not model_field.concrete):
+            prefetched.add(attrs[0])
+        elif model_field.is_relation and nested is not None:
+            related = _related_columns(model_field.related_model, nested)
+            if related is None:
+                embedded.add(attrs[0])
+                columns.add(attrs[0])
+            else:
+                joined.add(attrs[0])
+                columns.update(f'{attrs[0]}__{name}' for name in related)
+        elif model_field.is_relation and len(attrs) > 1:
+            joined.add(attrs[0])
+            columns.add('__'.join(attrs))
+        else:
+            columns.add(attrs[0])
+
+    for name in required:
+        read(name)
+    for name, field in serializer.fields.items():
+        if field.source == '*':
+            for source in field_sources.get(name, (name,)):
+                read(source)
+        else:
+            read(field.source, nested=field if isinstance(field, BaseSerializer) else None)
+
+    # Embedded relations are loaded whole, so deeper select_related paths under them still apply.
+    select = queryset.query.select_related
+    select_related = [
+        path for path in (_lookup_paths(select) if isinstance(select, dict) else [])
+        if path.split('__')[0] in embedded
+    ]
+    select_related += sorted((embedded | joined) - set(select_related))
+    prefetch_related = [
+        lookup for lookup in queryset._prefetch_related_lookups
+        if getattr(lookup, 'prefetch_through', lookup).split('__')[0] in prefetched
+    ]
+    queryset = queryset.select_related(None).prefetch_related(None)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset.only(*columns)
+
+
+class SparseQuerysetMixin(GenericAPIView):
+    """
+    View mixin: trims the queryset in filter_queryset() to the fields requested
+    with ?fields=, ?omit= and ?expand=. The serializer must use
+    SparseFieldsetsMixin. Columns the view orders by for keyset pagination,
+    and those in sparse_required_fields, stay loaded.
+    """
+    sparse_required_fields = ()
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not _is_sparse_request(self.request):
+            return queryset
+        get_keyset_ordering = getattr(self, 'get_keyset_ordering', None)
+        ordering = get_keyset_ordering() if get_keyset_ordering else getattr(self.pagination_class, 'ordering', ())
+        required = [name.lstrip('-') for name in ordering] + list(self.sparse_required_fields)
+        return trim_queryset(queryset, self.get_serializer(), required)
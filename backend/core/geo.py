@@ -0,0 +1,128 @@
+"""
+Geohash helpers for proximity queries on restaurants.
+
+Each restaurant with coordinates stores its geohash (indexed). A "near" query
+covers the search radius' bounding box with a handful of geohash prefixes,
+prefilters on those prefixes (an index range scan per prefix), then computes
+the exact haversine distance only for the rows that survive.
+"""
+import math
+
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.functions import ASin, Cast, Cos, Power, Radians, Sin, Sqrt
+
+EARTH_RADIUS_KM = 6371.0088
+GEOHASH_PRECISION = 9  # ~5m cells; prefixes of it serve every query radius
+GEOHASH_ALPHABET = '0123456789bcdefghjkmnpqrstuvwxyz'
+# Upper bound on prefixes per query; fewer, shorter prefixes scan more rows
+MAX_COVER_CELLS = 16
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    """Standard base32 geohash of a point."""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    latitude, longitude = float(latitude), float(longitude)
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        rng, value = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+    return ''.join(chars)
+
+
+def _cell_size(precision):
+    """(lat_degrees, lng_degrees) covered by one geohash cell."""
+    total_bits = 5 * precision
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lng_bits)
+
+
+def bounding_box(latitude, longitude, radius_km):
+    """(min_lat, max_lat, min_lng, max_lng) enclosing the circle; lng may exceed +/-180."""
+    lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat = max(latitude - lat_delta, -90.0)
+    max_lat = min(latitude + lat_delta, 90.0)
+    cos_lat = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    if cos_lat < 1e-6:
+        return min_lat, max_lat, -180.0, 180.0
+    lng_delta = min(math.degrees(radius_km / (EARTH_RADIUS_KM * cos_lat)), 180.0)
+    return min_lat, max_lat, longitude - lng_delta, longitude + lng_delta
+
+
+def _frange(start, stop, step):
+    value = start
+    while value < stop:
+        yield value
+        value += step
+    yield stop
+
+
+def covering_geohashes(latitude, longitude, radius_km):
+    """Geohash prefixes whose cells together cover the radius' bounding box."""
+    min_lat, max_lat, min_lng, max_lng = bounding_box(latitude, longitude, radius_km)
+    precision = GEOHASH_PRECISION
+    cell_lat, cell_lng = _cell_size(precision)
+    while precision > 1:
+        rows = math.ceil((max_lat - min_lat) / cell_lat) + 1
+        cols = math.ceil((max_lng - min_lng) / cell_lng) + 1
+        if rows * cols <= MAX_COVER_CELLS:
+            break
+        precision -= 1
+        cell_lat, cell_lng = _cell_size(precision)
+    cells = set()
+    for lat in _frange(min_lat, max_lat, cell_lat):
+        for lng in _frange(min_lng, max_lng, cell_lng):
+            wrapped = (lng + 180.0) % 360.0 - 180.0
+            cells.add(encode_geohash(min(lat, 90.0), wrapped, precision))
+    return sorted(cells)
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Great-circle distance in km between two points."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, a)))
+
+
+def haversine_expression(latitude, longitude):
+    """DB expression for the distance in km from (latitude, longitude) to each row."""
+    lat = Radians(Cast(F('latitude'), FloatField()))
+    lng = Radians(Cast(F('longitude'), FloatField()))
+    origin_lat = math.radians(latitude)
+    origin_lng = math.radians(longitude)
+    a = (
+        Power(Sin((lat - Value(origin_lat)) / Value(2.0)), 2) +
+        Value(math.cos(origin_lat)) * Cos(lat) *
+        Power(Sin((lng - Value(origin_lng)) / Value(2.0)), 2)
+    )
+    return Value(2 * EARTH_RADIUS_KM) * ASin(Sqrt(a), output_field=FloatField())
+
+
+def filter_near(queryset, latitude, longitude, radius_km):
+    """Restrict to rows within radius_km, annotated with `distance_km`."""
+    prefilter = Q()
+    for prefix in covering_geohashes(latitude, longitude, radius_km):
+        prefilter |= Q(geohash__startswith=prefix)
+    return (
+        queryset.filter(prefilter)
+        .annotate(distance_km=haversine_expression(latitude, longitude))
+        .filter(distance_km__lte=radius_km)
+    )
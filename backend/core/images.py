@@ -0,0 +1,98 @@
+"""
+Resized variants of restaurant photos, generated by the image_derivatives job.
+
+Only originals held in our own storage are processed. Each is fetched once,
+resized to VARIANT_WIDTHS (never upscaled) and encoded as WebP plus a JPEG
+fallback. The variants are
+stored under variants/<sha256 of original>/ and recorded on
+RestaurantPhoto.variants. Serializers expose them as srcset strings.
+
+Pillow is imported lazily so web workers don't load it.
+"""
+import hashlib
+import io
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+
+from . import storage
+from .jobs import register
+from .models import RestaurantPhoto
+
+VARIANT_WIDTHS = (320, 800, 1600)
+# (extension, Pillow format, content type)
+VARIANT_FORMATS = (
+    ('webp', 'WEBP', 'image/webp'),
+    ('jpg', 'JPEG', 'image/jpeg'),
+)
+VARIANT_QUALITY = 80
+# Larger than any upload we accept (core.uploads.MAX_FILE_SIZE)
+MAX_SOURCE_BYTES = 25 * 1024 * 1024
+
+
+def _fetch(url):
+    resp = storage.get_session().get(
+        url,
+        stream=True,
+        timeout=(
+            getattr(settings, 'STORAGE_CONNECT_TIMEOUT', 5.0),
+            getattr(settings, 'STORAGE_READ_TIMEOUT', 60.0),
+        ),
+    )
+    with resp:
+        resp.raise_for_status()
+        data = bytearray()
+        for chunk in resp.iter_content(storage.UPLOAD_CHUNK_SIZE):
+            data += chunk
+            if len(data) > MAX_SOURCE_BYTES:
+                raise ValueError(f'Source image larger than {MAX_SOURCE_BYTES} bytes.')
+    return bytes(data)
+
+
+def render_variants(data):
+    """Yield (width, ext, content_type, bytes) for every variant of an encoded image."""
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as original:
+        image = ImageOps.exif_transpose(original)
+        image = image.convert('RGBA' if image.mode in ('RGBA', 'LA', 'P') else 'RGB')
+        for width in sorted({min(w, image.width) for w in VARIANT_WIDTHS}):
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.Resampling.LANCZOS) if width != image.width else image
+            for ext, fmt, content_type in VARIANT_FORMATS:
+                frame = resized.convert('RGB') if fmt == 'JPEG' else resized
+                out = io.BytesIO()
+                frame.save(out, fmt, quality=VARIANT_QUALITY)
+                yield width, ext, content_type, out.getvalue()
+
+
+@register('image_derivatives')
+def generate_photo_variants(photo_id):
+    photo = RestaurantPhoto.objects.filter(pk=photo_id).first()
+    if photo is None:
+        return  # deleted before the job ran
+    source_url = photo.image_url
+    backend = storage.get_storage()
+    if not backend.owns_url(source_url):
+        return  # only fetch what we stored ourselves, never arbitrary owner-supplied hosts
+    data = _fetch(source_url)
+    digest = hashlib.sha256(data).hexdigest()
+    variants = []
+    for width, ext, content_type, body in render_variants(data):
+        object_path = f'variants/{digest}/{width}.{ext}'
+        url = backend.upload(object_path, ContentFile(body, name=f'{width}.{ext}'), content_type)
+        variants.append({'width': width, 'format': ext, 'url': url})
+
+    # Skip if the photo was replaced or removed while we worked; its own job covers it.
+    photo = RestaurantPhoto.objects.filter(pk=photo_id, image_url=source_url).first()
+    if photo is not None:
+        photo.variants = variants
+        photo.save(update_fields=['variants', 'updated_at'])
+
+
+def srcsets(variants):
+    """{'webp': 'url 320w, url 800w', 'jpg': ...} from RestaurantPhoto.variants."""
+    by_format = {}
+    for variant in sorted(variants or [], key=lambda v: v['width']):
+        by_format.setdefault(variant['format'], []).append(f"{variant['url']} {variant['width']}w")
+    return {fmt: ', '.join(entries) for fmt, entries in by_format.items()}
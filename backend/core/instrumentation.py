@@ -0,0 +1,128 @@
+"""
+Per-request SQL instrumentation.
+
+record_queries() collects into a QueryRecorder every query run in the current
+context: this thread, plus the worker threads an ASGI request's sync code and
+async ORM calls run on (they inherit the context). One execute wrapper,
+installed on each connection when it is created, feeds the active recorders.
+A recorder counts queries, sums their time and groups them by shape: the SQL
+with whitespace collapsed and IN lists shortened, since the parameters are
+already separate. A shape that repeats SQL_N_PLUS_ONE_THRESHOLD
+times in one request is a suspected N+1 (one query per row of an earlier
+result).
+
+core.middleware.SQLInstrumentationMiddleware records every request. It adds
+a Server-Timing header (`db;dur=<ms>;desc="<n> queries"`) and logs a logfmt
+summary per view on the `core.sql` logger at DEBUG. Suspected N+1 shapes are logged as warnings. With
+SQL_N_PLUS_ONE_RAISE (on by default under `manage.py test`) they raise NPlusOneDetected instead.
+
+In tests:
+
+    with assert_max_queries(2):
+        client.get('/api/restaurants/')
+    with assert_no_n_plus_one():
+        client.get('/api/admin/owner-applications/')
+"""
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+_WHITESPACE = re.compile(r'\s+')
+_IN_LIST = re.compile(r'IN \((?:%s, )*%s\)')
+
+_active_recorders: ContextVar['tuple[QueryRecorder, ...]'] = ContextVar('active_query_recorders', default=())
+
+
+class NPlusOneDetected(AssertionError):
+    pass
+
+
+def query_shape(sql):
+    """SQL normalised so the same query over different rows/ids compares equal."""
+    return _IN_LIST.sub('IN (...)', _WHITESPACE.sub(' ', sql).strip())
+
+
+def n_plus_one_threshold():
+    return getattr(settings, 'SQL_N_PLUS_ONE_THRESHOLD', 5)
+
+
+class QueryRecorder:
+    """Counts, times and groups the queries reported to it."""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+
+    def add(self, sql, seconds):
+        self.count += 1
+        self.duration += seconds
+        self.shapes[query_shape(sql)] += 1
+
+    def repeated(self, threshold=None):
+        """{shape: count} for shapes run at least `threshold` times."""
+        threshold = threshold or n_plus_one_threshold()
+        return {shape: n for shape, n in self.shapes.items() if n >= threshold}
+
+
+def _report_query(execute, sql, params, many, context):
+    recorders = _active_recorders.get()
+    if not recorders:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - start
+        for recorder in recorders:
+            recorder.add(sql, elapsed)
+
+
+@receiver(connection_created)
+def _install_wrapper(sender, connection, **kwargs):
+    if _report_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_report_query)
+
+
+@contextmanager
+def record_queries():
+    """Record the queries run on every database alias in the current context; blocks can nest."""
+    # Connections opened before this module was imported missed connection_created
+    for connection in connections.all(initialized_only=True):
+        _install_wrapper(None, connection)
+    recorder = QueryRecorder()
+    token = _active_recorders.set(_active_recorders.get() + (recorder,))
+    try:
+        yield recorder
+    finally:
+        _active_recorders.reset(token)
+
+
+def describe(repeated):
+    return '; '.join(f'{n}x {shape[:200]}' for shape, n in sorted(repeated.items(), key=lambda item: -item[1]))
+
+
+@contextmanager
+def assert_max_queries(limit):
+    """Fail if the block runs more than `limit` queries."""
+    with record_queries() as recorder:
+        yield recorder
+    if recorder.count > limit:
+        raise AssertionError(f'{recorder.count} queries run, expected at most {limit}.')
+
+
+@contextmanager
+def assert_no_n_plus_one(threshold=None):
+    """Fail if any query shape repeats `threshold` (default SQL_N_PLUS_ONE_THRESHOLD) times in the block."""
+    with record_queries() as recorder:
+        yield recorder
+    repeated = recorder.repeated(threshold)
+    if repeated:
+        raise NPlusOneDetected(f'Suspected N+1: {describe(repeated)}')
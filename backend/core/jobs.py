@@ -0,0 +1,114 @@
+"""
+Minimal DB-backed job queue.
+
+Jobs are BackgroundJob rows. enqueue() inserts one when the surrounding
+transaction commits. `python manage.py run_jobs` claims due jobs in batches
+(SELECT ... FOR UPDATE SKIP LOCKED where the database supports it), leases them
+for JOB_LEASE_SECONDS, and runs their handlers on a thread pool. Failed jobs are
+retried with exponential backoff until max_attempts. A job whose lease
+expires (its worker died or hung) becomes claimable again, unless that was its
+last attempt: then it is marked FAILED, so a job that kills its worker is not
+re-leased forever.
+
+Handlers are registered by kind:
+
+    @register('image_derivatives')
+    def generate(photo_id): ...
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import BackgroundJob, JobStatus
+
+logger = logging.getLogger(__name__)
+
+_handlers = {}
+
+
+def register(kind):
+    def decorator(func):
+        _handlers[kind] = func
+        return func
+    return decorator
+
+
+def enqueue(kind, **payload):
+    """Queue a job to run after the current transaction commits."""
+    transaction.on_commit(lambda: BackgroundJob.objects.create(kind=kind, payload=payload))
+
+
+def _lease():
+    return timedelta(seconds=getattr(settings, 'JOB_LEASE_SECONDS', 300))
+
+
+def claim(limit):
+    """Lease up to `limit` due jobs to this worker and return them."""
+    now = timezone.now()
+    expired = Q(status=JobStatus.RUNNING, locked_until__lt=now)
+    with transaction.atomic():
+        BackgroundJob.objects.filter(expired, attempts__gte=F('max_attempts')).update(
+            status=JobStatus.FAILED, locked_until=None, last_error='Lease expired on the last attempt.',
+        )
+        due = BackgroundJob.objects.filter(
+            Q(status=JobStatus.PENDING, run_after__lte=now) | expired
+        ).order_by('run_after', 'id')
+        if connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        ids = list(due.values_list('id', flat=True)[:limit])
+        BackgroundJob.objects.filter(pk__in=ids).update(
+            status=JobStatus.RUNNING,
+            locked_until=now + _lease(),
+            attempts=F('attempts') + 1,
+        )
+    return list(BackgroundJob.objects.filter(pk__in=ids).order_by('run_after', 'id'))
+
+
+def _retry_delay(attempts):
+    return timedelta(seconds=getattr(settings, 'JOB_RETRY_BASE_SECONDS', 30) * 2 ** (attempts - 1))
+
+
+def run_job(job):
+    """Run one claimed job and record the outcome. Safe to call from worker threads."""
+    try:
+        handler = _handlers.get(job.kind)
+        if handler is None:
+            raise LookupError(f'No handler registered for job kind {job.kind!r}.')
+        handler(**job.payload)
+    except Exception as exc:
+        logger.exception('Job %s (%s) failed on attempt %s', job.pk, job.kind, job.attempts)
+        if job.attempts >= job.max_attempts:
+            updates = {'status': JobStatus.FAILED}
+        else:
+            updates = {'status': JobStatus.PENDING, 'run_after': timezone.now() + _retry_delay(job.attempts)}
+        BackgroundJob.objects.filter(pk=job.pk).update(
+            locked_until=None, last_error=f'{type(exc).__name__}: {exc}'[:2000], **updates
+        )
+    else:
+        BackgroundJob.objects.filter(pk=job.pk).update(status=JobStatus.DONE, locked_until=None, last_error='')
+    finally:
+        # Worker threads hold their own DB connections.
+        close_old_connections()
+
+
+def _run_in_thread(job):
+    try:
+        run_job(job)
+    finally:
+        connections.close_all()
+
+
+def run_pending(limit=20, workers=None):
+    """Claim and run one batch of due jobs on a thread pool; returns how many ran."""
+    jobs = claim(limit)
+    if not jobs:
+        return 0
+    workers = workers or getattr(settings, 'JOB_WORKERS', 4)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='job') as pool:
+        list(pool.map(_run_in_thread, jobs))
+    return len(jobs)
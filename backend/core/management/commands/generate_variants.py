@@ -0,0 +1,36 @@
+"""
+Queue image_derivatives jobs for existing photos, e.g. those uploaded before
+variants existed: `python manage.py generate_variants --missing`, then
+`python manage.py run_jobs`. Photos not held in our own storage are skipped,
+as the job would, and so are photos that already have a job waiting.
+"""
+from django.core.management.base import BaseCommand
+
+from core.models import BackgroundJob, JobStatus, RestaurantPhoto
+from core.storage import get_storage
+
+KIND = 'image_derivatives'
+
+
+class Command(BaseCommand):
+    help = 'Queue resized-variant generation for existing restaurant photos.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--missing', action='store_true', help='Only photos that have no variants yet.')
+        parser.add_argument('--batch-size', type=int, default=500, help='Jobs inserted per query.')
+
+    def handle(self, *args, **options):
+        photos = RestaurantPhoto.objects.order_by('id')
+        if options['missing']:
+            photos = photos.filter(variants=[])
+        waiting = set(BackgroundJob.objects.filter(
+            kind=KIND, status__in=[JobStatus.PENDING, JobStatus.RUNNING],
+        ).values_list('payload__photo_id', flat=True))
+        backend = get_storage()
+        jobs = [
+            BackgroundJob(kind=KIND, payload={'photo_id': photo_id})
+            for photo_id, image_url in photos.values_list('id', 'image_url').iterator()
+            if photo_id not in waiting and backend.owns_url(image_url)
+        ]
+        BackgroundJob.objects.bulk_create(jobs, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Queued {len(jobs)} variant job(s).'))
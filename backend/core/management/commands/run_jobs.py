@@ -0,0 +1,28 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core import images  # noqa: F401  (registers the image_derivatives handler)
+from core.jobs import run_pending
+
+
+class Command(BaseCommand):
+    help = 'Run background jobs from the DB-backed queue (core.jobs) until interrupted.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Run one batch of due jobs and exit.')
+        parser.add_argument('--batch', type=int, default=20, help='Jobs claimed per batch.')
+        parser.add_argument('--workers', type=int, default=getattr(settings, 'JOB_WORKERS', 4),
+                            help='Threads running jobs in parallel.')
+        parser.add_argument('--sleep', type=float, default=2.0, help='Seconds to wait when the queue is empty.')
+
+    def handle(self, *args, **options):
+        while True:
+            ran = run_pending(limit=options['batch'], workers=options['workers'])
+            if ran:
+                self.stdout.write(f'Ran {ran} job(s).')
+            if options['once']:
+                return
+            if not ran:
+                time.sleep(options['sleep'])
@@ -0,0 +1,217 @@
+"""
+Bulk-generate realistic synthetic data for load testing and benchmarks.
+
+    python manage.py seed_data --users 20000 --applications 6000 --seed 7
+
+Creates users (mostly USER, some AUDITOR/ADMIN), owner applications in every
+status, one restaurant per approved application spread around real city
+centres, and photos for those restaurants. Everything is inserted with
+bulk_create. Derived columns that save() or signals would normally maintain
+(geohash, cover_photo_url, photo_count) are filled in here. Output is fully
+determined by --seed.
+
+All seeded accounts use @seed.example.com addresses and the password
+`seed-password`. --flush deletes them, and everything hanging off them,
+first. Fixed accounts for the benchmark suite are always created:
+seed-admin@, seed-superadmin@ and seed-owner@seed.example.com.
+"""
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from core.cache import bump_restaurant_list_version
+from core.geo import encode_geohash
+from core.models import (
+    ApplicationStatus,
+    OwnerApplication,
+    Restaurant,
+    RestaurantPhoto,
+    RestaurantStatus,
+    Role,
+    User,
+)
+
+EMAIL_DOMAIN = 'seed.example.com'
+PASSWORD = 'seed-password'
+
+# (city, latitude, longitude) of the centre; restaurants land within ~15 km
+CITIES = [
+    ('Mumbai', 19.0760, 72.8777),
+    ('Delhi', 28.6139, 77.2090),
+    ('Bengaluru', 12.9716, 77.5946),
+    ('Hyderabad', 17.3850, 78.4867),
+    ('Chennai', 13.0827, 80.2707),
+    ('Kolkata', 22.5726, 88.3639),
+    ('Pune', 18.5204, 73.8567),
+    ('Ahmedabad', 23.0225, 72.5714),
+    ('Jaipur', 26.9124, 75.7873),
+    ('Lucknow', 26.8467, 80.9462),
+    ('Kochi', 9.9312, 76.2673),
+    ('Indore', 22.7196, 75.8577),
+]
+FIRST_NAMES = [
+    'Aarav', 'Aditi', 'Arjun', 'Diya', 'Ishaan', 'Kavya', 'Meera', 'Neha', 'Priya', 'Rahul',
+    'Rohan', 'Saanvi', 'Sneha', 'Tanvi', 'Vihaan', 'Vikram', 'Anjali', 'Karan', 'Pooja', 'Siddharth',
+]
+LAST_NAMES = [
+    'Sharma', 'Patel', 'Iyer', 'Reddy', 'Nair', 'Gupta', 'Singh', 'Kulkarni', 'Das', 'Menon',
+    'Joshi', 'Khan', 'Mehta', 'Rao', 'Banerjee',
+]
+CUISINE_WORDS = [
+    'Spice', 'Tandoor', 'Masala', 'Dosa', 'Biryani', 'Curry', 'Chaat', 'Thali', 'Kebab', 'Chai',
+    'Coastal', 'Royal', 'Garden', 'Street', 'Urban', 'Saffron', 'Mango', 'Tamarind', 'Cardamom', 'Ginger',
+]
+VENUE_WORDS = ['House', 'Kitchen', 'Corner', 'Cafe', 'Bistro', 'Dhaba', 'Junction', 'Express', 'Point', 'Table']
+STREETS = ['MG Road', 'Station Road', 'Park Street', 'Link Road', 'Main Bazaar', 'Ring Road', 'Lake View Road']
+CAPTIONS = ['Storefront', 'Dining', 'Kitchen', 'Menu', 'Other']
+
+
+class Command(BaseCommand):
+    help = 'Bulk-generate synthetic users, owner applications, restaurants and photos.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=2000, help='Plain users (role USER)')
+        parser.add_argument('--applications', type=int, default=600, help='Owner applications (each by a new owner)')
+        parser.add_argument('--approved-share', type=float, default=0.6, help='Share of applications approved')
+        parser.add_argument('--max-photos', type=int, default=8, help='Photos per restaurant: 0..N')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--flush', action='store_true', help='Delete previously seeded data first')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        seeded = User.objects.filter(email__endswith=f'@{EMAIL_DOMAIN}')
+        if options['flush']:
+            deleted, _ = seeded.delete()
+            self.stdout.write(f'Deleted {deleted} seeded rows.')
+        elif seeded.exists():
+            self.stderr.write('Seeded data already exists; rerun with --flush to replace it.')
+            return
+
+        password = make_password(PASSWORD)  # hashing once keeps 10k+ users fast
+        now = timezone.now()
+
+        def minutes_ago(limit):
+            return now - timedelta(minutes=rng.randint(0, limit))
+
+        with transaction.atomic():
+            admin = self._user('seed-admin', 'Seed Admin', Role.ADMIN, password)
+            seed_owner = self._user('seed-owner', 'Seed Owner', Role.OWNER, password)
+            users = [admin, seed_owner, self._user('seed-superadmin', 'Seed Superadmin', Role.SUPER_ADMIN, password)]
+            users += [self._user(f'auditor{i}', self._name(rng), Role.AUDITOR, password) for i in range(5)]
+            users += [self._user(f'user{i}', self._name(rng), Role.USER, password) for i in range(options['users'])]
+
+            # Applicants: approved ones become owners with a restaurant
+            statuses = [
+                ApplicationStatus.APPROVED if rng.random() < options['approved_share']
+                else rng.choice([ApplicationStatus.PENDING, ApplicationStatus.REJECTED])
+                for _ in range(options['applications'])
+            ]
+            applicants = [
+                self._user(
+                    f'owner{i}', self._name(rng),
+                    Role.OWNER if status == ApplicationStatus.APPROVED else Role.USER, password,
+                )
+                for i, status in enumerate(statuses)
+            ]
+            users += applicants
+            User.objects.bulk_create(users, batch_size=self.batch_size)
+            self._backdate(User, users, 'created_at', [minutes_ago(525600) for _ in users])
+
+            applications, submitted = [], []
+            restaurants = [Restaurant(
+                owner=seed_owner, name='Seed Owner Kitchen', address='1, MG Road, Pune', city='Pune',
+                google_maps_link='https://maps.google.com/?q=18.5204,73.8567',
+                latitude=18.5204, longitude=73.8567, geohash=encode_geohash(18.5204, 73.8567),
+            )]
+            for applicant, status in zip(applicants, statuses):
+                city, lat, lng = rng.choice(CITIES)
+                name = f'{rng.choice(CUISINE_WORDS)} {rng.choice(VENUE_WORDS)}'
+                address = f'{rng.randint(1, 400)}, {rng.choice(STREETS)}, {city}'
+                reviewed = status != ApplicationStatus.PENDING
+                submitted.append(minutes_ago(259200))
+                applications.append(OwnerApplication(
+                    user=applicant,
+                    restaurant_name=name,
+                    business_address=address,
+                    city=city,
+                    google_maps_link=f'https://maps.google.com/?q={lat:.4f},{lng:.4f}',
+                    contact_person_name=applicant.name,
+                    contact_phone=self._phone(rng),
+                    operating_hours='10:00-22:00',
+                    proof_document_url=f'https://files.{EMAIL_DOMAIN}/pdf/{applicant.pk}.pdf',
+                    declaration_accepted=True,
+                    status=status,
+                    reviewed_by=admin if reviewed else None,
+                    reviewed_at=min(submitted[-1] + timedelta(hours=rng.randint(1, 72)), now) if reviewed else None,
+                    review_notes='Seeded review.' if reviewed else '',
+                ))
+                if status == ApplicationStatus.APPROVED:
+                    # 1 degree of latitude is ~111 km; +-0.135 keeps points within ~15 km
+                    latitude = round(lat + rng.uniform(-0.135, 0.135), 6)
+                    longitude = round(lng + rng.uniform(-0.135, 0.135), 6)
+                    restaurants.append(Restaurant(
+                        owner=applicant,
+                        name=name,
+                        address=address,
+                        city=city,
+                        google_maps_link=f'https://maps.google.com/?q={latitude},{longitude}',
+                        latitude=latitude,
+                        longitude=longitude,
+                        geohash=encode_geohash(latitude, longitude),
+                        operating_hours='10:00-22:00',
+                        phone=self._phone(rng),
+                        status=RestaurantStatus.SUSPENDED if rng.random() < 0.05 else RestaurantStatus.ACTIVE,
+                    ))
+            OwnerApplication.objects.bulk_create(applications, batch_size=self.batch_size)
+            self._backdate(OwnerApplication, applications, 'submitted_at', submitted)
+            Restaurant.objects.bulk_create(restaurants, batch_size=self.batch_size)
+
+            photos = []
+            for restaurant in restaurants:
+                count = rng.randint(0, options['max_photos'])
+                restaurant.photo_count = count
+                restaurant.cover_photo_url = self._photo_url(restaurant, 0) if count else ''
+                for order in range(count):
+                    photos.append(RestaurantPhoto(
+                        restaurant=restaurant,
+                        image_url=self._photo_url(restaurant, order),
+                        caption=rng.choice(CAPTIONS),
+                        order=order,
+                    ))
+            RestaurantPhoto.objects.bulk_create(photos, batch_size=self.batch_size)
+            Restaurant.objects.bulk_update(restaurants, ['cover_photo_url', 'photo_count'], batch_size=self.batch_size)
+            # bulk_create sends no signals, so cached public lists must be invalidated here
+            transaction.on_commit(bump_restaurant_list_version)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {len(users)} users, {len(applications)} applications, '
+            f'{len(restaurants)} restaurants and {len(photos)} photos (password: {PASSWORD}).'
+        ))
+
+    def _backdate(self, model, objects, field, values):
+        """auto_now_add overrides timestamps on insert; spread them out afterwards."""
+        for obj, value in zip(objects, values):
+            setattr(obj, field, value)
+        model.objects.bulk_update(objects, [field], batch_size=self.batch_size)
+
+    @staticmethod
+    def _photo_url(restaurant, order):
+        return f'https://picsum.photos/seed/{restaurant.pk}-{order}/800/600'
+
+    @staticmethod
+    def _user(local_part, name, role, password):
+        return User(email=f'{local_part}@{EMAIL_DOMAIN}', name=name, role=role, password=password)
+
+    @staticmethod
+    def _name(rng):
+        return f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+
+    @staticmethod
+    def _phone(rng):
+        return f'+91 9{rng.randint(100000000, 999999999)}'
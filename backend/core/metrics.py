@@ -0,0 +1,74 @@
+"""
+Request latency/throughput and upload metrics in Prometheus format.
+
+core.middleware.MetricsMiddleware observes every request in
+http_request_duration_seconds, labelled by URL name (`restaurant_list`,
+`file_upload`, `admin:core_restaurant_changelist`, ...), method and status.
+Rates, error ratios and percentiles come from that one histogram, e.g.
+
+    sum by (view) (rate(http_request_duration_seconds_count[5m]))
+    sum by (view) (rate(http_request_duration_seconds_count{status=~"5.."}[5m]))
+    histogram_quantile(0.95, sum by (view, le) (rate(http_request_duration_seconds_bucket[5m])))
+
+Upload views add the bytes they received to upload_bytes_total.
+
+Under gunicorn every worker process writes its samples to files in
+PROMETHEUS_MULTIPROC_DIR. The directory is created and cleaned by
+gunicorn.conf.py, and the /metrics/ endpoint merges the files. Without that
+variable (runserver) the metrics stay in-process. If prometheus_client is not
+installed, recording is a no-op and /metrics/ returns 503.
+"""
+import os
+
+if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+    # Normally created by gunicorn.conf.py; also covers manage.py commands
+    os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+
+try:
+    import prometheus_client
+    import prometheus_client.multiprocess
+except ImportError:  # optional; metrics disabled
+    prometheus_client = None
+
+# Seconds; API requests sit in the 5ms-1s range, uploads run up to tens of seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+if prometheus_client is not None:
+    REQUEST_LATENCY = prometheus_client.Histogram(
+        'http_request_duration_seconds',
+        'Request latency by URL name, method and status code.',
+        ['view', 'method', 'status'],
+        buckets=LATENCY_BUCKETS,
+    )
+    UPLOAD_BYTES = prometheus_client.Counter(
+        'upload_bytes',
+        'Bytes of file content received by the upload endpoints.',
+        ['view', 'outcome'],
+    )
+
+
+def enabled():
+    return prometheus_client is not None
+
+
+def observe_request(view, method, status, seconds):
+    if prometheus_client is not None:
+        REQUEST_LATENCY.labels(view, method, str(status)).observe(seconds)
+
+
+def record_upload(view, num_bytes, outcome):
+    """outcome: 'stored' for a 2xx response, 'rejected' otherwise."""
+    if prometheus_client is not None and num_bytes:
+        UPLOAD_BYTES.labels(view, outcome).inc(num_bytes)
+
+
+def exposition():
+    """(body, content_type) with every worker's samples, in Prometheus text format; needs enabled()."""
+    if prometheus_client is None:
+        raise RuntimeError('prometheus_client is not installed.')
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = prometheus_client.CollectorRegistry()
+        prometheus_client.multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    return prometheus_client.generate_latest(registry), prometheus_client.CONTENT_TYPE_LATEST
@@ -0,0 +1,218 @@
+"""
+Project middleware.
+
+CompressionMiddleware: response compression negotiated from Accept-Encoding.
+
+Brotli is preferred when the `brotli` package is installed and the client
+accepts it, otherwise gzip. BREACH: gzip output gets GZipMiddleware's
+random-length padding, which brotli has no header field for. Requests that
+carry credentials (an Authorization header or cookies), whose responses may
+hold secrets, are therefore never answered with brotli. Responses smaller than
+COMPRESSION_MIN_SIZE bytes, non-text content types (images and PDFs are
+already compressed) and responses that already carry a Content-Encoding are
+left alone. Streaming responses are handed to Django's GZipMiddleware.
+
+SQLInstrumentationMiddleware: per-request query counts, DB time and N+1
+detection; see core.instrumentation.
+
+MetricsMiddleware: request latency histogram by URL name; see core.metrics.
+
+ReplicaRoutingMiddleware: read-only requests read from a replica; see
+core.db_router.
+"""
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+from . import metrics
+from .db_router import ReadRouting, is_read_only_view, pin_to_primary, replicas
+from .instrumentation import NPlusOneDetected, describe, record_queries
+
+try:
+    import brotli
+except ImportError:  # optional; gzip only
+    brotli = None
+
+COMPRESSIBLE_TYPES = ('application/json', 'text/', 'application/javascript', 'image/svg+xml')
+# Quality 11 is for static assets; 4-5 is the usual trade-off for per-request compression
+BROTLI_QUALITY = 5
+
+sql_logger = logging.getLogger('core.sql')
+
+
+def accepted_encodings(header):
+    """Encodings the client accepts (q > 0), from an Accept-Encoding header value."""
+    accepted = set()
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding and q > 0:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def has_credentials(request):
+    return bool(request.META.get('HTTP_AUTHORIZATION') or request.META.get('HTTP_COOKIE'))
+
+
+class CompressionMiddleware(GZipMiddleware):
+    def process_response(self, request, response):
+        if response.streaming:
+            return super().process_response(request, response)
+        if response.has_header('Content-Encoding'):
+            return response
+        if not response.get('Content-Type', '').startswith(COMPRESSIBLE_TYPES):
+            return response
+        if len(response.content) < getattr(settings, 'COMPRESSION_MIN_SIZE', 1024):
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        accepted = accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if brotli is not None and 'br' in accepted and not has_credentials(request):
+            encoding = 'br'
+            compressed = brotli.compress(response.content, quality=BROTLI_QUALITY)
+        elif 'gzip' in accepted or '*' in accepted:
+            encoding = 'gzip'
+            compressed = compress_string(response.content, max_random_bytes=self.max_random_bytes)
+        else:
+            return response
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response.headers['Content-Length'] = str(len(compressed))
+        # The compressed body is a different representation: a strong ETag becomes weak (RFC 9110 8.8.1).
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        return response
+
+
+class HybridMiddleware:
+    """
+    Base for middleware that runs natively under WSGI and ASGI: Django calls it
+    synchronously or awaits it, depending on the rest of the chain. A sync-only
+    middleware would push every ASGI request, async views included, onto a thread.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            # Subclasses define __call__
+            markcoroutinefunction(self)  # pyright: ignore[reportArgumentType]
+
+
+class SQLInstrumentationMiddleware(HybridMiddleware):
+    """Server-Timing, per-view query logging and N+1 detection (see core.instrumentation)."""
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with record_queries() as recorder:
+            response = self.get_response(request)
+        return self.report(request, response, recorder)
+
+    async def __acall__(self, request):
+        with record_queries() as recorder:
+            response = await self.get_response(request)
+        return self.report(request, response, recorder)
+
+    def report(self, request, response, recorder):
+        db_ms = recorder.duration * 1000
+        timing = f'db;dur={db_ms:.1f};desc="{recorder.count} queries"'
+        existing = response.get('Server-Timing')
+        response['Server-Timing'] = f'{existing}, {timing}' if existing else timing
+
+        match = getattr(request, 'resolver_match', None)
+        view = match.view_name if match else '-'
+        repeated = recorder.repeated()
+        sql_logger.debug(
+            'view=%s method=%s status=%s queries=%d db_ms=%.1f repeated_shapes=%d',
+            view, request.method, response.status_code, recorder.count, db_ms, len(repeated),
+            extra={'view': view, 'queries': recorder.count, 'db_ms': round(db_ms, 1)},
+        )
+        if repeated:
+            if getattr(settings, 'SQL_N_PLUS_ONE_RAISE', False):
+                raise NPlusOneDetected(f'Suspected N+1 in {view}: {describe(repeated)}')
+            sql_logger.warning('Suspected N+1 in view=%s: %s', view, describe(repeated))
+        return response
+
+
+class MetricsMiddleware(HybridMiddleware):
+    """Observes each request's latency; keep it near the top so it times the rest of the stack."""
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        start = time.perf_counter()
+        response = self.get_response(request)
+        return self.observe(request, response, start)
+
+    async def __acall__(self, request):
+        start = time.perf_counter()
+        response = await self.get_response(request)
+        return self.observe(request, response, start)
+
+    def observe(self, request, response, start):
+        match = getattr(request, 'resolver_match', None)
+        # Unmatched paths share one label so scanners can't blow up cardinality
+        view = match.view_name if match else 'unmatched'
+        metrics.observe_request(view, request.method, response.status_code, time.perf_counter() - start)
+        return response
+
+
+class ReplicaRoutingMiddleware(HybridMiddleware):
+    """Routes reads of read-only views to a replica and pins writers to the primary (see core.db_router)."""
+
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            self.close_routing(request)
+        return self.pin_writer(request, response)
+
+    async def __acall__(self, request):
+        try:
+            response = await self.get_response(request)
+        finally:
+            self.close_routing(request)
+        if request.method in self.SAFE_METHODS or not replicas():
+            return response
+        # request.user may still be Django's lazy session user, which queries the database
+        return await sync_to_async(self.pin_writer)(request, response)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method in self.SAFE_METHODS and replicas() and is_read_only_view(view_func):
+            request._read_routing = ReadRouting(request).__enter__()
+
+    @staticmethod
+    def close_routing(request):
+        routing = request.__dict__.pop('_read_routing', None)
+        if routing is not None:
+            routing.__exit__(None, None, None)
+
+    def pin_writer(self, request, response):
+        if request.method not in self.SAFE_METHODS and response.status_code < 400 and replicas():
+            user = getattr(request, 'user', None)
+            if user is not None and user.is_authenticated:
+                pin_to_primary(user.pk)
+        return response
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 15:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_add_restaurant_photos'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='restaurant',
+            index=models.Index(fields=['status', 'name', 'id'], name='restaurants_status_name_id_idx'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.30 on 2026-10-17 15:17
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+SEARCH_DOCUMENT = """
+    setweight(to_tsvector('simple', coalesce({row}.name, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce({row}.city, '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce({row}.address, '')), 'C')
+"""
+
+FORWARD_SQL = [
+    f"""
+    CREATE OR REPLACE FUNCTION restaurants_search_vector_update() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {SEARCH_DOCUMENT.format(row='NEW')};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE TRIGGER restaurants_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON restaurants
+    FOR EACH ROW EXECUTE FUNCTION restaurants_search_vector_update();
+    """,
+    f"UPDATE restaurants SET search_vector = {SEARCH_DOCUMENT.format(row='restaurants')};",
+    "CREATE INDEX restaurants_search_vector_idx ON restaurants USING gin (search_vector);",
+    "CREATE INDEX restaurants_name_trgm_idx ON restaurants USING gin (name gin_trgm_ops);",
+    "CREATE INDEX restaurants_city_trgm_idx ON restaurants USING gin (city gin_trgm_ops);",
+]
+
+BACKWARD_SQL = [
+    "DROP INDEX IF EXISTS restaurants_city_trgm_idx;",
+    "DROP INDEX IF EXISTS restaurants_name_trgm_idx;",
+    "DROP INDEX IF EXISTS restaurants_search_vector_idx;",
+    "DROP TRIGGER IF EXISTS restaurants_search_vector_trigger ON restaurants;",
+    "DROP FUNCTION IF EXISTS restaurants_search_vector_update();",
+]
+
+
+def _run_on_postgres(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_add_restaurant_browse_index'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='restaurant',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(_run_on_postgres(FORWARD_SQL), _run_on_postgres(BACKWARD_SQL)),
+    ]
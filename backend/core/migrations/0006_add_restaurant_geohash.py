@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-17 15:18
+
+from django.db import migrations, models
+
+from core.geo import encode_geohash
+
+
+def backfill_geohash(apps, schema_editor):
+    Restaurant = apps.get_model('core', 'Restaurant')
+    located = Restaurant.objects.filter(latitude__isnull=False, longitude__isnull=False)
+    batch = []
+    for restaurant in located.only('id', 'latitude', 'longitude').iterator():
+        restaurant.geohash = encode_geohash(restaurant.latitude, restaurant.longitude)
+        batch.append(restaurant)
+        if len(batch) >= 500:
+            Restaurant.objects.bulk_update(batch, ['geohash'])
+            batch = []
+    if batch:
+        Restaurant.objects.bulk_update(batch, ['geohash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_add_restaurant_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='restaurant',
+            name='geohash',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=12),
+        ),
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+    ]
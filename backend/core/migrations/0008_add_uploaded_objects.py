@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-17 15:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_add_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadedObject',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('backend', models.CharField(max_length=100)),
+                ('sha256', models.CharField(max_length=64)),
+                ('object_path', models.CharField(max_length=255)),
+                ('url', models.URLField(max_length=500)),
+                ('size', models.BigIntegerField()),
+                ('content_type', models.CharField(max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'uploaded_objects',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='uploadedobject',
+            constraint=models.UniqueConstraint(fields=('backend', 'sha256'), name='uploaded_objects_backend_sha256_uniq'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-17 15:30
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_photo_summary(apps, schema_editor):
+    Restaurant = apps.get_model('core', 'Restaurant')
+    RestaurantPhoto = apps.get_model('core', 'RestaurantPhoto')
+    photos = RestaurantPhoto.objects.filter(restaurant=OuterRef('pk'))
+    Restaurant.objects.filter(pk__in=RestaurantPhoto.objects.values('restaurant_id')).update(
+        cover_photo_url=Subquery(photos.order_by('order', 'id').values('image_url')[:1]),
+        photo_count=Coalesce(
+            Subquery(photos.order_by().values('restaurant').annotate(n=Count('id')).values('n')), Value(0)
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_add_photo_variants_and_jobs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='restaurant',
+            name='cover_photo_url',
+            field=models.URLField(blank=True, editable=False, max_length=500),
+        ),
+        migrations.AddField(
+            model_name='restaurant',
+            name='photo_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_photo_summary, migrations.RunPython.noop),
+    ]
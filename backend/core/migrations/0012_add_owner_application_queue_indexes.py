@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-17 15:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_add_user_token_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ownerapplication',
+            index=models.Index(fields=['status', 'submitted_at', 'id'], name='owner_apps_status_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ownerapplication',
+            index=models.Index(fields=['submitted_at', 'id'], name='owner_apps_submitted_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ownerapplication',
+            index=models.Index(condition=models.Q(('status', 'PENDING')), fields=['submitted_at', 'id'], name='owner_apps_pending_idx'),
+        ),
+    ]
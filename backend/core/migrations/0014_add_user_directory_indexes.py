@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-17 16:02
+
+from django.db import migrations, models
+
+
+# Match the expressions Django's PostgreSQL backend generates for the superadmin
+# search: email__istartswith -> UPPER("email"::text) LIKE UPPER('abc%') and
+# name__icontains -> UPPER("name"::text) LIKE UPPER('%abc%'). The trigram
+# extension comes from migration 0005.
+FORWARD_SQL = [
+    "CREATE INDEX users_email_upper_prefix_idx ON users (UPPER(email::text) text_pattern_ops);",
+    "CREATE INDEX users_name_upper_trgm_idx ON users USING gin (UPPER(name::text) gin_trgm_ops);",
+]
+
+BACKWARD_SQL = [
+    "DROP INDEX IF EXISTS users_name_upper_trgm_idx;",
+    "DROP INDEX IF EXISTS users_email_upper_prefix_idx;",
+]
+
+
+def _run_on_postgres(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_add_owner_application_claims'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['created_at', 'id'], name='users_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['role', 'created_at', 'id'], name='users_role_created_idx'),
+        ),
+        migrations.RunPython(_run_on_postgres(FORWARD_SQL), _run_on_postgres(BACKWARD_SQL)),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-17 17:43
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_cover_photo_variants(apps, schema_editor):
+    Restaurant = apps.get_model('core', 'Restaurant')
+    RestaurantPhoto = apps.get_model('core', 'RestaurantPhoto')
+    cover = RestaurantPhoto.objects.filter(restaurant=OuterRef('pk')).order_by('order', 'id')
+    Restaurant.objects.filter(pk__in=RestaurantPhoto.objects.values('restaurant_id')).update(
+        cover_photo_variants=Subquery(cover.values('variants')[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_add_user_directory_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='restaurant',
+            name='cover_photo_variants',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+        migrations.RunPython(backfill_cover_photo_variants, migrations.RunPython.noop),
+    ]
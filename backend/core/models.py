@@ -1,7 +1,11 @@
 from django.db import models
+from django.utils import timezone
+from django.contrib.postgres.search import SearchVectorField
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.core.validators import URLValidator
 
+from .geo import encode_geohash
+
 
 class UserManager(BaseUserManager):
     def create_user(self, email, password=None, **extra_fields):
@@ -35,6 +39,9 @@ class User(AbstractUser):
     email = models.EmailField(unique=True)
     phone = models.CharField(max_length=20, blank=True)
     role = models.CharField(max_length=20, choices=Role.choices, default=Role.USER)
+    # Copied into every JWT; bumped whenever a claim below changes, which revokes
+    # access tokens issued before the change (see core.authentication)
+    token_version = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -42,13 +49,39 @@ class User(AbstractUser):
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['name']
+    TOKEN_CLAIM_FIELDS = ('role', 'is_active')
 
     class Meta:
         db_table = 'users'
+        indexes = [
+            # Superadmin directory: keyset pagination on (-created_at, -id), optionally within a role.
+            # Search indexes on email/name are Postgres expression indexes (migration 0014).
+            models.Index(fields=['created_at', 'id'], name='users_created_id_idx'),
+            models.Index(fields=['role', 'created_at', 'id'], name='users_role_created_idx'),
+        ]
 
     def __str__(self):
         return self.email
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_claims = {
+            name: value for name, value in zip(field_names, values) if name in cls.TOKEN_CLAIM_FIELDS
+        }
+        return instance
+
+    def save(self, *args, **kwargs):
+        loaded = getattr(self, '_loaded_claims', {})
+        if any(getattr(self, name) != value for name, value in loaded.items()):
+            self.token_version += 1
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'token_version'}
+        super().save(*args, **kwargs)
+        # Also for instances created here rather than loaded, so their next claim change bumps the version
+        deferred = self.get_deferred_fields()
+        self._loaded_claims = {name: getattr(self, name) for name in self.TOKEN_CLAIM_FIELDS if name not in deferred}
+
 
 class ApplicationStatus(models.TextChoices):
     PENDING = 'PENDING', 'Pending'
@@ -103,9 +136,30 @@ class OwnerApplication(models.Model):
     reviewed_at = models.DateTimeField(null=True, blank=True)
     submitted_at = models.DateTimeField(auto_now_add=True)
 
+    # Review lease (core.views.admin_views): the admin working on a PENDING application, until claim_expires_at
+    claimed_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='claimed_applications'
+    )
+    claim_expires_at = models.DateTimeField(null=True, blank=True)
+
     class Meta:
         db_table = 'owner_applications'
         ordering = ['-submitted_at']
+        indexes = [
+            # Admin queue: status filter + keyset pagination on (-submitted_at, -id)
+            models.Index(fields=['status', 'submitted_at', 'id'], name='owner_apps_status_queue_idx'),
+            # Unfiltered history, newest first
+            models.Index(fields=['submitted_at', 'id'], name='owner_apps_submitted_idx'),
+            # The pending queue stays small while reviewed rows pile up
+            models.Index(
+                fields=['submitted_at', 'id'], name='owner_apps_pending_idx',
+                condition=models.Q(status=ApplicationStatus.PENDING),
+            ),
+        ]
 
     def __str__(self):
         return f'{self.restaurant_name} ({self.status})'
@@ -133,6 +187,8 @@ class Restaurant(models.Model):
     google_maps_link = models.URLField(max_length=500, validators=[URLValidator()])
     latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
     longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+    # Derived from latitude/longitude in save(); prefix-searched by core.geo.filter_near
+    geohash = models.CharField(max_length=12, blank=True, db_index=True, editable=False)
     operating_hours = models.CharField(max_length=255, blank=True)
     phone = models.CharField(max_length=20, blank=True)
     status = models.CharField(
@@ -141,13 +197,36 @@ class Restaurant(models.Model):
         default=RestaurantStatus.ACTIVE
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    # Also touched when a photo is added/changed/removed (core.signals); drives ETag/Last-Modified
+    updated_at = models.DateTimeField(auto_now=True)
+    # Weighted name/city/address document; maintained by a Postgres trigger (see core.search)
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Denormalized from photos for browse cards (first photo by order, id); kept in sync by core.signals
+    cover_photo_url = models.URLField(max_length=500, blank=True, editable=False)
+    # The cover's RestaurantPhoto.variants, so browse cards get resized images too
+    cover_photo_variants = models.JSONField(default=list, blank=True, editable=False)
+    photo_count = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         db_table = 'restaurants'
+        indexes = [
+            # Public browse: status filter + keyset pagination on (name, id)
+            models.Index(fields=['status', 'name', 'id'], name='restaurants_status_name_id_idx'),
+        ]
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        if self.latitude is not None and self.longitude is not None:
+            self.geohash = encode_geohash(self.latitude, self.longitude)
+        else:
+            self.geohash = ''
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'latitude', 'longitude'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'geohash'}
+        super().save(*args, **kwargs)
+
 
 class RestaurantPhoto(models.Model):
     """Photos for a restaurant: carousel, menu, kitchen, dining, etc. Caption = Storefront, Dining, Kitchen, Menu, Other."""
@@ -155,6 +234,9 @@ class RestaurantPhoto(models.Model):
     image_url = models.URLField(max_length=500)
     caption = models.CharField(max_length=100, blank=True)  # e.g. Storefront, Dining, Kitchen, Menu
     order = models.PositiveIntegerField(default=0)
+    # Resized copies written by the image_derivatives job: [{'width', 'format', 'url'}, ...]
+    variants = models.JSONField(default=list, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         db_table = 'restaurant_photos'
@@ -162,3 +244,71 @@ class RestaurantPhoto(models.Model):
 
     def __str__(self):
         return f'{self.restaurant.name} - {self.caption or "Photo"}'
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        if 'image_url' in field_names:
+            instance._loaded_image_url = values[field_names.index('image_url')]
+        return instance
+
+    def image_url_changed(self):
+        """Whether saving writes a different image_url than was loaded (always, for unloaded instances)."""
+        if 'image_url' in self.get_deferred_fields():
+            return False
+        return self.image_url != getattr(self, '_loaded_image_url', None)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        if 'image_url' not in self.get_deferred_fields() and (update_fields is None or 'image_url' in update_fields):
+            self._loaded_image_url = self.image_url
+
+
+class UploadedObject(models.Model):
+    """Index of stored uploads by content hash, so identical files are stored once per backend."""
+    backend = models.CharField(max_length=100)  # settings.STORAGE_BACKEND at upload time
+    sha256 = models.CharField(max_length=64)
+    object_path = models.CharField(max_length=255)
+    url = models.URLField(max_length=500)
+    size = models.BigIntegerField()
+    content_type = models.CharField(max_length=100)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'uploaded_objects'
+        constraints = [
+            models.UniqueConstraint(fields=['backend', 'sha256'], name='uploaded_objects_backend_sha256_uniq'),
+        ]
+
+    def __str__(self):
+        return self.object_path
+
+
+class JobStatus(models.TextChoices):
+    PENDING = 'PENDING', 'Pending'
+    RUNNING = 'RUNNING', 'Running'
+    DONE = 'DONE', 'Done'
+    FAILED = 'FAILED', 'Failed'
+
+
+class BackgroundJob(models.Model):
+    """Unit of work for the DB-backed job queue (core.jobs); run by `manage.py run_jobs`."""
+    kind = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict)
+    status = models.CharField(max_length=20, choices=JobStatus.choices, default=JobStatus.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'background_jobs'
+        indexes = [
+            models.Index(fields=['status', 'run_after'], name='background_jobs_due_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.kind} #{self.pk} ({self.status})'
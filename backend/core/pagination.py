@@ -0,0 +1,217 @@
+import base64
+import binascii
+import datetime
+import decimal
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def estimate_count(queryset):
+    """
+    (row count, is_estimate) for `queryset`. On PostgreSQL this is the
+    planner's row estimate from EXPLAIN, which costs no scan but can be far off
+    for selective filters; elsewhere it is an exact COUNT(*).
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count(), False
+    sql, params = queryset.order_by().query.get_compiler(connection=connection).as_sql()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows']), True
+
+
+def _encode_value(value):
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    raise TypeError(f'Cannot encode {type(value).__name__} in a cursor.')
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opaque cursor pagination over a unique ordering, e.g. ('name', 'id').
+
+    The cursor holds the ordering values of the boundary row, so each page is a
+    range scan on a matching index and deep pages cost the same as the first.
+    The last ordering field must be unique (normally 'id' / '-id'). Views can
+    swap the ordering per request by defining get_keyset_ordering().
+    """
+    ordering = ('-id',)
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = None  # falls back to settings.API_PAGE_SIZE
+    max_page_size = None  # falls back to settings.API_MAX_PAGE_SIZE
+    invalid_cursor_message = 'Invalid cursor.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self._set_page(list(self._page_queryset(queryset, request, view)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset() for async views; fetches the page with the async ORM."""
+        return self._set_page([row async for row in self._page_queryset(queryset, request, view)])
+
+    def _page_queryset(self, queryset, request, view):
+        """The requested page plus one row (to tell whether there is a next page)."""
+        self.request = request
+        if view is not None and hasattr(view, 'get_keyset_ordering'):
+            self.ordering = tuple(view.get_keyset_ordering())
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.position, self.reverse = self.decode_cursor(request)
+
+        queryset = queryset.order_by(*self.get_ordering(self.reverse))
+        if self.position is not None:
+            try:
+                queryset = queryset.filter(self.keyset_filter(self.position, self.reverse))
+            except (ValueError, TypeError, DjangoValidationError):
+                # Decodable but tampered: values the ordering fields can't hold
+                raise NotFound(self.invalid_cursor_message)
+        return queryset[:self.page_size + 1]
+
+    def _set_page(self, rows):
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if self.reverse:
+            rows.reverse()
+            self.has_next = self.position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.position is not None
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data):
+        return {
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        }
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        default = self.page_size or getattr(settings, 'API_PAGE_SIZE', 20)
+        maximum = self.max_page_size or getattr(settings, 'API_MAX_PAGE_SIZE', 100)
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return min(default, maximum)
+        return max(1, min(size, maximum))
+
+    def get_ordering(self, reverse=False):
+        if not reverse:
+            return self.ordering
+        return tuple(f[1:] if f.startswith('-') else f'-{f}' for f in self.ordering)
+
+    def keyset_filter(self, position, reverse=False):
+        """Rows strictly after `position` in (possibly reversed) ordering."""
+        after = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip('-')
+            descending = field.startswith('-') != reverse
+            after |= equal & Q(**{f'{name}__lt' if descending else f'{name}__gt': value})
+            equal &= Q(**{name: value})
+        return after
+
+    def get_position(self, row):
+        return [getattr(row, field.lstrip('-')) for field in self.ordering]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(self.get_position(self.page[-1]), reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.get_position(self.page[0]), reverse=True)
+
+    def encode_cursor(self, position, reverse):
+        payload = {'p': position}
+        if reverse:
+            payload['r'] = 1
+        raw = json.dumps(payload, default=_encode_value, separators=(',', ':'))
+        token = base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+            payload = json.loads(raw)
+            position = payload['p']
+            reverse = bool(payload.get('r'))
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+
+class RestaurantPagination(KeysetPagination):
+    """Public browse order; backed by the (status, name, id) index on restaurants."""
+    ordering = ('name', 'id')
+
+
+class OwnerApplicationPagination(KeysetPagination):
+    """Admin queue, newest first; backed by the (status, submitted_at, id) indexes on owner_applications."""
+    ordering = ('-submitted_at', '-id')
+
+
+class UserPagination(KeysetPagination):
+    """
+    Superadmin user directory, newest first; backed by the (created_at, id)
+    and (role, created_at, id) indexes on users. ?count=exact adds the total
+    (a COUNT(*) over every match) and ?count=estimate the planner's guess
+    (see estimate_count); without it no count is run at all.
+    """
+    ordering = ('-created_at', '-id')
+    count_query_param = 'count'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = self.count_is_estimate = None
+        mode = request.query_params.get(self.count_query_param, '')
+        if mode == 'exact':
+            self.count, self.count_is_estimate = queryset.count(), False
+        elif mode == 'estimate':
+            self.count, self.count_is_estimate = estimate_count(queryset)
+        elif mode:
+            raise ValidationError({self.count_query_param: 'Expected "exact" or "estimate".'})
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_data(self, data):
+        paginated = super().get_paginated_data(data)
+        if self.count is not None:
+            paginated = {'count': self.count, 'count_is_estimate': self.count_is_estimate, **paginated}
+        return paginated
@@ -0,0 +1,57 @@
+"""
+Restaurant search backends.
+
+On PostgreSQL, restaurants carry a trigger-maintained `search_vector`
+(name weighted A, city B, address C) with a GIN index, plus trigram GIN
+indexes on name and city for typo-tolerant matches (see migration 0005).
+Other databases (SQLite in local dev) fall back to icontains matching with a
+simple field-based score, so callers get the same `rank` annotation either way.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.db.models.functions import Cast
+
+SEARCH_CONFIG = 'simple'
+WORD_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def search_restaurants(queryset, term):
+    """Filter `queryset` to rows matching `term`, annotated with a float `rank` (higher is better)."""
+    if connection.vendor == 'postgresql':
+        return _postgres_search(queryset, term)
+    return _fallback_search(queryset, term)
+
+
+def _prefix_tsquery(term):
+    """'pizza hut' -> 'pizza:* & hut:*' so partially typed words still match."""
+    return ' & '.join(f'{word}:*' for word in WORD_RE.findall(term.lower()))
+
+
+def _postgres_search(queryset, term):
+    from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+
+    matches = Q(name__trigram_similar=term) | Q(city__trigram_similar=term)
+    rank = TrigramSimilarity('name', term)
+    raw_query = _prefix_tsquery(term)
+    if raw_query:
+        query = SearchQuery(raw_query, config=SEARCH_CONFIG, search_type='raw')
+        matches |= Q(search_vector=query)
+        rank = rank + SearchRank(F('search_vector'), query)
+    # float8 so the rank survives a keyset cursor round-trip exactly
+    return queryset.filter(matches).annotate(rank=Cast(rank, FloatField()))
+
+
+def _fallback_search(queryset, term):
+    return queryset.filter(
+        Q(name__icontains=term) |
+        Q(address__icontains=term) |
+        Q(city__icontains=term)
+    ).annotate(rank=Case(
+        When(name__istartswith=term, then=Value(1.0)),
+        When(name__icontains=term, then=Value(0.8)),
+        When(city__icontains=term, then=Value(0.4)),
+        default=Value(0.2),
+        output_field=FloatField(),
+    ))
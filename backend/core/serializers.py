@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from .fieldsets import SparseFieldsetsMixin
+from .images import srcsets
 from .models import OwnerApplication, Restaurant, RestaurantPhoto, Role
 
 User = get_user_model()
@@ -8,14 +10,21 @@ User = get_user_model()
 ASSIGNABLE_ROLES = [Role.USER, Role.OWNER, Role.AUDITOR, Role.ADMIN]
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ('id', 'name', 'email', 'phone', 'role', 'is_active', 'created_at')
         read_only_fields = ('id', 'role', 'is_active', 'created_at')
 
 
-class SuperAdminUserListSerializer(serializers.ModelSerializer):
+class UserSummarySerializer(serializers.ModelSerializer):
+    """Embedded user for ?expand= on related fields."""
+    class Meta:
+        model = User
+        fields = ('id', 'name', 'email')
+
+
+class SuperAdminUserListSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ('id', 'name', 'email', 'phone', 'role', 'is_active', 'created_at')
@@ -43,7 +52,7 @@ class SuperAdminUserCreateSerializer(serializers.ModelSerializer):
         )
 
 
-class SuperAdminUserUpdateSerializer(serializers.ModelSerializer):
+class SuperAdminUserUpdateSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ('name', 'email', 'phone', 'role', 'is_active')
@@ -71,7 +80,7 @@ class UserRegisterSerializer(serializers.ModelSerializer):
         return user
 
 
-class OwnerApplicationSerializer(serializers.ModelSerializer):
+class OwnerApplicationSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     user_email = serializers.EmailField(source='user.email', read_only=True)
     user_name = serializers.CharField(source='user.name', read_only=True)
     proof_document_url = serializers.URLField(required=False, allow_blank=True)
@@ -94,6 +103,7 @@ class OwnerApplicationSerializer(serializers.ModelSerializer):
             'status', 'review_notes', 'reviewed_by', 'reviewed_at', 'submitted_at',
         )
         read_only_fields = ('id', 'user', 'status', 'review_notes', 'reviewed_by', 'reviewed_at', 'submitted_at')
+        expandable_fields = {'user': (UserSummarySerializer, {}), 'reviewed_by': (UserSummarySerializer, {})}
 
     def validate(self, data):
         if not data.get('declaration_accepted'):
@@ -117,7 +127,7 @@ class OwnerApplicationSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class OwnerApplicationListSerializer(serializers.ModelSerializer):
+class OwnerApplicationListSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     user_email = serializers.EmailField(source='user.email', read_only=True)
     user_name = serializers.CharField(source='user.name', read_only=True)
 
@@ -125,22 +135,44 @@ class OwnerApplicationListSerializer(serializers.ModelSerializer):
         model = OwnerApplication
         fields = (
             'id', 'user', 'user_email', 'user_name', 'restaurant_name', 'city',
-            'status', 'submitted_at', 'reviewed_at',
+            'status', 'submitted_at', 'reviewed_at', 'claimed_by', 'claim_expires_at',
         )
+        expandable_fields = {'user': (UserSummarySerializer, {})}
 
 
 class AdminApproveRejectSerializer(serializers.Serializer):
     review_notes = serializers.CharField(required=False, allow_blank=True)
 
 
-class RestaurantPhotoSerializer(serializers.ModelSerializer):
+class BulkReviewSerializer(serializers.Serializer):
+    action = serializers.ChoiceField(choices=('approve', 'reject'))
+    ids = serializers.ListField(child=serializers.IntegerField(), min_length=1, max_length=500)
+    review_notes = serializers.CharField(required=False, allow_blank=True, default='')
+
+
+class ReviewClaimSerializer(serializers.Serializer):
+    count = serializers.IntegerField(min_value=1, max_value=50, default=10)
+
+
+class ReviewClaimIdsSerializer(serializers.Serializer):
+    """Applications to renew or release; all of the admin's claims when omitted."""
+    ids = serializers.ListField(child=serializers.IntegerField(), required=False, max_length=500)
+
+
+class RestaurantPhotoSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
+    """variants: srcset strings per format, e.g. {'webp': '<url> 320w, <url> 800w'}; {} until generated."""
+    variants = serializers.SerializerMethodField()
+
     class Meta:
         model = RestaurantPhoto
-        fields = ('id', 'restaurant', 'image_url', 'caption', 'order')
+        fields = ('id', 'restaurant', 'image_url', 'caption', 'order', 'variants')
         read_only_fields = ('id', 'restaurant')
 
+    def get_variants(self, obj):
+        return srcsets(obj.variants)
+
 
-class RestaurantSerializer(serializers.ModelSerializer):
+class RestaurantSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     latitude = serializers.DecimalField(
         max_digits=9, decimal_places=6, allow_null=True, required=False
     )
@@ -158,6 +190,7 @@ class RestaurantSerializer(serializers.ModelSerializer):
             'latitude', 'longitude', 'operating_hours', 'phone', 'status', 'created_at', 'photos'
         )
         read_only_fields = ('id', 'owner', 'status', 'created_at')
+        expandable_fields = {'owner': (UserSummarySerializer, {})}
 
     photos = RestaurantPhotoSerializer(many=True, read_only=True)
 
@@ -179,13 +212,43 @@ class RestaurantSerializer(serializers.ModelSerializer):
         return super().to_internal_value(data)
 
 
-class RestaurantPublicSerializer(serializers.ModelSerializer):
-    """Public list/detail for browse; no owner."""
+class RestaurantListItemSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
+    """
+    Public browse card: cover photo and count instead of nested photos (see
+    RestaurantPublicSerializer). cover_photo_variants has the cover's srcsets,
+    like RestaurantPhotoSerializer.variants.
+    """
+    cover_photo_variants = serializers.SerializerMethodField()
+    distance_km = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Restaurant
+        fields = (
+            'id', 'name', 'address', 'city', 'google_maps_link',
+            'latitude', 'longitude', 'operating_hours', 'phone',
+            'cover_photo_url', 'cover_photo_variants', 'photo_count', 'distance_km'
+        )
+
+    def get_cover_photo_variants(self, obj):
+        return srcsets(obj.cover_photo_variants)
+
+    def get_distance_km(self, obj):
+        distance = getattr(obj, 'distance_km', None)
+        return round(distance, 3) if distance is not None else None
+
+
+class RestaurantPublicSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
+    """Public list/detail for browse; no owner. distance_km is set only for ?near= queries."""
     photos = RestaurantPhotoSerializer(many=True, read_only=True)
+    distance_km = serializers.SerializerMethodField()
 
     class Meta:
         model = Restaurant
         fields = (
             'id', 'name', 'address', 'city', 'google_maps_link',
-            'latitude', 'longitude', 'operating_hours', 'phone', 'photos'
+            'latitude', 'longitude', 'operating_hours', 'phone', 'photos', 'distance_km'
         )
+
+    def get_distance_km(self, obj):
+        distance = getattr(obj, 'distance_km', None)
+        return round(distance, 3) if distance is not None else None
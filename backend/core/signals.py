@@ -0,0 +1,64 @@
+from django.db import transaction
+from django.db.models import Count, JSONField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .authentication import forget_token_state
+from .cache import bump_restaurant_version
+from .jobs import enqueue
+from .models import Restaurant, RestaurantPhoto, User
+
+
+def _bump_on_commit(restaurant_id):
+    # After commit, so a concurrent reader can't cache pre-commit data under the new version.
+    transaction.on_commit(lambda: bump_restaurant_version(restaurant_id))
+
+
+@receiver(post_save, sender=Restaurant)
+@receiver(post_delete, sender=Restaurant)
+def restaurant_changed(sender, instance, **kwargs):
+    _bump_on_commit(instance.pk)
+
+
+def sync_photo_summary(restaurant_id):
+    """
+    Recompute Restaurant.cover_photo_url/cover_photo_variants/photo_count in one
+    UPDATE and touch updated_at. Also runs when the variants job saves a photo.
+    """
+    photos = RestaurantPhoto.objects.filter(restaurant=OuterRef('pk'))
+    cover = photos.order_by('order', 'id')
+    Restaurant.objects.filter(pk=restaurant_id).update(
+        cover_photo_url=Coalesce(Subquery(cover.values('image_url')[:1]), Value('')),
+        cover_photo_variants=Coalesce(Subquery(cover.values('variants')[:1]), Value([], output_field=JSONField())),
+        photo_count=Coalesce(
+            Subquery(photos.order_by().values('restaurant').annotate(n=Count('id')).values('n')), Value(0)
+        ),
+        updated_at=timezone.now(),
+    )
+
+
+@receiver(post_save, sender=RestaurantPhoto)
+@receiver(post_delete, sender=RestaurantPhoto)
+def restaurant_photo_changed(sender, instance, **kwargs):
+    # Photos are part of the restaurant's public representation, so they move its updated_at too.
+    sync_photo_summary(instance.restaurant_id)
+    _bump_on_commit(instance.restaurant_id)
+
+
+@receiver(post_save, sender=RestaurantPhoto)
+def enqueue_photo_variants(sender, instance, created, update_fields=None, **kwargs):
+    # Only a new image needs new variants: caption/order edits and the job's own save
+    # (update_fields=['variants', ...]) must not queue a regenerate.
+    if update_fields is not None and 'image_url' not in update_fields:
+        return
+    if created or instance.image_url_changed():
+        enqueue('image_derivatives', photo_id=instance.pk)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    # Cheap enough to do on every save; only claim changes actually move token_version.
+    transaction.on_commit(lambda: forget_token_state(instance.pk))
@@ -0,0 +1,419 @@
+"""
+Object storage for uploaded files.
+
+STORAGE_BACKEND selects the implementation:
+- core.storage.SupabaseStorage (default): Supabase Storage over one
+  requests.Session per process. Its keep-alive pool is sized to the worker's
+  thread count. Every call has connect/read timeouts, and idempotent requests
+  (GET/HEAD/PUT/DELETE) retry with exponential backoff. Uploads use POST,
+  which is never retried automatically.
+- core.storage.LocalStorage: files under MEDIA_ROOT served from MEDIA_URL,
+  for local development and tests without network access.
+
+upload_many() transfers several files concurrently on a shared, bounded
+thread pool. store_uploads() adds content addressing on top: objects are keyed
+by SHA-256, and content already listed in the UploadedObject index is never
+transferred again.
+
+Async views (core.views.async_views) use astore_upload() and
+StorageBackend.aupload(). SupabaseStorage streams the upload on an
+httpx.AsyncClient with one connection pool per event loop, so a request
+waiting on storage holds no thread. Other backends, or a missing httpx, run
+the sync upload in a worker thread.
+"""
+import asyncio
+import hashlib
+import os
+import shutil
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils.module_loading import import_string
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # optional; async uploads fall back to a thread
+    httpx = None
+
+# Bytes read from an uploaded file per write to storage
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+_session = None
+_backend = None
+_executor = None
+_lock = threading.Lock()
+_async_clients = weakref.WeakKeyDictionary()
+
+
+class StorageError(Exception):
+    """Storage rejected a request or could not be reached."""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class StorageNotConfigured(StorageError):
+    pass
+
+
+class ChunkedFileReader:
+    """
+    File-like view over an UploadedFile that never hands out more than
+    chunk_size bytes per read(). Passing it as `data=` makes requests send a
+    Content-Length body read chunk by chunk, instead of one bytes object
+    holding the whole file. tell()/seek() let urllib3 rewind it on retries.
+    """
+
+    def __init__(self, file, chunk_size=UPLOAD_CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._file.seek(0)
+
+    def __len__(self):
+        return self._file.size
+
+    def __iter__(self):
+        return iter(lambda: self.read(self._chunk_size), b'')
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self._chunk_size:
+            size = self._chunk_size
+        return self._file.read(size)
+
+    def tell(self):
+        return self._file.tell()
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self._file.seek(offset, whence)
+
+
+def _build_session():
+    retry = Retry(
+        total=getattr(settings, 'STORAGE_MAX_RETRIES', 3),
+        backoff_factor=getattr(settings, 'STORAGE_RETRY_BACKOFF', 0.3),
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'}),
+        raise_on_status=False,
+    )
+    pool_size = getattr(settings, 'STORAGE_POOL_SIZE', 2)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=False, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session():
+    """The process-wide storage session (created on first use in each worker)."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def _timeout():
+    return (
+        getattr(settings, 'STORAGE_CONNECT_TIMEOUT', 5.0),
+        getattr(settings, 'STORAGE_READ_TIMEOUT', 60.0),
+    )
+
+
+def get_async_client():
+    """The storage httpx.AsyncClient for the running event loop (one pool per loop)."""
+    if httpx is None:
+        raise StorageNotConfigured('httpx is required for the async storage client.')
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        connect_timeout, read_timeout = _timeout()
+        max_connections = getattr(settings, 'STORAGE_ASYNC_MAX_CONNECTIONS', 100)
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            # Only failed connection attempts are retried, so POST stays safe
+            transport=httpx.AsyncHTTPTransport(
+                retries=getattr(settings, 'STORAGE_MAX_RETRIES', 3),
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            ),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def _aread_chunks(file, chunk_size=UPLOAD_CHUNK_SIZE):
+    # Upload bodies are already buffered locally by the server (memory or a temp file)
+    file.seek(0)
+    for chunk in iter(lambda: file.read(chunk_size), b''):
+        yield chunk
+
+
+class StorageBackend:
+    """Interface for storage backends; object paths look like 'pdf/<name>'."""
+
+    def upload(self, object_path, file, content_type):
+        """Store `file` (an UploadedFile) at `object_path`; returns its public URL."""
+        raise NotImplementedError
+
+    async def aupload(self, object_path, file, content_type):
+        """Async upload(); runs the sync one in a worker thread unless overridden."""
+        return await sync_to_async(self.upload, thread_sensitive=False)(object_path, file, content_type)
+
+    def delete(self, object_path):
+        """Remove the object; deleting a missing object is not an error."""
+        raise NotImplementedError
+
+    def url(self, object_path):
+        raise NotImplementedError
+
+    def owns_url(self, url):
+        """Whether `url` points into this backend's public storage."""
+        return url.startswith(self.url(''))
+
+
+class SupabaseStorage(StorageBackend):
+    """Supabase Storage 'media' bucket over the shared pooled session."""
+
+    def _config(self):
+        supabase_url = getattr(settings, 'SUPABASE_URL', None)
+        supabase_key = getattr(settings, 'SUPABASE_SERVICE_KEY', None)
+        bucket = getattr(settings, 'SUPABASE_MEDIA_BUCKET', 'media')
+        if not supabase_url or not supabase_key:
+            raise StorageNotConfigured('Supabase storage is not configured on the server.')
+        return supabase_url.rstrip('/'), supabase_key, bucket
+
+    def _request(self, method, url, **kwargs):
+        try:
+            return get_session().request(method, url, timeout=_timeout(), **kwargs)
+        except requests.RequestException as exc:
+            raise StorageError(f'Error contacting storage: {exc}') from exc
+
+    def url(self, object_path):
+        supabase_url, _, bucket = self._config()
+        return f'{supabase_url}/storage/v1/object/public/{bucket}/{object_path}'
+
+    def _upload_request(self, object_path, content_type):
+        """(url, headers) for storing an object."""
+        supabase_url, supabase_key, bucket = self._config()
+        return f'{supabase_url}/storage/v1/object/{bucket}/{object_path}', {
+            'Authorization': f'Bearer {supabase_key}',
+            'apikey': supabase_key,
+            'Content-Type': content_type,
+            # Paths are content-addressed, so overwriting an existing object is a no-op
+            'x-upsert': 'true',
+        }
+
+    def upload(self, object_path, file, content_type):
+        url, headers = self._upload_request(object_path, content_type)
+        resp = self._request('POST', url, headers=headers, data=ChunkedFileReader(file))
+        if resp.status_code not in (200, 201):
+            raise StorageError('Upload to storage failed.', status_code=resp.status_code)
+        # Public URL for the stored object (bucket must be public in Supabase)
+        return self.url(object_path)
+
+    async def aupload(self, object_path, file, content_type):
+        if httpx is None:
+            return await super().aupload(object_path, file, content_type)
+        url, headers = self._upload_request(object_path, content_type)
+        # An explicit Content-Length keeps httpx from switching to chunked encoding
+        headers['Content-Length'] = str(file.size)
+        try:
+            resp = await get_async_client().post(url, headers=headers, content=_aread_chunks(file))
+        except httpx.HTTPError as exc:
+            raise StorageError(f'Error contacting storage: {exc}') from exc
+        if resp.status_code not in (200, 201):
+            raise StorageError('Upload to storage failed.', status_code=resp.status_code)
+        return self.url(object_path)
+
+    def delete(self, object_path):
+        supabase_url, supabase_key, bucket = self._config()
+        resp = self._request(
+            'DELETE',
+            f'{supabase_url}/storage/v1/object/{bucket}/{object_path}',
+            headers={'Authorization': f'Bearer {supabase_key}', 'apikey': supabase_key},
+        )
+        if resp.status_code not in (200, 204, 404):
+            raise StorageError('Delete from storage failed.', status_code=resp.status_code)
+
+
+class LocalStorage(StorageBackend):
+    """Files under MEDIA_ROOT; URLs are STORAGE_PUBLIC_BASE_URL + MEDIA_URL + path."""
+
+    def _path(self, object_path):
+        root = os.path.realpath(settings.MEDIA_ROOT)
+        path = os.path.realpath(os.path.join(root, object_path))
+        if os.path.commonpath([root, path]) != root:
+            raise StorageError('Invalid object path.')
+        return path
+
+    def url(self, object_path):
+        base = getattr(settings, 'STORAGE_PUBLIC_BASE_URL', 'http://127.0.0.1:8000/')
+        media_url = settings.MEDIA_URL.lstrip('/')
+        return urljoin(urljoin(base.rstrip('/') + '/', media_url.rstrip('/') + '/'), object_path)
+
+    def upload(self, object_path, file, content_type):
+        path = self._path(object_path)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as out:
+                shutil.copyfileobj(ChunkedFileReader(file), out, UPLOAD_CHUNK_SIZE)
+        except OSError as exc:
+            raise StorageError(f'Error writing to local storage: {exc}') from exc
+        return self.url(object_path)
+
+    def delete(self, object_path):
+        try:
+            os.remove(self._path(object_path))
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            raise StorageError(f'Error deleting from local storage: {exc}') from exc
+
+
+def get_storage():
+    """The configured StorageBackend instance (settings.STORAGE_BACKEND)."""
+    global _backend
+    if _backend is None:
+        with _lock:
+            if _backend is None:
+                path = getattr(settings, 'STORAGE_BACKEND', 'core.storage.SupabaseStorage')
+                _backend = import_string(path)()
+    return _backend
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'STORAGE_UPLOAD_WORKERS', 4),
+                    thread_name_prefix='storage-upload',
+                )
+    return _executor
+
+
+def upload_many(items):
+    """
+    Upload several files concurrently on the shared thread pool.
+
+    `items` maps a caller key to (object_path, file, content_type). Returns
+    (urls, errors): dicts keyed like `items`, errors holding StorageError.
+    StorageNotConfigured is raised rather than reported per item.
+    """
+    backend = get_storage()
+    futures = {
+        key: _get_executor().submit(backend.upload, object_path, file, content_type)
+        for key, (object_path, file, content_type) in items.items()
+    }
+    urls, errors = {}, {}
+    for key, future in futures.items():
+        try:
+            urls[key] = future.result()
+        except StorageNotConfigured:
+            raise
+        except StorageError as exc:
+            errors[key] = exc
+    return urls, errors
+
+
+def file_sha256(file):
+    """SHA-256 of an uploaded file, read in chunks (for files not hashed while streaming)."""
+    digest = hashlib.sha256()
+    file.seek(0)
+    for chunk in iter(lambda: file.read(UPLOAD_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def store_uploads(items):
+    """
+    Store uploads under content-addressed paths, skipping content already stored.
+
+    `items` maps a caller key to (file, sha256, object_path, content_type), the
+    path being derived from the digest. Returns (urls, errors) like
+    upload_many(). Each distinct digest is transferred at most once; digests
+    already in the UploadedObject index return the recorded URL immediately.
+    """
+    from .models import UploadedObject
+
+    backend_name = getattr(settings, 'STORAGE_BACKEND', 'core.storage.SupabaseStorage')
+    digests = {digest for _, digest, _, _ in items.values()}
+    known = dict(
+        UploadedObject.objects.filter(backend=backend_name, sha256__in=digests).values_list('sha256', 'url')
+    )
+
+    pending = {}
+    for file, digest, object_path, content_type in items.values():
+        if digest not in known and digest not in pending:
+            pending[digest] = (object_path, file, content_type)
+    if len(pending) == 1:
+        digest, (object_path, file, content_type) = next(iter(pending.items()))
+        try:
+            uploaded, failed = {digest: get_storage().upload(object_path, file, content_type)}, {}
+        except StorageNotConfigured:
+            raise
+        except StorageError as exc:
+            uploaded, failed = {}, {digest: exc}
+    else:
+        uploaded, failed = upload_many(pending)
+
+    for digest, url in uploaded.items():
+        object_path, file, content_type = pending[digest]
+        UploadedObject.objects.get_or_create(
+            backend=backend_name,
+            sha256=digest,
+            defaults={'object_path': object_path, 'url': url, 'size': file.size, 'content_type': content_type},
+        )
+    known.update(uploaded)
+
+    urls, errors = {}, {}
+    for key, (_, digest, _, _) in items.items():
+        if digest in known:
+            urls[key] = known[digest]
+        else:
+            errors[key] = failed[digest]
+    return urls, errors
+
+
+async def astore_upload(file, digest, object_path, content_type):
+    """
+    store_uploads() for a single file, for async views: returns its URL or
+    raises StorageError. The index lookup and insert use the async ORM.
+    """
+    from .models import UploadedObject
+
+    backend_name = getattr(settings, 'STORAGE_BACKEND', 'core.storage.SupabaseStorage')
+    known = await UploadedObject.objects.filter(
+        backend=backend_name, sha256=digest,
+    ).values_list('url', flat=True).afirst()
+    if known is not None:
+        return known
+    url = await get_storage().aupload(object_path, file, content_type)
+    await UploadedObject.objects.aget_or_create(
+        backend=backend_name,
+        sha256=digest,
+        defaults={'object_path': object_path, 'url': url, 'size': file.size, 'content_type': content_type},
+    )
+    return url
+
+
+def _reset_after_fork():
+    # A forked worker must not share the parent's sockets or pool threads.
+    global _session, _executor, _lock, _async_clients
+    _session = None
+    _executor = None
+    _lock = threading.Lock()
+    _async_clients = weakref.WeakKeyDictionary()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
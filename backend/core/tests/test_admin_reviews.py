@@ -0,0 +1,201 @@
+import datetime
+
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from core.instrumentation import assert_max_queries, assert_no_n_plus_one
+from core.models import ApplicationStatus, OwnerApplication, Restaurant, Role, User
+
+QUEUE = '/api/admin/owner-applications/'
+
+
+class ReviewTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(email='admin@example.com', password='password123', name='Admin', role=Role.ADMIN)
+        User.objects.create_user(email='other@example.com', password='password123', name='Other', role=Role.ADMIN)
+        self.apps = [self.application(i) for i in range(3)]
+
+    def application(self, i):
+        applicant = User.objects.create_user(email=f'applicant{i}@example.com', password='password123', name=f'Applicant {i}')
+        return OwnerApplication.objects.create(
+            user=applicant, restaurant_name=f'Cafe {i}', business_address='1 Road', city='Pune',
+            google_maps_link='https://maps.google.com/?q=1', contact_person_name=f'Applicant {i}',
+            contact_phone='9999999999', proof_document_url='https://example.com/proof.pdf', declaration_accepted=True,
+        )
+
+    def login(self, email='admin@example.com'):
+        # Through a real access token, so request.user is built from its claims
+        response = self.client.post('/api/auth/login/', {'email': email, 'password': 'password123'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {response.json()["access"]}')
+
+    def claim(self, count):
+        response = self.client.post(f'{QUEUE}claim/', {'count': count}, format='json')
+        self.assertEqual(response.status_code, 200)
+        return [row['id'] for row in response.json()['results']]
+
+
+class ClaimAndDecideTests(ReviewTestCase):
+    def test_claimed_application_can_be_approved(self):
+        self.login()
+        app_id = self.claim(1)[0]
+        response = self.client.patch(f'{QUEUE}{app_id}/approve/', {'review_notes': 'ok'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['application']['reviewed_by'], self.admin.pk)
+
+        app = OwnerApplication.objects.get(pk=app_id)
+        self.assertEqual(app.status, ApplicationStatus.APPROVED)
+        self.assertIsNone(app.claimed_by_id)
+        self.assertEqual(app.user.role, Role.OWNER)
+        self.assertTrue(Restaurant.objects.filter(owner=app.user).exists())
+
+    def test_claims_do_not_overlap(self):
+        self.login()
+        mine = self.claim(2)
+        self.login('other@example.com')
+        self.assertEqual(self.claim(5), [app.pk for app in self.apps if app.pk not in mine])
+
+    def test_application_claimed_by_another_admin_is_conflict(self):
+        self.login('other@example.com')
+        app_id = self.claim(1)[0]
+        self.login()
+        response = self.client.patch(f'{QUEUE}{app_id}/reject/', {}, format='json')
+        self.assertEqual(response.status_code, 409)
+        self.assertIsNotNone(response.json()['claim_expires_at'])
+        self.assertEqual(OwnerApplication.objects.get(pk=app_id).status, ApplicationStatus.PENDING)
+
+    def test_decided_application_is_bad_request(self):
+        self.login()
+        app_id = self.apps[0].pk
+        self.assertEqual(self.client.patch(f'{QUEUE}{app_id}/reject/', {}, format='json').status_code, 200)
+        response = self.client.patch(f'{QUEUE}{app_id}/approve/', {}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['detail'], 'Application is already REJECTED.')
+
+
+class BulkReviewTests(ReviewTestCase):
+    def bulk(self, action, ids):
+        response = self.client.post(f'{QUEUE}bulk-review/', {'action': action, 'ids': ids}, format='json')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_own_claims_are_bulk_approved(self):
+        self.login()
+        ids = self.claim(3)
+        body = self.bulk('approve', ids)
+        self.assertEqual((body['decided'], body['skipped']), (3, 0))
+        self.assertEqual([row['result'] for row in body['results']], ['approved'] * 3)
+        self.assertTrue(all('restaurant' in row for row in body['results']))
+        self.assertEqual(Restaurant.objects.count(), 3)
+        self.assertFalse(OwnerApplication.objects.filter(claimed_by__isnull=False).exists())
+        self.assertEqual(set(User.objects.filter(role=Role.OWNER).values_list('email', flat=True)),
+                         {f'applicant{i}@example.com' for i in range(3)})
+
+    def test_skip_results(self):
+        self.login('other@example.com')
+        claimed = self.claim(1)[0]
+        self.login()
+        decided = self.apps[1].pk
+        self.bulk('reject', [decided])
+        open_id = self.apps[2].pk
+
+        body = self.bulk('approve', [claimed, decided, open_id, 999999])
+        self.assertEqual((body['decided'], body['skipped']), (1, 3))
+        self.assertEqual(body['results'][:2], [
+            {'id': claimed, 'result': 'skipped', 'detail': 'Another admin is reviewing this application.'},
+            {'id': decided, 'result': 'skipped', 'detail': 'Application is already REJECTED.'},
+        ])
+        self.assertEqual(body['results'][2]['result'], 'approved')
+        self.assertEqual(body['results'][3], {'id': 999999, 'result': 'skipped', 'detail': 'Not found.'})
+        self.assertEqual(OwnerApplication.objects.get(pk=claimed).status, ApplicationStatus.PENDING)
+
+    def test_applicant_with_restaurant_is_skipped(self):
+        self.login()
+        self.assertEqual(self.client.patch(f'{QUEUE}{self.apps[0].pk}/approve/', {}, format='json').status_code, 200)
+        second = OwnerApplication.objects.create(
+            user=self.apps[0].user, restaurant_name='Second', business_address='2 Road', city='Pune',
+            google_maps_link='https://maps.google.com/?q=2', contact_person_name='Applicant 0',
+            contact_phone='9999999999', declaration_accepted=True,
+        )
+        body = self.bulk('approve', [second.pk])
+        self.assertEqual(body['results'], [
+            {'id': second.pk, 'result': 'skipped', 'detail': 'Applicant already owns a restaurant.'},
+        ])
+
+
+class QueueFilterTests(ReviewTestCase):
+    def setUp(self):
+        super().setUp()
+        mumbai = self.application(3)
+        OwnerApplication.objects.filter(pk=mumbai.pk).update(city='Mumbai')
+        self.apps.append(mumbai)
+        OwnerApplication.objects.filter(pk=self.apps[0].pk).update(status=ApplicationStatus.APPROVED)
+        OwnerApplication.objects.filter(pk=self.apps[1].pk).update(status=ApplicationStatus.REJECTED)
+        # One application a day, oldest first
+        start = timezone.make_aware(datetime.datetime(2026, 1, 1, 12))
+        for day, app in enumerate(self.apps):
+            OwnerApplication.objects.filter(pk=app.pk).update(submitted_at=start + datetime.timedelta(days=day))
+        self.login()
+
+    def queue(self, **params):
+        response = self.client.get(QUEUE, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def ids(self, **params):
+        return [row['id'] for row in self.queue(**params)['results']]
+
+    def newest_first(self, *indexes):
+        return [self.apps[i].pk for i in sorted(indexes, reverse=True)]
+
+    def test_unfiltered_queue_is_newest_first(self):
+        self.assertEqual(self.ids(), self.newest_first(0, 1, 2, 3))
+
+    def test_queue_page_is_one_query(self):
+        for i in range(4, 10):
+            self.application(i)
+        self.claim(3)
+        self.queue()  # caches the admin's token state
+        with assert_max_queries(1), assert_no_n_plus_one():
+            self.assertEqual(len(self.queue()['results']), 10)
+
+    def test_status_filter(self):
+        self.assertEqual(self.ids(status='PENDING'), self.newest_first(2, 3))
+        self.assertEqual(self.ids(status='approved,rejected'), self.newest_first(0, 1))
+
+    def test_city_filter_ignores_case(self):
+        self.assertEqual(self.ids(city='mumbai'), self.newest_first(3))
+        self.assertEqual(self.ids(city='PUNE', status='PENDING'), self.newest_first(2))
+
+    def test_submitted_range(self):
+        # submitted_after is inclusive, submitted_before exclusive
+        self.assertEqual(self.ids(submitted_after='2026-01-02', submitted_before='2026-01-04'), self.newest_first(1, 2))
+        self.assertEqual(self.ids(submitted_after='2026-01-03T12:00:00Z'), self.newest_first(2, 3))
+
+    def test_claimed_filter(self):
+        OwnerApplication.objects.filter(pk=self.apps[3].pk).update(
+            claimed_by=self.admin, claim_expires_at=timezone.now() + datetime.timedelta(minutes=5),
+        )
+        self.assertEqual(self.ids(claimed='mine'), self.newest_first(3))
+        self.assertEqual(self.ids(claimed='available', status='PENDING'), self.newest_first(2))
+
+    def test_invalid_filters_are_bad_request(self):
+        for params in ({'status': 'DONE'}, {'submitted_after': 'yesterday'}, {'claimed': 'theirs'}):
+            with self.subTest(**params):
+                self.assertEqual(self.client.get(QUEUE, params).status_code, 400)
+
+    def test_cursor_pages_cover_queue_once(self):
+        seen, url, params = [], QUEUE, {'page_size': 1}
+        while url:
+            page = self.client.get(url, params).json()
+            seen += [row['id'] for row in page['results']]
+            url, params = page['next'], {}
+        self.assertEqual(seen, self.newest_first(0, 1, 2, 3))
+
+    def test_filters_carry_through_cursor_pages(self):
+        first = self.queue(status='PENDING', page_size=1)
+        second = self.client.get(first['next']).json()
+        self.assertEqual([row['id'] for row in first['results'] + second['results']], self.newest_first(2, 3))
+        self.assertIsNone(second['next'])
@@ -0,0 +1,133 @@
+import importlib
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import clear_url_caches, resolve
+
+from core import storage
+from core.models import Restaurant, User
+from core.views.async_views import AsyncFileUploadView, AsyncRestaurantListView
+
+JPEG = b'\xff\xd8\xff\xe0' + b'\x00' * 64
+ASYNC_URLCONFS = ('core.urls.restaurants', 'core.urls.owner', 'config.urls')
+
+
+def reload_urlconfs():
+    # The URL modules pick sync or async views at import time
+    for name in ASYNC_URLCONFS:
+        importlib.reload(importlib.import_module(name))
+    clear_url_caches()
+
+
+@override_settings(ASYNC_VIEWS=True)
+class AsyncViewTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        reload_urlconfs()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        # After the class-level override is undone
+        reload_urlconfs()
+
+    def setUp(self):
+        cache.clear()
+
+    def restaurant(self, name):
+        n = Restaurant.objects.count()
+        owner = User.objects.create_user(email=f'owner{n}@example.com', password='password123', name=f'Owner {n}')
+        return Restaurant.objects.create(
+            owner=owner, name=name, address='1 Road', city='Pune', google_maps_link='https://maps.google.com/?q=1',
+        )
+
+
+class AsyncRestaurantListTests(AsyncViewTestCase):
+    def setUp(self):
+        super().setUp()
+        for i in range(5):
+            self.restaurant(f'Cafe {i // 2}')
+        self.expected = list(Restaurant.objects.order_by('name', 'id').values_list('id', flat=True))
+
+    def test_serves_async_view(self):
+        self.assertIs(resolve('/api/restaurants/').func.view_class, AsyncRestaurantListView)
+
+    async def test_pages_cover_every_row_once(self):
+        seen, url, params = [], '/api/restaurants/', {'page_size': 2}
+        while url:
+            response = await self.async_client.get(url, params)
+            self.assertEqual(response.status_code, 200)
+            page = response.json()
+            seen += [row['id'] for row in page['results']]
+            url, params = page['next'], {}
+        self.assertEqual(seen, self.expected)
+
+    async def test_previous_link(self):
+        first = (await self.async_client.get('/api/restaurants/', {'page_size': 2})).json()
+        second = (await self.async_client.get(first['next'])).json()
+        back = (await self.async_client.get(second['previous'])).json()
+        self.assertEqual(back['results'], first['results'])
+
+    async def test_not_modified(self):
+        first = await self.async_client.get('/api/restaurants/', {'page_size': 2})
+        self.assertEqual(first.status_code, 200)
+        etag = first['ETag']
+        revalidated = await self.async_client.get(
+            '/api/restaurants/', {'page_size': 2}, headers={'If-None-Match': etag},
+        )
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated['ETag'], etag)
+        self.assertEqual(revalidated.content, b'')
+
+    async def test_detail_not_modified(self):
+        url = f'/api/restaurants/{self.expected[0]}/'
+        first = await self.async_client.get(url)
+        self.assertEqual(first.status_code, 200)
+        revalidated = await self.async_client.get(url, headers={'If-None-Match': first['ETag']})
+        self.assertEqual(revalidated.status_code, 304)
+        missing = await self.async_client.get('/api/restaurants/999999/')
+        self.assertEqual(missing.status_code, 404)
+
+
+class AsyncUploadTests(AsyncViewTestCase):
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings = override_settings(STORAGE_BACKEND='core.storage.LocalStorage', MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        backend = mock.patch.object(storage, '_backend', storage.LocalStorage())
+        backend.start()
+        self.addCleanup(backend.stop)
+        User.objects.create_user(email='owner@example.com', password='password123', name='Owner')
+
+    async def login(self):
+        response = await self.async_client.post(
+            '/api/auth/login/', {'email': 'owner@example.com', 'password': 'password123'},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()['access']
+
+    def upload(self, **kwargs):
+        return self.async_client.post('/api/owner/upload/', {'file': SimpleUploadedFile('photo.jpg', JPEG)}, **kwargs)
+
+    def test_serves_async_view(self):
+        self.assertIs(resolve('/api/owner/upload/').func.view_class, AsyncFileUploadView)
+
+    async def test_requires_authentication(self):
+        self.assertEqual((await self.upload()).status_code, 401)
+        response = await self.upload(headers={'Authorization': 'Bearer not-a-token'})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_authenticated_upload_is_stored(self):
+        access = await self.login()
+        response = await self.upload(headers={'Authorization': f'Bearer {access}'})
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(response.json()['url'].endswith('.jpg'))
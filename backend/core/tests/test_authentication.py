@@ -0,0 +1,70 @@
+from django.core.cache import cache
+from django.test import RequestFactory, override_settings
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.authentication import ClaimsJWTAuthentication, token_state
+from core.db_router import ReadRouting, ReplicaRouter
+from core.models import Role, User
+
+
+class ClaimsJWTAuthenticationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='admin@example.com', password='password123', name='Admin', role=Role.ADMIN)
+
+    def login(self):
+        response = self.client.post(
+            '/api/auth/login/', {'email': 'admin@example.com', 'password': 'password123'}, format='json',
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def get_queue(self, access):
+        return self.client.get('/api/admin/owner-applications/', HTTP_AUTHORIZATION=f'Bearer {access}')
+
+    def test_user_built_from_claims_has_typed_pk(self):
+        user = ClaimsJWTAuthentication().get_user(AccessToken(self.login()['access']))
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertIsInstance(user.pk, int)
+        self.assertEqual(user, self.user)
+        self.assertEqual(user.role, Role.ADMIN)
+
+    def test_role_change_revokes_access_token(self):
+        tokens = self.login()
+        self.assertEqual(self.get_queue(tokens['access']).status_code, 200)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.role = Role.USER
+            self.user.save(update_fields=['role'])
+
+        response = self.get_queue(tokens['access'])
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['code'], 'token_revoked')
+
+        refreshed = self.client.post('/api/auth/refresh/', {'refresh': tokens['refresh']}, format='json').json()
+        self.assertEqual(AccessToken(refreshed['access'])['role'], Role.USER)
+        self.assertEqual(self.get_queue(refreshed['access']).status_code, 403)
+
+    def test_deactivation_revokes_access_token(self):
+        access = self.login()['access']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save(update_fields=['is_active'])
+
+        self.assertEqual(self.get_queue(access).status_code, 401)
+
+    def test_unrelated_save_keeps_token_valid(self):
+        access = self.login()['access']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.name = 'Renamed'
+            self.user.save(update_fields=['name'])
+
+        self.assertEqual(self.get_queue(access).status_code, 200)
+
+    @override_settings(DATABASE_REPLICAS=['replica1'])
+    def test_token_state_reads_primary_during_replica_routing(self):
+        # 'replica1' is not a configured connection: a query routed there would fail
+        with ReadRouting(RequestFactory().get('/api/restaurants/')):
+            self.assertEqual(ReplicaRouter().db_for_read(User), 'replica1')
+            self.assertEqual(token_state(self.user.pk), (self.user.token_version, True))
@@ -0,0 +1,72 @@
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from core.models import Restaurant, RestaurantPhoto, User
+
+LIST = '/api/restaurants/'
+
+
+class RestaurantCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        owner = User.objects.create_user(email='owner@example.com', password='password123', name='Owner')
+        self.restaurant = Restaurant.objects.create(
+            owner=owner, name='Cafe', address='1 Road', city='Pune', google_maps_link='https://maps.google.com/?q=1',
+        )
+        self.detail = f'/api/restaurants/{self.restaurant.pk}/'
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def names(self):
+        return [row['name'] for row in self.get(LIST)['results']]
+
+    def test_cache_hit_runs_no_query(self):
+        first = self.get(LIST)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get(LIST), first)
+        etag = self.client.get(LIST)['ETag']
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(LIST, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_restaurant_save_serves_fresh_list_and_detail(self):
+        self.assertEqual(self.names(), ['Cafe'])
+        self.assertEqual(self.get(self.detail)['name'], 'Cafe')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.restaurant.name = 'Corner Cafe'
+            self.restaurant.save()
+
+        self.assertEqual(self.names(), ['Corner Cafe'])
+        self.assertEqual(self.get(self.detail)['name'], 'Corner Cafe')
+
+    def test_restaurant_delete_drops_it_from_list(self):
+        self.assertEqual(self.names(), ['Cafe'])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.restaurant.delete()
+        self.assertEqual(self.names(), [])
+        self.assertEqual(self.client.get(self.detail).status_code, 404)
+
+    def test_photo_add_and_delete_serve_fresh_detail(self):
+        self.assertEqual(self.get(self.detail)['photos'], [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            photo = RestaurantPhoto.objects.create(restaurant=self.restaurant, image_url='https://example.com/a.jpg')
+        self.assertEqual([p['image_url'] for p in self.get(self.detail)['photos']], ['https://example.com/a.jpg'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            photo.delete()
+        self.assertEqual(self.get(self.detail)['photos'], [])
+
+    def test_version_moves_only_after_commit(self):
+        self.assertEqual(self.names(), ['Cafe'])
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.restaurant.name = 'Corner Cafe'
+            self.restaurant.save()
+        # Not yet committed: readers keep the cached payload
+        self.assertEqual(self.names(), ['Cafe'])
+        for callback in callbacks:
+            callback()
+        self.assertEqual(self.names(), ['Corner Cafe'])
@@ -0,0 +1,96 @@
+import gzip
+import json
+from unittest import mock, skipIf
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase
+
+from core import middleware
+from core.middleware import CompressionMiddleware, accepted_encodings
+
+BODY = json.dumps([{'id': i, 'name': f'Restaurant {i}', 'city': 'Pune'} for i in range(100)]).encode()
+
+
+class AcceptedEncodingsTests(SimpleTestCase):
+    def test_q_values(self):
+        self.assertEqual(accepted_encodings('gzip, br;q=0.9, deflate;q=0'), {'gzip', 'br'})
+        self.assertEqual(accepted_encodings('GZIP;q=bad, identity'), {'identity'})
+        self.assertEqual(accepted_encodings(''), set())
+
+
+class CompressionMiddlewareTests(SimpleTestCase):
+    def respond(self, accept_encoding, body=BODY, request_headers=None, **headers):
+        def view(request):
+            response = HttpResponse(body, content_type=headers.pop('content_type', 'application/json'))
+            for name, value in headers.items():
+                response[name] = value
+            return response
+
+        request = RequestFactory().get(
+            '/api/restaurants/', HTTP_ACCEPT_ENCODING=accept_encoding, **(request_headers or {}),
+        )
+        return CompressionMiddleware(view)(request)
+
+    @skipIf(middleware.brotli is None, 'brotli not installed')
+    def test_prefers_brotli(self):
+        response = self.respond('gzip, deflate, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(middleware.brotli.decompress(response.content), BODY)
+        self.assertEqual(response['Content-Length'], str(len(response.content)))
+
+    def test_gzip(self):
+        response = self.respond('gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), BODY)
+
+    def test_credentialed_requests_get_padded_gzip(self):
+        for credentials in ({'HTTP_AUTHORIZATION': 'Bearer token'}, {'HTTP_COOKIE': 'sessionid=abc'}):
+            with self.subTest(credentials=credentials):
+                sizes = set()
+                for _ in range(20):
+                    response = self.respond('gzip, br', request_headers=credentials)
+                    self.assertEqual(response['Content-Encoding'], 'gzip')
+                    self.assertEqual(gzip.decompress(response.content), BODY)
+                    sizes.add(len(response.content))
+                # Random-length padding in the gzip header
+                self.assertGreater(len(sizes), 1)
+
+    def test_credentialed_brotli_only_client_gets_identity(self):
+        response = self.respond('br', request_headers={'HTTP_AUTHORIZATION': 'Bearer token'})
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response.content, BODY)
+
+    def test_gzip_without_brotli(self):
+        with mock.patch.object(middleware, 'brotli', None):
+            response = self.respond('gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
+    def test_identity_fallback(self):
+        for accept in ('', 'identity', 'gzip;q=0, br;q=0'):
+            with self.subTest(accept=accept):
+                response = self.respond(accept)
+                self.assertFalse(response.has_header('Content-Encoding'))
+                self.assertEqual(response.content, BODY)
+                self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_vary(self):
+        response = self.respond('gzip', Vary='Cookie')
+        self.assertEqual(response['Vary'], 'Cookie, Accept-Encoding')
+
+    def test_strong_etag_becomes_weak(self):
+        self.assertEqual(self.respond('gzip', ETag='"abc"')['ETag'], 'W/"abc"')
+        self.assertEqual(self.respond('gzip', ETag='W/"abc"')['ETag'], 'W/"abc"')
+
+    def test_small_response_left_alone(self):
+        response = self.respond('gzip, br', body=b'{"ok": true}')
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertFalse(response.has_header('Vary'))
+
+    def test_already_encoded_left_alone(self):
+        response = self.respond('gzip, br', **{'Content-Encoding': 'identity'})
+        self.assertEqual(response['Content-Encoding'], 'identity')
+        self.assertEqual(response.content, BODY)
+
+    def test_incompressible_type_left_alone(self):
+        response = self.respond('gzip, br', content_type='image/jpeg')
+        self.assertFalse(response.has_header('Content-Encoding'))
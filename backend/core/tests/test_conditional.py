@@ -0,0 +1,97 @@
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from core.models import Restaurant, User
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        owner = User.objects.create_user(email='owner@example.com', password='password123', name='Owner')
+        self.restaurant = Restaurant.objects.create(
+            owner=owner, name='Cafe', address='1 Road', city='Pune', google_maps_link='https://maps.google.com/?q=1',
+        )
+
+    def assert_revalidates(self, url):
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('ETag', first)
+        self.assertIn('Last-Modified', first)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], first['ETag'])
+        self.assertEqual(response['Last-Modified'], first['Last-Modified'])
+
+    def test_list_not_modified_carries_validators(self):
+        self.assert_revalidates('/api/restaurants/')
+
+    def test_detail_not_modified_carries_validators(self):
+        self.assert_revalidates(f'/api/restaurants/{self.restaurant.pk}/')
+
+    def test_stale_etag_gets_full_response(self):
+        url = f'/api/restaurants/{self.restaurant.pk}/'
+        etag = self.client.get(url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.restaurant.name = 'Renamed Cafe'
+            self.restaurant.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['name'], 'Renamed Cafe')
+
+
+class ListValidatorTests(APITestCase):
+    """The list's validators describe the page served; no query beyond the page itself."""
+
+    def setUp(self):
+        cache.clear()
+        self.restaurants = [self.restaurant(name) for name in ('Alpha', 'Bravo', 'Charlie')]
+
+    def restaurant(self, name):
+        owner = User.objects.create_user(email=f'{name.lower()}@example.com', password='password123', name=name)
+        return Restaurant.objects.create(
+            owner=owner, name=name, address='1 Road', city='Pune', google_maps_link='https://maps.google.com/?q=1',
+        )
+
+    def etag(self, url='/api/restaurants/?page_size=2'):
+        cache.clear()
+        return self.client.get(url)['ETag']
+
+    def test_miss_runs_only_the_page_query(self):
+        etag = self.etag()
+        for params in ({}, {'search': 'alpha'}, {'near': '18.5,73.8'}):
+            with self.subTest(**params):
+                cache.clear()
+                with self.assertNumQueries(1):
+                    self.assertEqual(self.client.get('/api/restaurants/', {'page_size': 2, **params}).status_code, 200)
+        cache.clear()
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/restaurants/?page_size=2', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_follows_rows_on_the_page(self):
+        etag = self.etag()
+        # Off the page, and there already was a next page
+        self.restaurant('Zulu')
+        self.assertEqual(self.etag(), etag)
+
+        self.restaurants[1].name = 'Bravo Bistro'
+        self.restaurants[1].save()
+        self.assertNotEqual(self.etag(), etag)
+
+        etag = self.etag()
+        self.restaurants[0].delete()
+        self.assertNotEqual(self.etag(), etag)
+
+    def test_etag_follows_next_page(self):
+        url = '/api/restaurants/?page_size=3'
+        etag = self.etag(url)
+        self.restaurant('Zulu')
+        self.assertNotEqual(self.etag(url), etag)
+
+    def test_sparse_fieldsets_keep_updated_at_loaded(self):
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/restaurants/', {'fields': 'id,name'})
+        self.assertIn('Last-Modified', response)
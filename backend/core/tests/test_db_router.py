@@ -0,0 +1,107 @@
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils.functional import SimpleLazyObject
+
+from core.db_router import ReadRouting, ReplicaRouter, is_read_only_view, pin_to_primary
+from core.middleware import ReplicaRoutingMiddleware
+from core.models import Restaurant, User
+from core.views.restaurant_views import MyRestaurantView, RestaurantListView
+
+router = ReplicaRouter()
+
+
+def read_alias():
+    return router.db_for_read(Restaurant)
+
+
+class ReplicaRouterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(email='owner@example.com', password='password123', name='Owner')
+        self.other = User.objects.create_user(email='other@example.com', password='password123', name='Other')
+
+    def request(self, method='get', user=None):
+        request = getattr(self.factory, method)('/api/restaurants/')
+        request.user = user or AnonymousUser()
+        return request
+
+    def serve(self, request, view, response_status=200):
+        """Run `request` through the middleware to `view`; returns the read alias seen inside."""
+        seen = []
+
+        def get_response(request):
+            seen.append(read_alias())
+            return HttpResponse(status=response_status)
+
+        middleware = ReplicaRoutingMiddleware(get_response)
+        middleware.process_view(request, view.as_view(), (), {})
+        middleware(request)
+        return seen[0]
+
+    def test_read_only_views(self):
+        self.assertTrue(is_read_only_view(RestaurantListView.as_view()))
+        self.assertFalse(is_read_only_view(MyRestaurantView.as_view()))
+
+    def test_without_replicas_everything_uses_default(self):
+        self.assertEqual(self.serve(self.request(), RestaurantListView), 'default')
+        self.assertEqual(router.db_for_write(Restaurant), 'default')
+        self.assertIsNone(router.allow_migrate('default', 'core'))
+
+    @override_settings(DATABASE_REPLICAS=['replica1'])
+    def test_safe_read_only_request_reads_replica(self):
+        self.assertEqual(self.serve(self.request(), RestaurantListView), 'replica1')
+        self.assertEqual(self.serve(self.request(user=self.user), RestaurantListView), 'replica1')
+        # Views that can write stay on the primary even for GET
+        self.assertEqual(self.serve(self.request(user=self.user), MyRestaurantView), 'default')
+        self.assertEqual(router.db_for_write(Restaurant), 'default')
+        self.assertFalse(router.allow_migrate('replica1', 'core'))
+
+    @override_settings(DATABASE_REPLICAS=['replica1'])
+    def test_routing_is_reset_between_requests(self):
+        self.serve(self.request(), RestaurantListView)
+        self.assertEqual(read_alias(), 'default')
+
+        # Also when the view raises
+        request = self.request()
+        middleware = ReplicaRoutingMiddleware(lambda request: 1 / 0)
+        middleware.process_view(request, RestaurantListView.as_view(), (), {})
+        with self.assertRaises(ZeroDivisionError):
+            middleware(request)
+        self.assertEqual(read_alias(), 'default')
+
+    @override_settings(DATABASE_REPLICAS=['replica1'])
+    def test_successful_write_pins_user_to_primary(self):
+        self.serve(self.request('patch', user=self.user), MyRestaurantView)
+        self.assertEqual(self.serve(self.request(user=self.user), RestaurantListView), 'default')
+        # Only the writer is pinned
+        self.assertEqual(self.serve(self.request(user=self.other), RestaurantListView), 'replica1')
+
+    @override_settings(DATABASE_REPLICAS=['replica1'])
+    def test_failed_write_does_not_pin(self):
+        self.serve(self.request('patch', user=self.user), MyRestaurantView, response_status=400)
+        self.assertEqual(self.serve(self.request(user=self.user), RestaurantListView), 'replica1')
+
+    def test_write_without_replicas_does_not_pin(self):
+        self.serve(self.request('patch', user=self.user), MyRestaurantView)
+        with override_settings(DATABASE_REPLICAS=['replica1']):
+            self.assertEqual(self.serve(self.request(user=self.user), RestaurantListView), 'replica1')
+
+    @override_settings(DATABASE_REPLICAS=['replica1'])
+    def test_pin_expires(self):
+        with override_settings(DATABASE_REPLICA_PIN_SECONDS=0):
+            pin_to_primary(self.user.pk)
+        with ReadRouting(self.request(user=self.user)):
+            self.assertEqual(read_alias(), 'replica1')
+
+    @override_settings(DATABASE_REPLICAS=['replica1'])
+    def test_reads_replica_until_user_is_known(self):
+        pin_to_primary(self.user.pk)
+        # AuthenticationMiddleware's lazy user, before DRF has authenticated the request
+        request = self.request(user=SimpleLazyObject(lambda: self.user))
+        with ReadRouting(request):
+            self.assertEqual(read_alias(), 'replica1')
+            request.user = self.user
+            self.assertEqual(read_alias(), 'default')
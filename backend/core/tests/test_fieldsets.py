@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from core.models import Restaurant, RestaurantPhoto, Role, User
+
+LIST = '/api/restaurants/'
+
+
+class SparseFieldsetTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = User.objects.create_user(
+            email='owner@example.com', password='password123', name='Owner', role=Role.OWNER,
+        )
+        self.restaurant = Restaurant.objects.create(
+            owner=self.owner, name='Cafe', address='1 Road', city='Pune',
+            google_maps_link='https://maps.google.com/?q=1',
+        )
+        RestaurantPhoto.objects.create(restaurant=self.restaurant, image_url='https://example.com/a.jpg')
+        self.detail = f'/api/restaurants/{self.restaurant.pk}/'
+
+    def get(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_fields_keeps_only_requested_keys(self):
+        row = self.get(LIST, fields='id,name')['results'][0]
+        self.assertEqual(set(row), {'id', 'name'})
+        self.assertEqual(set(self.get(self.detail, fields='name,photos')), {'name', 'photos'})
+
+    def test_omit_drops_keys(self):
+        full = self.get(self.detail)
+        trimmed = self.get(self.detail, omit='photos,phone')
+        self.assertEqual(set(trimmed), set(full) - {'photos', 'phone'})
+
+    def test_expand_embeds_relation(self):
+        self.client.force_authenticate(self.owner)
+        self.assertEqual(self.get('/api/restaurants/me/')['owner'], self.owner.pk)
+        expanded = self.get('/api/restaurants/me/', expand='owner', fields='id,owner')
+        self.assertEqual(expanded, {
+            'id': self.restaurant.pk,
+            'owner': {'id': self.owner.pk, 'name': 'Owner', 'email': 'owner@example.com'},
+        })
+
+    def test_unknown_names_are_rejected(self):
+        cases = [
+            ('fields', {'fields': 'id,bogus'}),
+            ('omit', {'omit': 'bogus'}),
+            # photos exists but isn't expandable
+            ('expand', {'expand': 'photos'}),
+        ]
+        for param, params in cases:
+            with self.subTest(**params):
+                response = self.client.get(LIST if param != 'expand' else self.detail, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn(param, response.json())
+
+    def test_only_narrows_the_select(self):
+        with CaptureQueriesContext(connection) as full:
+            self.get(LIST)
+        cache.clear()
+        with CaptureQueriesContext(connection) as sparse:
+            self.get(LIST, fields='id,name')
+
+        address = '"restaurants"."address"'
+        self.assertTrue(any(address in query['sql'] for query in full.captured_queries))
+        self.assertFalse(any(address in query['sql'] for query in sparse.captured_queries))
+
+    def test_sparse_detail_skips_photo_prefetch(self):
+        with CaptureQueriesContext(connection) as sparse:
+            self.get(self.detail, fields='id,name')
+        self.assertFalse(any('restaurant_photos' in query['sql'] for query in sparse.captured_queries))
@@ -0,0 +1,89 @@
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from core.instrumentation import NPlusOneDetected, assert_max_queries, assert_no_n_plus_one
+from core.middleware import SQLInstrumentationMiddleware
+from core.models import OwnerApplication, User
+
+
+class InstrumentationTestCase(TestCase):
+    def setUp(self):
+        for i in range(6):
+            applicant = User.objects.create_user(
+                email=f'applicant{i}@example.com', password='password123', name=f'Applicant {i}',
+            )
+            OwnerApplication.objects.create(
+                user=applicant, restaurant_name=f'Cafe {i}', business_address='1 Road', city='Pune',
+                google_maps_link='https://maps.google.com/?q=1', contact_person_name=f'Applicant {i}',
+                contact_phone='9999999999', proof_document_url='https://example.com/proof.pdf',
+                declaration_accepted=True,
+            )
+
+    def n_plus_one(self):
+        """One users query per application: the N+1 the detector is for."""
+        return [app.user.email for app in OwnerApplication.objects.all()]
+
+    def joined(self):
+        return [app.user.email for app in OwnerApplication.objects.select_related('user')]
+
+
+class AssertionHelperTests(InstrumentationTestCase):
+    def test_assert_max_queries(self):
+        with assert_max_queries(1) as recorder:
+            self.joined()
+        self.assertEqual(recorder.count, 1)
+        with self.assertRaisesMessage(AssertionError, '7 queries run, expected at most 1.'):
+            with assert_max_queries(1):
+                self.n_plus_one()
+
+    def test_assert_no_n_plus_one(self):
+        with assert_no_n_plus_one():
+            self.joined()
+        with self.assertRaisesMessage(NPlusOneDetected, '6x SELECT'):
+            with assert_no_n_plus_one():
+                self.n_plus_one()
+
+    def test_shapes_ignore_parameters_and_in_lists(self):
+        with assert_max_queries(2) as recorder:
+            list(User.objects.filter(pk__in=[1, 2]))
+            list(User.objects.filter(pk__in=[3, 4, 5]))
+        self.assertEqual(list(recorder.shapes.values()), [2])
+
+
+class SQLInstrumentationMiddlewareTests(InstrumentationTestCase):
+    def serve(self, work):
+        def get_response(request):
+            work()
+            return HttpResponse()
+
+        return SQLInstrumentationMiddleware(get_response)(RequestFactory().get('/'))
+
+    def test_raises_under_tests(self):
+        self.assertTrue(settings.SQL_N_PLUS_ONE_RAISE)
+
+    def test_server_timing_header(self):
+        response = self.serve(self.joined)
+        self.assertRegex(response['Server-Timing'], r'^db;dur=\d+\.\d;desc="1 queries"$')
+
+    def test_summary_logged_at_debug(self):
+        with self.assertLogs('core.sql', 'DEBUG') as logs:
+            self.serve(self.joined)
+        self.assertEqual([record.levelname for record in logs.records], ['DEBUG'])
+        self.assertIn('queries=1 ', logs.output[0])
+        self.assertEqual(logs.records[0].queries, 1)
+
+    def test_n_plus_one_raises(self):
+        with self.assertRaisesMessage(NPlusOneDetected, 'Suspected N+1 in -: 6x SELECT'):
+            self.serve(self.n_plus_one)
+
+    @override_settings(SQL_N_PLUS_ONE_RAISE=False)
+    def test_n_plus_one_is_a_warning_when_not_raising(self):
+        with self.assertLogs('core.sql', 'WARNING') as logs:
+            response = self.serve(self.n_plus_one)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Suspected N+1 in view=-: 6x SELECT', logs.output[0])
+
+    def test_below_threshold_is_not_flagged(self):
+        with override_settings(SQL_N_PLUS_ONE_THRESHOLD=7):
+            self.serve(self.n_plus_one)
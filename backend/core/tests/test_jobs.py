@@ -0,0 +1,182 @@
+import io
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from PIL import Image
+
+from core import images, jobs, storage
+from core.models import BackgroundJob, JobStatus, Restaurant, RestaurantPhoto, User
+
+
+def fail(**payload):
+    raise RuntimeError('boom')
+
+
+@override_settings(JOB_RETRY_BASE_SECONDS=30, JOB_LEASE_SECONDS=300)
+class JobQueueTests(TestCase):
+    def setUp(self):
+        # Worker threads close their connections; the test's transaction has to survive
+        patcher = mock.patch.object(jobs, 'close_old_connections')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        handlers = mock.patch.dict(jobs._handlers, {'fail': fail, 'noop': lambda **payload: None})
+        handlers.start()
+        self.addCleanup(handlers.stop)
+
+    def run_failing(self, job):
+        with self.assertLogs('core.jobs', 'ERROR'):
+            jobs.run_job(job)
+
+    def test_claim_skips_jobs_not_yet_due(self):
+        later = BackgroundJob.objects.create(kind='noop', run_after=timezone.now() + timedelta(minutes=5))
+        due = BackgroundJob.objects.create(kind='noop', run_after=timezone.now() - timedelta(seconds=1))
+
+        self.assertEqual([job.pk for job in jobs.claim(10)], [due.pk])
+        due.refresh_from_db()
+        later.refresh_from_db()
+        self.assertEqual((due.status, due.attempts), (JobStatus.RUNNING, 1))
+        self.assertEqual((later.status, later.attempts), (JobStatus.PENDING, 0))
+
+    def test_successful_job_is_done(self):
+        BackgroundJob.objects.create(kind='noop')
+        job = jobs.claim(1)[0]
+        jobs.run_job(job)
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatus.DONE)
+        self.assertIsNone(job.locked_until)
+
+    def test_failure_requeues_with_backoff(self):
+        BackgroundJob.objects.create(kind='fail')
+        job = jobs.claim(1)[0]
+        before = timezone.now()
+        self.run_failing(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, JobStatus.PENDING)
+        self.assertEqual(job.last_error, 'RuntimeError: boom')
+        self.assertGreaterEqual(job.run_after, before + timedelta(seconds=30))
+        self.assertEqual(jobs.claim(1), [])
+
+        # The second attempt waits twice as long
+        BackgroundJob.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        job = jobs.claim(1)[0]
+        before = timezone.now()
+        self.run_failing(job)
+        job.refresh_from_db()
+        self.assertGreaterEqual(job.run_after, before + timedelta(seconds=60))
+
+    def test_failed_after_max_attempts(self):
+        job = BackgroundJob.objects.create(kind='fail', max_attempts=2)
+        for _ in range(2):
+            BackgroundJob.objects.filter(pk=job.pk).update(run_after=timezone.now())
+            self.run_failing(jobs.claim(1)[0])
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (JobStatus.FAILED, 2))
+        self.assertEqual(jobs.claim(1), [])
+
+    def test_expired_lease_is_reclaimed_until_last_attempt(self):
+        job = BackgroundJob.objects.create(kind='noop', max_attempts=2)
+        for _ in range(2):
+            self.assertEqual([claimed.pk for claimed in jobs.claim(1)], [job.pk])
+            # The worker died without recording an outcome
+            BackgroundJob.objects.filter(pk=job.pk).update(locked_until=timezone.now() - timedelta(seconds=1))
+
+        self.assertEqual(jobs.claim(1), [])
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (JobStatus.FAILED, 2))
+        self.assertEqual(job.last_error, 'Lease expired on the last attempt.')
+
+
+class PhotoVariantTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings = override_settings(STORAGE_BACKEND='core.storage.LocalStorage', MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.backend = storage.LocalStorage()
+        backend = mock.patch.object(storage, '_backend', self.backend)
+        backend.start()
+        self.addCleanup(backend.stop)
+
+        owner = User.objects.create_user(email='owner@example.com', password='password123', name='Owner')
+        self.restaurant = Restaurant.objects.create(
+            owner=owner, name='Cafe', address='1 Road', city='Pune', google_maps_link='https://maps.google.com/?q=1',
+        )
+
+    def photo(self, url):
+        return RestaurantPhoto.objects.create(restaurant=self.restaurant, image_url=url)
+
+    def test_variants_are_stored_and_recorded(self):
+        out = io.BytesIO()
+        Image.new('RGB', (1000, 500), 'red').save(out, 'PNG')
+        photo = self.photo(self.backend.url('png/original.png'))
+
+        with mock.patch.object(images, '_fetch', return_value=out.getvalue()):
+            images.generate_photo_variants(photo.pk)
+
+        photo.refresh_from_db()
+        # Never upscaled: 1600 collapses to the original width
+        self.assertEqual(
+            sorted((v['width'], v['format']) for v in photo.variants),
+            [(320, 'jpg'), (320, 'webp'), (800, 'jpg'), (800, 'webp'), (1000, 'jpg'), (1000, 'webp')],
+        )
+        with open(self.backend._path(photo.variants[0]['url'].split('/media/', 1)[1]), 'rb') as stored:
+            self.assertEqual(Image.open(stored).width, photo.variants[0]['width'])
+
+    def test_foreign_urls_are_not_fetched(self):
+        photo = self.photo('https://elsewhere.example.com/photo.jpg')
+        with mock.patch.object(images, '_fetch') as fetch:
+            images.generate_photo_variants(photo.pk)
+        fetch.assert_not_called()
+        photo.refresh_from_db()
+        self.assertFalse(photo.variants)
+
+    def queued(self):
+        return sorted(BackgroundJob.objects.filter(kind='image_derivatives').values_list('payload__photo_id', flat=True))
+
+    def test_only_a_new_image_queues_variants(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            photo = self.photo(self.backend.url('jpg/a.jpg'))
+        self.assertEqual(self.queued(), [photo.pk])
+        BackgroundJob.objects.all().delete()
+
+        photo = RestaurantPhoto.objects.get(pk=photo.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            photo.caption = 'Kitchen'
+            photo.save()
+            photo.order = 3
+            photo.save(update_fields=['order'])
+            # As the job records its output
+            photo.variants = [{'width': 320, 'format': 'webp', 'url': self.backend.url('variants/x/320.webp')}]
+            photo.save(update_fields=['variants', 'updated_at'])
+        self.assertEqual(self.queued(), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            photo.image_url = self.backend.url('jpg/b.jpg')
+            photo.save()
+            # Saved again unchanged: no second job
+            photo.save()
+        self.assertEqual(self.queued(), [photo.pk])
+
+    def test_generate_variants_command_backfills(self):
+        done = self.photo(self.backend.url('jpg/done.jpg'))
+        RestaurantPhoto.objects.filter(pk=done.pk).update(variants=[{'width': 320, 'format': 'webp', 'url': 'x'}])
+        missing = self.photo(self.backend.url('jpg/missing.jpg'))
+        waiting = self.photo(self.backend.url('jpg/waiting.jpg'))
+        self.photo('https://elsewhere.example.com/photo.jpg')
+        BackgroundJob.objects.all().delete()
+        BackgroundJob.objects.create(kind='image_derivatives', payload={'photo_id': waiting.pk})
+
+        call_command('generate_variants', '--missing', stdout=io.StringIO())
+        self.assertEqual(self.queued(), [missing.pk, waiting.pk])
+
+        # Everything else, still skipping photos with a job waiting
+        call_command('generate_variants', stdout=io.StringIO())
+        self.assertEqual(self.queued(), [done.pk, missing.pk, waiting.pk])
@@ -0,0 +1,50 @@
+from unittest import mock, skipIf
+
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from core import metrics
+
+
+@skipIf(not metrics.enabled(), 'prometheus_client not installed')
+@override_settings(METRICS_TOKEN='scrape-secret')
+class MetricsViewTests(APITestCase):
+    def scrape(self, token='scrape-secret'):
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'} if token else {}
+        return self.client.get('/metrics/', **headers)
+
+    def request_count(self, view, status):
+        return metrics.prometheus_client.REGISTRY.get_sample_value(
+            'http_request_duration_seconds_count', {'view': view, 'method': 'GET', 'status': status},
+        ) or 0
+
+    def test_missing_token(self):
+        self.assertEqual(self.scrape(token=None).status_code, 403)
+
+    def test_wrong_token(self):
+        self.assertEqual(self.scrape(token='guess').status_code, 403)
+        self.assertEqual(self.client.get('/metrics/', HTTP_AUTHORIZATION='scrape-secret').status_code, 403)
+
+    @override_settings(METRICS_TOKEN='')
+    def test_unset_token_denies_everyone(self):
+        self.assertEqual(self.scrape(token='').status_code, 403)
+        self.assertEqual(self.client.get('/metrics/', HTTP_AUTHORIZATION='Bearer ').status_code, 403)
+
+    def test_exposition(self):
+        response = self.scrape()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], metrics.prometheus_client.CONTENT_TYPE_LATEST)
+        self.assertIn(b'# TYPE http_request_duration_seconds histogram', response.content)
+
+    def test_middleware_records_requests(self):
+        before = self.request_count('restaurant_list', '200')
+        unmatched = self.request_count('unmatched', '404')
+        self.client.get('/api/restaurants/')
+        self.client.get('/no-such-page/')
+        self.assertEqual(self.request_count('restaurant_list', '200'), before + 1)
+        self.assertEqual(self.request_count('unmatched', '404'), unmatched + 1)
+        self.assertIn(b'view="restaurant_list"', self.scrape().content)
+
+    def test_disabled_without_prometheus_client(self):
+        with mock.patch.object(metrics, 'prometheus_client', None):
+            self.assertEqual(self.scrape().status_code, 503)
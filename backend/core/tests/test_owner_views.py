@@ -0,0 +1,31 @@
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from core.models import OwnerApplication, User
+
+STATUS = '/api/owner/application-status/'
+
+
+class ApplicationStatusTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(email='owner@example.com', password='password123', name='Owner')
+        for i in range(6):
+            OwnerApplication.objects.create(
+                user=self.user, restaurant_name=f'Cafe {i}', business_address='1 Road', city='Pune',
+                google_maps_link='https://maps.google.com/?q=1', contact_person_name='Owner',
+                contact_phone='9999999999', proof_document_url='https://example.com/proof.pdf',
+                declaration_accepted=True,
+            )
+        response = self.client.post('/api/auth/login/', {'email': 'owner@example.com', 'password': 'password123'}, format='json')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {response.json()["access"]}')
+
+    def test_applications_and_latest_in_one_query(self):
+        self.client.get(STATUS)  # caches the token version
+        with self.assertNumQueries(1):
+            response = self.client.get(STATUS)
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(len(body['applications']), 6)
+        self.assertEqual({row['user_email'] for row in body['applications']}, {'owner@example.com'})
+        self.assertEqual(body['latest'], body['applications'][0])
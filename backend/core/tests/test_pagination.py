@@ -0,0 +1,158 @@
+import base64
+import json
+
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from core.instrumentation import assert_max_queries, assert_no_n_plus_one
+from core.models import Restaurant, RestaurantPhoto, User
+
+
+def encode(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+class RestaurantListTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+    def restaurant(self, name, **fields):
+        n = Restaurant.objects.count()
+        owner = User.objects.create_user(email=f'owner{n}@example.com', password='password123', name=f'Owner {n}')
+        fields = {'address': '1 Road', 'city': 'Pune', **fields}
+        return Restaurant.objects.create(owner=owner, name=name, google_maps_link='https://maps.google.com/?q=1', **fields)
+
+    def get(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def ids(self, page):
+        return [row['id'] for row in page['results']]
+
+    def all_pages(self, **params):
+        seen, url = [], '/api/restaurants/'
+        while url:
+            page = self.get(url, **params)
+            seen += self.ids(page)
+            url, params = page['next'], {}
+        return seen
+
+
+class RestaurantCursorTests(RestaurantListTestCase):
+    def setUp(self):
+        super().setUp()
+        for i in range(5):
+            # Two restaurants share each name, so paging has to fall back on id
+            self.restaurant(f'Cafe {i // 2}')
+        self.expected = list(Restaurant.objects.order_by('name', 'id').values_list('id', flat=True))
+
+    def test_next_pages_cover_every_row_once(self):
+        self.assertEqual(self.all_pages(page_size=2), self.expected)
+
+    def test_previous_link_returns_preceding_page(self):
+        first = self.get('/api/restaurants/', page_size=2)
+        self.assertIsNone(first['previous'])
+        second = self.get(first['next'])
+        third = self.get(second['next'])
+        self.assertEqual(self.ids(self.get(third['previous'])), self.ids(second))
+        self.assertEqual(self.ids(self.get(second['previous'])), self.ids(first))
+
+    def test_undecodable_cursor_is_not_found(self):
+        response = self.client.get('/api/restaurants/', {'cursor': 'not-a-cursor!'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_tampered_cursor_values_are_not_found(self):
+        for position in (['a', 'x'], [None, None], [{'a': 1}, [1]], ['Cafe 1']):
+            with self.subTest(position=position):
+                response = self.client.get('/api/restaurants/', {'cursor': encode({'p': position})})
+                self.assertEqual(response.status_code, 404)
+                self.assertEqual(response.json()['detail'], 'Invalid cursor.')
+
+
+class RestaurantSearchTests(RestaurantListTestCase):
+    def setUp(self):
+        super().setUp()
+        # Fallback (non-Postgres) ranks: name prefix > name > city > address
+        self.by_address = self.restaurant('Corner House', address='Near the pizza market')
+        self.by_name = self.restaurant('Best Pizza')
+        self.by_prefix = [self.restaurant('Pizza Palace'), self.restaurant('Pizza Point'), self.restaurant('Pizza Hub')]
+        self.by_city = self.restaurant('Cafe', city='Pizzaville')
+        self.restaurant('Dosa Corner')
+
+    def test_search_filters_and_orders_by_rank_then_id(self):
+        page = self.get('/api/restaurants/', search='pizza')
+        expected = [r.pk for r in self.by_prefix] + [self.by_name.pk, self.by_city.pk, self.by_address.pk]
+        self.assertEqual(self.ids(page), expected)
+
+    def test_search_pages_have_no_duplicates(self):
+        seen = self.all_pages(search='pizza', page_size=2)
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(seen, self.ids(self.get('/api/restaurants/', search='pizza')))
+
+    def test_search_without_matches_is_empty(self):
+        self.assertEqual(self.get('/api/restaurants/', search='sushi')['results'], [])
+
+
+class RestaurantNearTests(RestaurantListTestCase):
+    ORIGIN = (18.5204, 73.8567)
+
+    def setUp(self):
+        super().setUp()
+        lat, lng = self.ORIGIN
+        # ~0.009 degrees of latitude per km; created out of distance order
+        self.far = self.restaurant('Far', latitude=lat + 0.072, longitude=lng)
+        self.near = self.restaurant('Near', latitude=lat + 0.009, longitude=lng)
+        self.middle = self.restaurant('Middle', latitude=lat, longitude=lng - 0.028)
+        self.restaurant('Unplaced')
+
+    def near_param(self):
+        return '%s,%s' % self.ORIGIN
+
+    def test_nearest_first_within_radius(self):
+        page = self.get('/api/restaurants/', near=self.near_param(), radius_km=5)
+        self.assertEqual(self.ids(page), [self.near.pk, self.middle.pk])
+        distances = [row['distance_km'] for row in page['results']]
+        self.assertAlmostEqual(distances[0], 1.0, delta=0.05)
+        self.assertAlmostEqual(distances[1], 2.95, delta=0.1)
+
+    def test_radius_cut_off(self):
+        self.assertEqual(self.ids(self.get('/api/restaurants/', near=self.near_param(), radius_km=0.5)), [])
+        wide = self.get('/api/restaurants/', near=self.near_param(), radius_km=10)
+        self.assertEqual(self.ids(wide), [self.near.pk, self.middle.pk, self.far.pk])
+
+    def test_near_pages_follow_distance(self):
+        seen = self.all_pages(near=self.near_param(), radius_km=10, page_size=1)
+        self.assertEqual(seen, [self.near.pk, self.middle.pk, self.far.pk])
+
+    def test_invalid_near_or_radius_is_bad_request(self):
+        cases = [
+            {'near': 'pune'},
+            {'near': '18.5'},
+            {'near': '91,73.8'},
+            {'near': '18.5,181'},
+            {'near': self.near_param(), 'radius_km': 'far'},
+            {'near': self.near_param(), 'radius_km': '0'},
+            {'near': self.near_param(), 'radius_km': '-1'},
+            {'near': self.near_param(), 'radius_km': '100.5'},
+        ]
+        for params in cases:
+            with self.subTest(**params):
+                response = self.client.get('/api/restaurants/', params)
+                self.assertEqual(response.status_code, 400)
+
+
+class RestaurantQueryBudgetTests(RestaurantListTestCase):
+    def setUp(self):
+        super().setUp()
+        for i in range(8):
+            restaurant = self.restaurant(f'Cafe {i}', latitude=18.52 + i / 1000, longitude=73.85)
+            RestaurantPhoto.objects.create(restaurant=restaurant, image_url=f'https://example.com/{i}.jpg')
+
+    def test_list_is_one_query(self):
+        cases = [{}, {'search': 'cafe'}, {'city': 'pune'}, {'near': '18.52,73.85'}, {'fields': 'id,name'}]
+        for params in cases:
+            with self.subTest(**params):
+                cache.clear()
+                with assert_max_queries(1), assert_no_n_plus_one():
+                    self.assertEqual(len(self.get('/api/restaurants/', **params)['results']), 8)
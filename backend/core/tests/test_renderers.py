@@ -0,0 +1,72 @@
+import datetime
+import io
+import uuid
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from core import renderers
+from core.renderers import FastJSONParser, FastJSONRenderer
+
+DATA = {
+    'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'price': Decimal('249.50'),
+    'created_at': datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+    'opens': datetime.time(9, 30),
+    'day': datetime.date(2024, 5, 1),
+    'name': 'Café\u2028Line',
+    'tags': ['veg', 'rooftop'],
+    1: 'non-string key',
+}
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    def test_matches_drf_output(self):
+        self.assertEqual(FastJSONRenderer().render(DATA), JSONRenderer().render(DATA))
+
+    def test_round_trip(self):
+        parsed = FastJSONParser().parse(io.BytesIO(FastJSONRenderer().render(DATA)))
+        self.assertEqual(parsed, {
+            'id': '12345678-1234-5678-1234-567812345678',
+            # DRF's encoder writes Decimals as numbers unless COERCE_DECIMAL_TO_STRING applies in a serializer
+            'price': 249.5,
+            'created_at': '2024-05-01T12:30:15.123456Z',
+            'opens': '09:30:00',
+            'day': '2024-05-01',
+            'name': 'Café\u2028Line',
+            'tags': ['veg', 'rooftop'],
+            '1': 'non-string key',
+        })
+
+    def test_escapes_line_separators(self):
+        ret = FastJSONRenderer().render({'name': 'a\u2028b\u2029c'})
+        self.assertIn(b'\\u2028', ret)
+        self.assertIn(b'\\u2029', ret)
+
+    def test_indent_and_none_fall_back(self):
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+        indented = FastJSONRenderer().render({'a': 1}, 'application/json; indent=2')
+        self.assertEqual(indented, JSONRenderer().render({'a': 1}, 'application/json; indent=2'))
+
+    def test_without_orjson(self):
+        with mock.patch.object(renderers, 'orjson', None):
+            self.assertEqual(FastJSONRenderer().render(DATA), JSONRenderer().render(DATA))
+            self.assertEqual(FastJSONParser().parse(io.BytesIO(b'{"a": 1}')), {'a': 1})
+
+
+class FastJSONParserTests(SimpleTestCase):
+    def test_invalid_json(self):
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"a": '))
+
+    def test_invalid_utf8(self):
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"a": "\xff"}'))
+
+    def test_other_encoding(self):
+        body = '{"name": "Café"}'.encode('latin-1')
+        parsed = FastJSONParser().parse(io.BytesIO(body), parser_context={'encoding': 'latin-1'})
+        self.assertEqual(parsed, {'name': 'Café'})
@@ -0,0 +1,86 @@
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from core.models import Restaurant, RestaurantPhoto, User
+
+
+class PhotoSummaryTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        owner = User.objects.create_user(email='owner@example.com', password='password123', name='Owner')
+        self.restaurant = Restaurant.objects.create(
+            owner=owner, name='Cafe', address='1 Road', city='Pune', google_maps_link='https://maps.google.com/?q=1',
+        )
+
+    def add_photo(self, name, order):
+        with self.captureOnCommitCallbacks(execute=True):
+            return RestaurantPhoto.objects.create(
+                restaurant=self.restaurant, image_url=f'https://example.com/{name}.jpg', order=order,
+            )
+
+    def summary(self):
+        self.restaurant.refresh_from_db()
+        return self.restaurant.photo_count, self.restaurant.cover_photo_url
+
+    def listed_summary(self):
+        row = self.client.get('/api/restaurants/').json()['results'][0]
+        return row['photo_count'], row['cover_photo_url']
+
+    def test_new_restaurant_has_no_cover(self):
+        self.assertEqual(self.summary(), (0, ''))
+
+    def test_cover_is_first_photo_by_order(self):
+        self.add_photo('kitchen', order=2)
+        self.assertEqual(self.summary(), (1, 'https://example.com/kitchen.jpg'))
+        self.add_photo('front', order=1)
+        self.assertEqual(self.summary(), (2, 'https://example.com/front.jpg'))
+        # Same order: the older photo stays first
+        self.add_photo('dining', order=1)
+        self.assertEqual(self.summary(), (3, 'https://example.com/front.jpg'))
+        self.assertEqual(self.listed_summary(), self.summary())
+
+    def test_deleting_photos_moves_cover_and_count(self):
+        front = self.add_photo('front', order=0)
+        kitchen = self.add_photo('kitchen', order=1)
+        self.assertEqual(self.listed_summary(), (2, 'https://example.com/front.jpg'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            front.delete()
+        self.assertEqual(self.summary(), (1, 'https://example.com/kitchen.jpg'))
+        self.assertEqual(self.listed_summary(), self.summary())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            kitchen.delete()
+        self.assertEqual(self.summary(), (0, ''))
+        self.assertEqual(self.listed_summary(), self.summary())
+
+    def test_reordering_a_photo_moves_cover(self):
+        self.add_photo('front', order=1)
+        kitchen = self.add_photo('kitchen', order=2)
+        with self.captureOnCommitCallbacks(execute=True):
+            kitchen.order = 0
+            kitchen.save()
+        self.assertEqual(self.summary(), (2, 'https://example.com/kitchen.jpg'))
+        self.assertEqual(self.listed_summary(), self.summary())
+
+    def test_cover_variants_follow_the_variants_job(self):
+        kitchen = self.add_photo('kitchen', order=1)
+        self.assertEqual(self.client.get('/api/restaurants/').json()['results'][0]['cover_photo_variants'], {})
+
+        # As images.generate_photo_variants() records them
+        with self.captureOnCommitCallbacks(execute=True):
+            kitchen.variants = [
+                {'width': 800, 'format': 'webp', 'url': 'https://cdn.example.com/800.webp'},
+                {'width': 320, 'format': 'webp', 'url': 'https://cdn.example.com/320.webp'},
+            ]
+            kitchen.save(update_fields=['variants', 'updated_at'])
+        row = self.client.get('/api/restaurants/').json()['results'][0]
+        self.assertEqual(
+            row['cover_photo_variants'],
+            {'webp': 'https://cdn.example.com/320.webp 320w, https://cdn.example.com/800.webp 800w'},
+        )
+
+        # A new cover without variants yet
+        self.add_photo('front', order=0)
+        self.restaurant.refresh_from_db()
+        self.assertEqual(self.restaurant.cover_photo_variants, [])
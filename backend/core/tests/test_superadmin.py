@@ -0,0 +1,95 @@
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from core.instrumentation import assert_max_queries, assert_no_n_plus_one
+from core.models import Role, User
+from core.pagination import estimate_count
+
+USERS = '/api/superadmin/users/'
+
+
+class UserDirectoryTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.superadmin = User.objects.create_user(
+            email='root@example.com', password='password123', name='Root', role=Role.SUPER_ADMIN,
+        )
+        User.objects.create_user(email='asha.rao@example.com', password='password123', name='Asha Rao', role=Role.OWNER)
+        User.objects.create_user(email='ravi@example.com', password='password123', name='Ravi Kumar', role=Role.ADMIN)
+        User.objects.create_user(email='meera@example.com', password='password123', name='Meera Rao')
+        User.objects.create_user(
+            email='old@example.com', password='password123', name='Old Account', is_active=False,
+        )
+        self.client.force_authenticate(self.superadmin)
+
+    def get(self, **params):
+        response = self.client.get(USERS, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def emails(self, **params):
+        return [row['email'] for row in self.get(**params)['results']]
+
+    def expected(self, queryset):
+        return list(queryset.order_by('-created_at', '-id').values_list('email', flat=True))
+
+    def test_newest_first_without_count(self):
+        body = self.get()
+        self.assertEqual([row['email'] for row in body['results']], self.expected(User.objects.all()))
+        self.assertNotIn('count', body)
+
+    def test_role_filter(self):
+        self.assertEqual(self.emails(role='owner'), ['asha.rao@example.com'])
+        self.assertEqual(
+            self.emails(role='ADMIN,SUPER_ADMIN'),
+            self.expected(User.objects.filter(role__in=[Role.ADMIN, Role.SUPER_ADMIN])),
+        )
+
+    def test_is_active_filter(self):
+        self.assertEqual(self.emails(is_active='false'), ['old@example.com'])
+        self.assertNotIn('old@example.com', self.emails(is_active='true'))
+
+    def test_search_matches_email_prefix_or_name(self):
+        self.assertEqual(self.emails(search='RAVI'), ['ravi@example.com'])
+        # 'rao' starts no email but is in two names
+        self.assertEqual(self.emails(search='rao'), self.expected(User.objects.filter(name__icontains='rao')))
+        # Email matching is by prefix only
+        self.assertEqual(self.emails(search='example.com'), [])
+
+    def test_filters_combine(self):
+        self.assertEqual(self.emails(search='rao', role='USER', is_active='true'), ['meera@example.com'])
+
+    def test_pages_cover_directory_once(self):
+        seen, url, params = [], USERS, {'page_size': 2, 'role': 'USER,OWNER'}
+        while url:
+            page = self.client.get(url, params).json()
+            seen += [row['email'] for row in page['results']]
+            url, params = page['next'], {}
+        self.assertEqual(seen, self.expected(User.objects.filter(role__in=[Role.USER, Role.OWNER])))
+
+    def test_page_is_one_query_and_count_one_more(self):
+        for i in range(6):
+            User.objects.create_user(email=f'user{i}@example.com', password='password123', name=f'User {i}')
+        with assert_max_queries(1), assert_no_n_plus_one():
+            self.assertEqual(len(self.get()['results']), 11)
+        with assert_max_queries(2), assert_no_n_plus_one():
+            self.assertEqual(self.get(count='exact', role='USER')['count'], 8)
+
+    def test_exact_count(self):
+        body = self.get(count='exact', is_active='true', page_size=1)
+        self.assertEqual((body['count'], body['count_is_estimate']), (4, False))
+        self.assertEqual(len(body['results']), 1)
+
+    def test_estimate_count_falls_back_to_exact_off_postgres(self):
+        body = self.get(count='estimate', role='USER')
+        self.assertEqual((body['count'], body['count_is_estimate']), (2, False))
+        self.assertEqual(estimate_count(User.objects.filter(role=Role.USER)), (2, False))
+
+    def test_invalid_parameters_are_bad_request(self):
+        for params in ({'role': 'CHEF'}, {'is_active': 'maybe'}, {'count': 'roughly'}):
+            with self.subTest(**params):
+                self.assertEqual(self.client.get(USERS, params).status_code, 400)
+
+    def test_only_superadmins(self):
+        self.client.force_authenticate(User.objects.get(email='ravi@example.com'))
+        self.assertEqual(self.client.get(USERS).status_code, 403)
@@ -0,0 +1,149 @@
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from core import storage, uploads
+from core.models import User
+
+JPEG = b'\xff\xd8\xff\xe0' + b'\x00' * 64
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 64
+
+
+class UploadTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings = override_settings(STORAGE_BACKEND='core.storage.LocalStorage', MEDIA_ROOT=media_root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.backend = storage.LocalStorage()
+        backend = mock.patch.object(storage, '_backend', self.backend)
+        backend.start()
+        self.addCleanup(backend.stop)
+
+        user = User.objects.create_user(email='owner@example.com', password='password123', name='Owner')
+        self.client.force_authenticate(user)
+
+
+class UploadTests(UploadTestCase):
+    def test_single_upload_is_stored(self):
+        response = self.client.post(
+            '/api/owner/upload/', {'file': SimpleUploadedFile('photo.jpg', JPEG)}, format='multipart',
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(response.json()['url'].endswith('.jpg'))
+
+    def test_content_not_matching_extension_is_rejected(self):
+        response = self.client.post(
+            '/api/owner/upload/', {'file': SimpleUploadedFile('photo.jpg', b'<html>not an image</html>')},
+            format='multipart',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['detail'], 'File content does not match its type.')
+
+    def test_batch_rejects_spoofed_file(self):
+        response = self.client.post('/api/owner/upload/batch/', {
+            'owner_photo_url': SimpleUploadedFile('owner.jpg', JPEG),
+            'storefront_photo_url': SimpleUploadedFile('front.png', JPEG),
+        }, format='multipart')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['detail'], 'File content does not match its type.')
+
+    def test_batch_stores_one_url_per_field(self):
+        response = self.client.post('/api/owner/upload/batch/', {
+            'owner_photo_url': SimpleUploadedFile('owner.jpg', JPEG),
+            'storefront_photo_url': SimpleUploadedFile('front.png', PNG),
+        }, format='multipart')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(set(response.json()['urls']), {'owner_photo_url', 'storefront_photo_url'})
+
+    def test_batch_rejects_repeated_field(self):
+        response = self.client.post('/api/owner/upload/batch/', {
+            'owner_photo_url': [SimpleUploadedFile('a.jpg', JPEG), SimpleUploadedFile('b.png', PNG)],
+            'storefront_photo_url': SimpleUploadedFile('front.png', PNG),
+        }, format='multipart')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['errors'], {'owner_photo_url': 'Only one file per field.'})
+
+    def test_identical_upload_reuses_stored_object(self):
+        with mock.patch.object(self.backend, 'upload', wraps=self.backend.upload) as upload:
+            first = self.client.post(
+                '/api/owner/upload/', {'file': SimpleUploadedFile('photo.jpg', JPEG)}, format='multipart',
+            )
+            second = self.client.post(
+                '/api/owner/upload/', {'file': SimpleUploadedFile('renamed.jpg', JPEG)}, format='multipart',
+            )
+        self.assertEqual(second.status_code, 201)
+        self.assertEqual(second.json()['url'], first.json()['url'])
+        upload.assert_called_once()
+
+    def test_identical_files_in_a_batch_are_stored_once(self):
+        with mock.patch.object(self.backend, 'upload', wraps=self.backend.upload) as upload:
+            response = self.client.post('/api/owner/upload/batch/', {
+                'owner_photo_url': SimpleUploadedFile('owner.jpg', JPEG),
+                'storefront_photo_url': SimpleUploadedFile('front.jpg', JPEG),
+            }, format='multipart')
+        self.assertEqual(response.status_code, 201)
+        urls = response.json()['urls']
+        self.assertEqual(urls['owner_photo_url'], urls['storefront_photo_url'])
+        upload.assert_called_once()
+
+
+@mock.patch.object(uploads, 'MAX_FILE_SIZE', 1024)
+class UploadSizeLimitTests(UploadTestCase):
+    """Size limits, with MAX_FILE_SIZE shrunk to 1 KB so the bodies stay small."""
+
+    def setUp(self):
+        super().setUp()
+        upload = mock.patch.object(self.backend, 'upload', wraps=self.backend.upload)
+        self.upload = upload.start()
+        self.addCleanup(upload.stop)
+
+    def assert_too_large(self, response):
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(response.json()['detail'], 'File too large (max 20MB).')
+        self.upload.assert_not_called()
+
+    def test_oversize_file_aborts_the_body(self):
+        with mock.patch.object(
+            uploads.ValidatingUploadHandler, 'file_complete', autospec=True,
+            side_effect=uploads.ValidatingUploadHandler.file_complete,
+        ) as file_complete:
+            response = self.client.post(
+                '/api/owner/upload/', {'file': SimpleUploadedFile('photo.jpg', JPEG + b'\x00' * 1024)},
+                format='multipart',
+            )
+        self.assert_too_large(response)
+        # Parsing stopped inside the file, before it completed
+        file_complete.assert_not_called()
+
+    def test_one_oversize_file_rejects_the_batch(self):
+        response = self.client.post('/api/owner/upload/batch/', {
+            'owner_photo_url': SimpleUploadedFile('owner.jpg', JPEG),
+            'storefront_photo_url': SimpleUploadedFile('front.png', PNG + b'\x00' * 1024),
+        }, format='multipart')
+        self.assert_too_large(response)
+
+    def test_declared_content_length_is_checked_before_reading(self):
+        with mock.patch.object(uploads, 'MULTIPART_OVERHEAD', 0), \
+                mock.patch.object(uploads.ValidatingUploadHandler, 'receive_data_chunk') as receive:
+            response = self.client.post(
+                '/api/owner/upload/', {'file': SimpleUploadedFile('photo.jpg', JPEG + b'\x00' * 1024)},
+                format='multipart',
+            )
+        self.assert_too_large(response)
+        receive.assert_not_called()
+
+    def test_file_at_the_limit_is_stored(self):
+        response = self.client.post(
+            '/api/owner/upload/', {'file': SimpleUploadedFile('photo.jpg', JPEG + b'\x00' * (1024 - len(JPEG)))},
+            format='multipart',
+        )
+        self.assertEqual(response.status_code, 201)
+        self.upload.assert_called_once()
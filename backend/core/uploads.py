@@ -0,0 +1,113 @@
+"""
+Upload limits, enforced while the multipart body is still arriving.
+
+ValidatingUploadHandler runs first in the upload handler chain for the upload
+views. It rejects a file as soon as its name, its first bytes or its running
+size break the rules, and it stops the parser without reading the rest of the
+body (StopUpload(connection_reset=True)). Oversized or spoofed uploads
+therefore cost one chunk of work rather than the whole transfer. The same pass
+computes each file's SHA-256 for content-addressed storage (core.storage).
+"""
+import hashlib
+import os
+
+from django.core.files.uploadhandler import FileUploadHandler, StopUpload
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+ALLOWED_EXTENSIONS = {'pdf', 'jpg', 'jpeg', 'png', 'gif', 'webp'}
+# Strict limit: 20 MB
+MAX_FILE_SIZE = 20 * 1024 * 1024
+# Allowance for multipart boundaries/headers when checking Content-Length
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+def _is_webp(head):
+    return head[:4] == b'RIFF' and head[8:12] == b'WEBP'
+
+
+# Extension -> check on the file's first bytes
+MAGIC_CHECKS = {
+    'pdf': lambda head: head.startswith(b'%PDF-'),
+    'jpg': lambda head: head.startswith(b'\xff\xd8\xff'),
+    'jpeg': lambda head: head.startswith(b'\xff\xd8\xff'),
+    'png': lambda head: head.startswith(b'\x89PNG\r\n\x1a\n'),
+    'gif': lambda head: head[:6] in (b'GIF87a', b'GIF89a'),
+    'webp': _is_webp,
+}
+
+
+def file_extension(name):
+    return os.path.splitext(name or '')[1].lstrip('.').lower()
+
+
+class UploadTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = 'File too large (max 20MB).'
+    default_code = 'upload_too_large'
+
+
+def check_content_length(request, max_files):
+    """Refuse a request whose declared body can't fit within the limits, before it is read."""
+    try:
+        content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        content_length = 0
+    if content_length > max_files * MAX_FILE_SIZE + MULTIPART_OVERHEAD:
+        raise UploadTooLarge()
+
+
+class ValidatingUploadHandler(FileUploadHandler):
+    """
+    Enforces ALLOWED_EXTENSIONS, magic bytes, MAX_FILE_SIZE and a file count
+    per request. On a violation, `error` is set to (status_code, detail) and
+    parsing stops; request.FILES then holds no usable files.
+
+    `digests` maps each file's field name to the SHA-256 of its content;
+    `total_bytes` counts file content received across all files.
+    """
+
+    def __init__(self, request=None, max_files=1):
+        super().__init__(request)
+        self.max_files = max_files
+        self.files_seen = 0
+        self.error = None
+        self.digests = {}
+        self.total_bytes = 0
+        self._bytes = 0
+        self._ext = ''
+        self._hash = hashlib.sha256()
+
+    def _reject(self, status_code, detail):
+        self.error = (status_code, detail)
+        raise StopUpload(connection_reset=True)
+
+    def new_file(self, field_name, file_name, *args, **kwargs):
+        super().new_file(field_name, file_name, *args, **kwargs)
+        self.files_seen += 1
+        if self.files_seen > self.max_files:
+            self._reject(status.HTTP_400_BAD_REQUEST, f'At most {self.max_files} files per request.')
+        self._ext = file_extension(file_name)
+        if self._ext not in ALLOWED_EXTENSIONS:
+            self._reject(
+                status.HTTP_400_BAD_REQUEST,
+                f'Allowed types: {", ".join(sorted(ALLOWED_EXTENSIONS))}',
+            )
+        self._bytes = 0
+        self._hash = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.total_bytes += len(raw_data)
+        if start == 0 and not MAGIC_CHECKS[self._ext](raw_data[:16]):
+            self._reject(status.HTTP_400_BAD_REQUEST, 'File content does not match its type.')
+        self._bytes += len(raw_data)
+        if self._bytes > MAX_FILE_SIZE:
+            self._reject(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, UploadTooLarge.default_detail)
+        self._hash.update(raw_data)
+        return raw_data
+
+    def file_complete(self, file_size):
+        if self._bytes == 0:
+            self._reject(status.HTTP_400_BAD_REQUEST, 'Empty file.')
+        self.digests[self.field_name] = self._hash.hexdigest()
+        return None
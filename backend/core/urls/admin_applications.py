@@ -4,10 +4,18 @@ from ..views.admin_views import (
     AdminOwnerApplicationDetailView,
     AdminApproveView,
     AdminRejectView,
+    AdminClaimApplicationsView,
+    AdminRenewClaimsView,
+    AdminReleaseClaimsView,
+    AdminBulkReviewView,
 )
 
 urlpatterns = [
     path('owner-applications/', AdminOwnerApplicationListView.as_view(), name='admin_owner_applications'),
+    path('owner-applications/claim/', AdminClaimApplicationsView.as_view(), name='admin_claim_applications'),
+    path('owner-applications/claim/renew/', AdminRenewClaimsView.as_view(), name='admin_renew_claims'),
+    path('owner-applications/claim/release/', AdminReleaseClaimsView.as_view(), name='admin_release_claims'),
+    path('owner-applications/bulk-review/', AdminBulkReviewView.as_view(), name='admin_bulk_review'),
     path('owner-applications/<int:pk>/', AdminOwnerApplicationDetailView.as_view(), name='admin_owner_application_detail'),
     path('owner-applications/<int:pk>/approve/', AdminApproveView.as_view(), name='admin_approve'),
     path('owner-applications/<int:pk>/reject/', AdminRejectView.as_view(), name='admin_reject'),
@@ -0,0 +1,6 @@
+from django.urls import path
+from ..views.metrics_views import MetricsView
+
+urlpatterns = [
+    path('', MetricsView.as_view(), name='metrics'),
+]
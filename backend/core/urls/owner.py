@@ -1,9 +1,15 @@
+from django.conf import settings
 from django.urls import path
+from ..views.async_views import AsyncFileUploadView
 from ..views.owner_views import OwnerApplyView, OwnerApplicationStatusView
-from ..views.upload_views import FileUploadView
+from ..views.upload_views import FileUploadView, BatchFileUploadView
+
+if settings.ASYNC_VIEWS:
+    FileUploadView = AsyncFileUploadView
 
 urlpatterns = [
     path('apply/', OwnerApplyView.as_view(), name='owner_apply'),
     path('application-status/', OwnerApplicationStatusView.as_view(), name='owner_application_status'),
     path('upload/', FileUploadView.as_view(), name='file_upload'),
+    path('upload/batch/', BatchFileUploadView.as_view(), name='file_upload_batch'),
 ]
@@ -1,4 +1,6 @@
+from django.conf import settings
 from django.urls import path
+from ..views.async_views import AsyncRestaurantDetailView, AsyncRestaurantListView
 from ..views.restaurant_views import (
     RestaurantListView,
     RestaurantDetailView,
@@ -7,6 +9,9 @@ from ..views.restaurant_views import (
     MyRestaurantPhotoDeleteView,
 )
 
+if settings.ASYNC_VIEWS:
+    RestaurantListView, RestaurantDetailView = AsyncRestaurantListView, AsyncRestaurantDetailView
+
 urlpatterns = [
     path('', RestaurantListView.as_view(), name='restaurant_list'),
     path('<int:pk>/', RestaurantDetailView.as_view(), name='restaurant_detail'),
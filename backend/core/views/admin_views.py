@@ -1,47 +1,227 @@
+import datetime
+
 from rest_framework import generics, status
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
+from django.conf import settings
+from django.db import transaction
+from django.db.models import BooleanField, Case, F, Q, Value, When
 from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from django.contrib.auth import get_user_model
-from ..models import OwnerApplication, Restaurant
-from ..serializers import OwnerApplicationSerializer, OwnerApplicationListSerializer, AdminApproveRejectSerializer
+from ..authentication import forget_token_states
+from ..cache import bump_restaurant_list_version
+from ..fieldsets import SparseQuerysetMixin
+from ..models import ApplicationStatus, OwnerApplication, Restaurant, Role
+from ..pagination import OwnerApplicationPagination
+from ..serializers import (
+    OwnerApplicationSerializer,
+    OwnerApplicationListSerializer,
+    AdminApproveRejectSerializer,
+    BulkReviewSerializer,
+    ReviewClaimSerializer,
+    ReviewClaimIdsSerializer,
+)
 from ..permissions import IsAdmin
 
 User = get_user_model()
 
 
-class AdminOwnerApplicationListView(generics.ListAPIView):
-    queryset = OwnerApplication.objects.all().select_related('user', 'reviewed_by')
+def claim_seconds():
+    return getattr(settings, 'REVIEW_CLAIM_SECONDS', 900)
+
+
+def open_to(user, now):
+    """Q for applications `user` may claim or decide: unclaimed, claimed by them, or with a lapsed claim."""
+    return Q(claimed_by__isnull=True) | Q(claimed_by=user) | Q(claim_expires_at__lte=now)
+
+
+def claims_of(user, ids=None):
+    """The PENDING applications `user` holds a claim on (live or lapsed), optionally limited to `ids`."""
+    claims = OwnerApplication.objects.filter(claimed_by=user, status=ApplicationStatus.PENDING)
+    return claims if ids is None else claims.filter(id__in=ids)
+
+
+def parse_moment(query_params, name):
+    """?name= as an aware datetime; a bare date means midnight (in TIME_ZONE) at its start."""
+    raw = query_params.get(name, '').strip()
+    if not raw:
+        return None
+    try:
+        moment = parse_datetime(raw)
+        if moment is None:
+            day = parse_date(raw)
+            moment = day and datetime.datetime.combine(day, datetime.time.min)
+    except ValueError:
+        moment = None
+    if moment is None:
+        raise ValidationError({name: 'Expected an ISO 8601 date or datetime.'})
+    return timezone.make_aware(moment) if timezone.is_naive(moment) else moment
+
+
+class AdminOwnerApplicationListView(SparseQuerysetMixin, generics.ListAPIView):
+    """
+    Admin review queue, newest first, cursor-paginated by (submitted_at, id).
+
+    ?status=PENDING (or a comma-separated list) filters by status; ?city=
+    matches the city case-insensitively; ?submitted_after= (inclusive) and
+    ?submitted_before= (exclusive) take an ISO date or datetime;
+    ?claimed=mine / ?claimed=available select applications under the admin's
+    own review claim / free to claim. Each page is a range scan on the
+    (status, submitted_at, id) indexes, so the pending queue costs the same
+    however many reviewed applications accumulate.
+    """
     serializer_class = OwnerApplicationListSerializer
     permission_classes = [IsAdmin]
+    pagination_class = OwnerApplicationPagination
+
+    def get_queryset(self):
+        qs = OwnerApplication.objects.select_related('user')
+        params = self.request.query_params
+        statuses = [part.strip().upper() for part in params.get('status', '').split(',') if part.strip()]
+        if statuses:
+            unknown = sorted(set(statuses) - set(ApplicationStatus.values))
+            if unknown:
+                raise ValidationError({'status': f'Unknown status: {", ".join(unknown)}.'})
+            qs = qs.filter(status__in=statuses)
+        city = params.get('city', '').strip()
+        if city:
+            qs = qs.filter(city__iexact=city)
+        submitted_after = parse_moment(params, 'submitted_after')
+        if submitted_after:
+            qs = qs.filter(submitted_at__gte=submitted_after)
+        submitted_before = parse_moment(params, 'submitted_before')
+        if submitted_before:
+            qs = qs.filter(submitted_at__lt=submitted_before)
+        claimed = params.get('claimed', '').strip()
+        if claimed == 'mine':
+            qs = qs.filter(claimed_by=self.request.user, claim_expires_at__gt=timezone.now())
+        elif claimed == 'available':
+            qs = qs.filter(Q(claimed_by__isnull=True) | Q(claim_expires_at__lte=timezone.now()))
+        elif claimed:
+            raise ValidationError({'claimed': 'Expected "mine" or "available".'})
+        return qs
 
 
-class AdminOwnerApplicationDetailView(generics.RetrieveAPIView):
+class AdminOwnerApplicationDetailView(SparseQuerysetMixin, generics.RetrieveAPIView):
     queryset = OwnerApplication.objects.all().select_related('user', 'reviewed_by')
     serializer_class = OwnerApplicationSerializer
     permission_classes = [IsAdmin]
 
 
-class AdminApproveView(generics.GenericAPIView):
-    queryset = OwnerApplication.objects.all().select_related('user')
+class AdminClaimApplicationsView(generics.GenericAPIView):
+    """
+    POST {"count": N}: lease the N oldest PENDING applications nobody else is
+    reviewing to this admin for REVIEW_CLAIM_SECONDS. Applications the admin
+    already holds count towards N and are renewed.
+
+    Rows are picked with SELECT ... FOR UPDATE SKIP LOCKED, so admins claiming
+    at the same moment each get different applications instead of waiting on
+    one another. Approve/reject refuse applications claimed by someone else.
+    """
     permission_classes = [IsAdmin]
-    serializer_class = AdminApproveRejectSerializer
+    serializer_class = ReviewClaimSerializer
 
-    def patch(self, request, pk):
-        app = self.get_object()
-        if app.status != 'PENDING':
-            return Response(
-                {'detail': f'Application is already {app.status}.'},
-                status=status.HTTP_400_BAD_REQUEST,
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        now = timezone.now()
+        expires_at = now + datetime.timedelta(seconds=claim_seconds())
+        with transaction.atomic():
+            ids = list(
+                OwnerApplication.objects
+                .filter(open_to(request.user, now), status=ApplicationStatus.PENDING)
+                .order_by('submitted_at', 'id')
+                .select_for_update(skip_locked=True)
+                .values_list('id', flat=True)[:serializer.validated_data['count']]
             )
+            OwnerApplication.objects.filter(id__in=ids).update(claimed_by=request.user, claim_expires_at=expires_at)
+        claimed = OwnerApplication.objects.filter(id__in=ids).select_related('user').order_by('submitted_at', 'id')
+        return Response({
+            'claim_expires_at': expires_at,
+            'results': OwnerApplicationListSerializer(claimed, many=True, context=self.get_serializer_context()).data,
+        }, status=status.HTTP_200_OK)
+
+
+class AdminRenewClaimsView(generics.GenericAPIView):
+    """POST {"ids": [...]}: extend this admin's claims (all of them without ids). Lapsed claims nobody took over renew too."""
+    permission_classes = [IsAdmin]
+    serializer_class = ReviewClaimIdsSerializer
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        expires_at = timezone.now() + datetime.timedelta(seconds=claim_seconds())
+        claims = claims_of(request.user, serializer.validated_data.get('ids'))
+        claims.update(claim_expires_at=expires_at)
+        ids = list(claims.filter(claim_expires_at=expires_at).values_list('id', flat=True))
+        return Response({'ids': ids, 'claim_expires_at': expires_at}, status=status.HTTP_200_OK)
+
+
+class AdminReleaseClaimsView(generics.GenericAPIView):
+    """POST {"ids": [...]}: hand this admin's claims (all of them without ids) back to the queue."""
+    permission_classes = [IsAdmin]
+    serializer_class = ReviewClaimIdsSerializer
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        released = claims_of(request.user, serializer.validated_data.get('ids')).update(
+            claimed_by=None, claim_expires_at=None,
+        )
+        return Response({'released': released}, status=status.HTTP_200_OK)
+
+
+class ReviewDecisionMixin:
+    """Approve/reject as one conditional UPDATE: only a PENDING application not claimed by another admin changes."""
+
+    def decide(self, request, app, decision):
+        """Record `decision` on `app`; returns an error Response when it could not be applied."""
         serializer = AdminApproveRejectSerializer(data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
-        review_notes = serializer.validated_data.get('review_notes', '')
+        now = timezone.now()
+        changes = {
+            'status': decision,
+            'review_notes': serializer.validated_data.get('review_notes', ''),
+            'reviewed_by': request.user,
+            'reviewed_at': now,
+            'claimed_by': None,
+            'claim_expires_at': None,
+        }
+        updated = (
+            OwnerApplication.objects
+            .filter(open_to(request.user, now), pk=app.pk, status=ApplicationStatus.PENDING)
+            .update(**changes)
+        )
+        if not updated:
+            current = OwnerApplication.objects.filter(pk=app.pk).values('status', 'claim_expires_at').first()
+            if current is None:
+                raise NotFound()
+            if current['status'] != ApplicationStatus.PENDING:
+                return Response(
+                    {'detail': f'Application is already {current["status"]}.'},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            return Response(
+                {'detail': 'Another admin is reviewing this application.', 'claim_expires_at': current['claim_expires_at']},
+                status=status.HTTP_409_CONFLICT,
+            )
+        for name, value in changes.items():
+            setattr(app, name, value)
+        return None
+
+
+class AdminApproveView(ReviewDecisionMixin, generics.GenericAPIView):
+    queryset = OwnerApplication.objects.all().select_related('user')
+    permission_classes = [IsAdmin]
+    serializer_class = AdminApproveRejectSerializer
 
-        app.status = 'APPROVED'
-        app.review_notes = review_notes
-        app.reviewed_by = request.user
-        app.reviewed_at = timezone.now()
-        app.save(update_fields=['status', 'review_notes', 'reviewed_by', 'reviewed_at'])
+    @transaction.atomic
+    def patch(self, request, pk):
+        app = self.get_object()
+        error = self.decide(request, app, ApplicationStatus.APPROVED)
+        if error:
+            return error
 
         user = app.user
         user.role = 'OWNER'
@@ -62,26 +242,126 @@ class AdminApproveView(generics.GenericAPIView):
         }, status=status.HTTP_200_OK)
 
 
-class AdminRejectView(generics.GenericAPIView):
+class AdminRejectView(ReviewDecisionMixin, generics.GenericAPIView):
     queryset = OwnerApplication.objects.all()
     permission_classes = [IsAdmin]
     serializer_class = AdminApproveRejectSerializer
 
+    @transaction.atomic
     def patch(self, request, pk):
         app = self.get_object()
-        if app.status != 'PENDING':
-            return Response(
-                {'detail': f'Application is already {app.status}.'},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        serializer = AdminApproveRejectSerializer(data=request.data, partial=True)
+        error = self.decide(request, app, ApplicationStatus.REJECTED)
+        if error:
+            return error
+        return Response(OwnerApplicationSerializer(app).data, status=status.HTTP_200_OK)
+
+
+class AdminBulkReviewView(generics.GenericAPIView):
+    """
+    POST {"action": "approve" | "reject", "ids": [...], "review_notes": "..."}:
+    decide up to 500 applications in one transaction.
+
+    Every id gets a result: approved / rejected, or skipped with the reason
+    (not found, already decided, claimed by another admin, applicant already
+    owns a restaurant). The batch costs a fixed handful of queries however
+    many ids it has: lock the rows, one UPDATE of the applications and, for
+    approvals, one UPDATE of the applicants' roles and one bulk INSERT of their
+    restaurants. Those skip save() and its signals, so the token-version bump
+    and cache invalidation that AdminApproveView gets from them happen here.
+    """
+    permission_classes = [IsAdmin]
+    serializer_class = BulkReviewSerializer
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        review_notes = serializer.validated_data.get('review_notes', '')
+        approve = serializer.validated_data['action'] == 'approve'
+        decision = ApplicationStatus.APPROVED if approve else ApplicationStatus.REJECTED
+        ids = list(dict.fromkeys(serializer.validated_data['ids']))
+        now = timezone.now()
 
-        app.status = 'REJECTED'
-        app.review_notes = review_notes
-        app.reviewed_by = request.user
-        app.reviewed_at = timezone.now()
-        app.save(update_fields=['status', 'review_notes', 'reviewed_by', 'reviewed_at'])
+        with transaction.atomic():
+            # The same open_to() test decide() puts in its UPDATE, evaluated on the locked rows
+            locked = (
+                OwnerApplication.objects.filter(id__in=ids).select_for_update()
+                .annotate(is_open=Case(
+                    When(open_to(request.user, now), then=Value(True)),
+                    default=Value(False),
+                    output_field=BooleanField(),
+                ))
+            )
+            apps = {app.pk: app for app in locked}
+            # Restaurant.owner is one-to-one: an applicant gets at most one restaurant
+            owners = set()
+            if approve:
+                owners = set(
+                    Restaurant.objects.filter(owner_id__in={app.user_id for app in apps.values()})
+                    .values_list('owner_id', flat=True)
+                )
+            results, decided = [], []
+            for pk in ids:
+                app = apps.get(pk)
+                reason = self.skip_reason(app, owners if approve else None)
+                if reason:
+                    results.append({'id': pk, 'result': 'skipped', 'detail': reason})
+                    continue
+                decided.append(app)
+                owners.add(app.user_id)
+                results.append({'id': pk, 'result': decision.lower()})
 
-        return Response(OwnerApplicationSerializer(app).data, status=status.HTTP_200_OK)
+            if decided:
+                OwnerApplication.objects.filter(id__in=[app.pk for app in decided]).update(
+                    status=decision,
+                    review_notes=serializer.validated_data['review_notes'],
+                    reviewed_by=request.user,
+                    reviewed_at=now,
+                    claimed_by=None,
+                    claim_expires_at=None,
+                )
+            if approve and decided:
+                self.create_restaurants(decided, results)
+
+        return Response({
+            'decided': len(decided),
+            'skipped': len(results) - len(decided),
+            'results': results,
+        }, status=status.HTTP_200_OK)
+
+    @staticmethod
+    def skip_reason(app, owners=None):
+        if app is None:
+            return 'Not found.'
+        if app.status != ApplicationStatus.PENDING:
+            return f'Application is already {app.status}.'
+        if not app.is_open:
+            return 'Another admin is reviewing this application.'
+        if owners is not None and app.user_id in owners:
+            return 'Applicant already owns a restaurant.'
+        return None
+
+    @staticmethod
+    def create_restaurants(apps, results):
+        user_ids = [app.user_id for app in apps]
+        # What User.save() does for a role change: stale role claims in access tokens stop working
+        User.objects.filter(id__in=user_ids).exclude(role=Role.OWNER).update(
+            role=Role.OWNER, token_version=F('token_version') + 1,
+        )
+        restaurants = Restaurant.objects.bulk_create([
+            Restaurant(
+                owner_id=app.user_id,
+                name=app.restaurant_name,
+                address=app.business_address,
+                city=app.city,
+                google_maps_link=app.google_maps_link,
+                operating_hours=app.operating_hours or '',
+                phone=app.contact_phone or '',
+            )
+            for app in apps
+        ])
+        by_application = {app.pk: restaurant for app, restaurant in zip(apps, restaurants)}
+        for result in results:
+            restaurant = by_application.get(result['id'])
+            if restaurant is not None:
+                result['restaurant'] = {'id': restaurant.id, 'name': restaurant.name}
+        transaction.on_commit(lambda: forget_token_states(user_ids))
+        transaction.on_commit(bump_restaurant_list_version)
@@ -0,0 +1,107 @@
+"""
+Async versions of the I/O-bound endpoints, served at the same URLs when
+ASYNC_VIEWS is set (run the project under ASGI then, see DEPLOYMENT.md).
+
+- AsyncFileUploadView: stores the file through storage.astore_upload(). With
+  Supabase the transfer runs on a shared httpx connection pool, so a slow
+  upload holds a socket but no thread.
+- AsyncRestaurantListView / AsyncRestaurantDetailView: the public browse
+  endpoints on the async ORM and cache API. Caching, ETags, sparse fieldsets and
+  keyset pagination are the same as in the sync views they extend.
+
+DRF has no async support. AsyncAPIViewMixin re-implements APIView.dispatch so
+the handler can be a coroutine. initial(), which does authentication,
+permission checks, throttling and content negotiation, stays sync and runs in
+a worker thread.
+"""
+import inspect
+
+from asgiref.sync import sync_to_async
+from django.http import Http404
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .. import storage
+from ..cache import acached_conditional_response, acached_page_response, adetail_cache_key, alist_cache_key
+from ..conditional import adetail_validators
+from .restaurant_views import RestaurantDetailView, RestaurantListView
+from .upload_views import FileUploadView
+
+
+class AsyncAPIViewMixin(APIView):
+    """APIView.dispatch() for coroutine handlers."""
+
+    # A coroutine where APIView.dispatch returns the response; Django awaits it for async views
+    async def dispatch(self, request, *args, **kwargs):  # pyright: ignore[reportIncompatibleMethodOverride]
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            # Authentication may hit the cache or database
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            response = handler(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncFileUploadView(AsyncAPIViewMixin, FileUploadView):  # pyright: ignore[reportIncompatibleMethodOverride]
+    async def post(self, request):  # pyright: ignore[reportIncompatibleMethodOverride]
+        # The server has already buffered the body; parsing it is local file work, kept off the loop
+        file = await sync_to_async(lambda: request.FILES.get('file'), thread_sensitive=False)()
+        invalid = self.invalid_upload(file)
+        if invalid:
+            return invalid
+
+        try:
+            url = await storage.astore_upload(*self.upload_items({'file': file})['file'])
+        except storage.StorageNotConfigured as exc:
+            return Response({'detail': str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        except storage.StorageError as exc:
+            return self.storage_failure(exc)
+        return Response({'url': url}, status=status.HTTP_201_CREATED)
+
+
+class AsyncRestaurantListView(AsyncAPIViewMixin, RestaurantListView):  # pyright: ignore[reportIncompatibleMethodOverride]
+    async def get(self, request, *args, **kwargs):
+        return await acached_page_response(
+            request,
+            await alist_cache_key(request),
+            lambda: self._page(self.filter_queryset(self.get_queryset())),
+            self.page_validators,
+        )
+
+    async def _page(self, queryset):
+        if self.paginator is None:
+            return Response(self.get_serializer(await sync_to_async(list)(queryset), many=True).data)
+        page = await self.paginator.apaginate_queryset(queryset, self.request, view=self)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+
+class AsyncRestaurantDetailView(AsyncAPIViewMixin, RestaurantDetailView):  # pyright: ignore[reportIncompatibleMethodOverride]
+    async def get(self, request, *args, **kwargs):  # pyright: ignore[reportIncompatibleMethodOverride]
+        return await acached_conditional_response(
+            request,
+            await adetail_cache_key(request, kwargs['pk']),
+            lambda: adetail_validators(request, self.get_queryset().filter(pk=kwargs['pk'])),
+            self._retrieve,
+        )
+
+    async def _retrieve(self):
+        instance = await self.filter_queryset(self.get_queryset()).filter(pk=self.kwargs['pk']).afirst()
+        if instance is None:
+            raise Http404
+        self.check_object_permissions(self.request, instance)
+        return Response(self.get_serializer(instance).data)
@@ -1,14 +1,21 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
-from rest_framework_simplejwt.views import TokenObtainPairView
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 from django.contrib.auth import get_user_model
+from ..authentication import set_user_claims
 from ..serializers import UserSerializer, UserRegisterSerializer
 
 User = get_user_model()
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        return set_user_claims(super().get_token(user), user)
+
     def validate(self, attrs):
         data = super().validate(attrs)
         data['user'] = UserSerializer(self.user).data
@@ -20,6 +27,22 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     permission_classes = []
 
 
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """Issues the access token with the user's current claims, so role changes apply on refresh."""
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        user = User.objects.filter(pk=refresh.payload.get(api_settings.USER_ID_CLAIM)).first()
+        if not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(self.error_messages['no_active_account'], 'no_active_account')
+        # Refresh tokens are not rotated (ROTATE_REFRESH_TOKENS is off), so only the access token is returned
+        return {'access': str(set_user_claims(refresh, user).access_token)}
+
+
+class CustomTokenRefreshView(TokenRefreshView):
+    serializer_class = CustomTokenRefreshSerializer
+
+
 class RegisterView(generics.CreateAPIView):
     queryset = User.objects.all()
     serializer_class = UserRegisterSerializer
@@ -37,4 +60,5 @@ class MeView(generics.RetrieveUpdateAPIView):
     permission_classes = []
 
     def get_object(self):
-        return self.request.user
+        # request.user only carries the token claims; the profile needs the whole row
+        return User.objects.get(pk=self.request.user.pk)
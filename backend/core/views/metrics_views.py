@@ -0,0 +1,19 @@
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .. import metrics
+from ..permissions import HasMetricsToken
+
+
+class MetricsView(APIView):
+    """Prometheus scrape endpoint; needs METRICS_TOKEN as a bearer token (see core.metrics)."""
+    authentication_classes = []
+    permission_classes = [HasMetricsToken]
+
+    def get(self, request):
+        if not metrics.enabled():
+            return Response({'detail': 'prometheus_client is not installed.'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        body, content_type = metrics.exposition()
+        return HttpResponse(body, content_type=content_type)
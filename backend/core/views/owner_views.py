@@ -1,5 +1,6 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
+from ..fieldsets import SparseQuerysetMixin
 from ..models import OwnerApplication
 from ..serializers import OwnerApplicationSerializer
 from ..permissions import IsAdmin
@@ -20,18 +21,23 @@ class OwnerApplyView(generics.CreateAPIView):
         return super().create(request, *args, **kwargs)
 
 
-class OwnerApplicationStatusView(generics.ListAPIView):
+class OwnerApplicationStatusView(SparseQuerysetMixin, generics.ListAPIView):
     serializer_class = OwnerApplicationSerializer
 
     def get_queryset(self):
-        return OwnerApplication.objects.filter(user=self.request.user).order_by('-submitted_at')
+        # user_email/user_name read the user, so join it rather than loading it per row
+        return (
+            OwnerApplication.objects.filter(user=self.request.user)
+            .select_related('user')
+            .order_by('-submitted_at')
+        )
 
     def list(self, request, *args, **kwargs):
-        qs = self.get_queryset()
-        if not qs.exists():
+        # One query: the newest application is the first row of the list
+        applications = list(self.filter_queryset(self.get_queryset()))
+        if not applications:
             return Response({'applications': [], 'latest': None})
-        latest = qs.first()
         return Response({
-            'applications': OwnerApplicationSerializer(qs, many=True).data,
-            'latest': OwnerApplicationSerializer(latest).data,
+            'applications': self.get_serializer(applications, many=True).data,
+            'latest': self.get_serializer(applications[0]).data,
         })
@@ -1,35 +1,99 @@
 from rest_framework import generics, permissions
-from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from ..cache import cached_conditional_response, cached_page_response, detail_cache_key, list_cache_key
+from ..conditional import detail_validators, page_validators
+from ..fieldsets import SparseQuerysetMixin
+from ..geo import filter_near
 from ..models import Restaurant, RestaurantPhoto
 from ..serializers import (
     RestaurantSerializer,
+    RestaurantListItemSerializer,
     RestaurantPublicSerializer,
     RestaurantPhotoSerializer,
 )
+from ..pagination import RestaurantPagination
 from ..permissions import IsOwner
-
-
-class RestaurantListView(generics.ListAPIView):
-    """Public list of active restaurants; search by name/address/city, filter by city."""
-    serializer_class = RestaurantPublicSerializer
+from ..search import search_restaurants
+
+DEFAULT_RADIUS_KM = 5.0
+MAX_RADIUS_KM = 100.0
+
+
+def parse_near(query_params):
+    """Parse ?near=lat,lng&radius_km= into (lat, lng, radius_km), or None when absent."""
+    near = query_params.get('near', '').strip()
+    if not near:
+        return None
+    try:
+        lat, lng = (float(part) for part in near.split(','))
+    except ValueError:
+        raise ValidationError({'near': 'Expected "latitude,longitude".'})
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        raise ValidationError({'near': 'Coordinates out of range.'})
+    try:
+        radius_km = float(query_params.get('radius_km') or DEFAULT_RADIUS_KM)
+    except ValueError:
+        raise ValidationError({'radius_km': 'Must be a number.'})
+    if not 0 < radius_km <= MAX_RADIUS_KM:
+        raise ValidationError({'radius_km': f'Must be between 0 and {MAX_RADIUS_KM:g}.'})
+    return lat, lng, radius_km
+
+
+class RestaurantListView(SparseQuerysetMixin, generics.ListAPIView):
+    """
+    Public list of active restaurants, cursor-paginated by (name, id).
+
+    ?search= matches name/city/address (full-text + trigram on Postgres) and
+    orders by relevance instead; ?city= filters by city.
+    ?near=lat,lng&radius_km= keeps restaurants within the radius, nearest
+    first, with distance_km on each result.
+
+    Results carry cover_photo_url, cover_photo_variants and photo_count, stored on the restaurant,
+    so the query never reads restaurant_photos; the detail endpoint has the photos.
+    """
+    serializer_class = RestaurantListItemSerializer
     permission_classes = [permissions.AllowAny]
+    pagination_class = RestaurantPagination
+    # Read by page_validators() even when ?fields= leaves it out
+    sparse_required_fields = ('updated_at',)
 
     def get_queryset(self):
-        qs = Restaurant.objects.filter(status='ACTIVE').prefetch_related('photos').order_by('name')
+        qs = Restaurant.objects.filter(status='ACTIVE')
         search = self.request.query_params.get('search', '').strip()
         city = self.request.query_params.get('city', '').strip()
         if search:
-            qs = qs.filter(
-                Q(name__icontains=search) |
-                Q(address__icontains=search) |
-                Q(city__icontains=search)
-            )
+            qs = search_restaurants(qs, search)
         if city:
             qs = qs.filter(city__icontains=city)
+        near = parse_near(self.request.query_params)
+        if near:
+            qs = filter_near(qs, *near)
         return qs
 
-
-class RestaurantDetailView(generics.RetrieveAPIView):
+    def list(self, request, *args, **kwargs):
+        return cached_page_response(
+            request,
+            list_cache_key(request),
+            lambda: super(RestaurantListView, self).list(request, *args, **kwargs),
+            self.page_validators,
+        )
+
+    def page_validators(self):
+        """ETag/Last-Modified for the page just fetched by the paginator."""
+        paginator = self.paginator
+        if paginator is None:
+            return None, None
+        return page_validators(self.request, paginator.page, paginator.has_next, paginator.has_previous)
+
+    def get_keyset_ordering(self):
+        if self.request.query_params.get('near', '').strip():
+            return ('distance_km', 'id')
+        if self.request.query_params.get('search', '').strip():
+            return ('-rank', 'id')
+        return RestaurantPagination.ordering
+
+
+class RestaurantDetailView(SparseQuerysetMixin, generics.RetrieveAPIView):
     """Public detail for a single active restaurant."""
     serializer_class = RestaurantPublicSerializer
     permission_classes = [permissions.AllowAny]
@@ -37,8 +101,17 @@ class RestaurantDetailView(generics.RetrieveAPIView):
     def get_queryset(self):
         return Restaurant.objects.filter(status='ACTIVE').prefetch_related('photos')
 
+    # Returns a plain HttpResponseNotModified for a 304
+    def retrieve(self, request, *args, **kwargs):  # pyright: ignore[reportIncompatibleMethodOverride]
+        return cached_conditional_response(
+            request,
+            detail_cache_key(request, kwargs['pk']),
+            lambda: detail_validators(request, self.get_queryset().filter(pk=kwargs['pk'])),
+            lambda: super(RestaurantDetailView, self).retrieve(request, *args, **kwargs),
+        )
+
 
-class MyRestaurantView(generics.RetrieveUpdateAPIView):
+class MyRestaurantView(SparseQuerysetMixin, generics.RetrieveUpdateAPIView):
     """Owner: get or update their restaurant."""
     serializer_class = RestaurantSerializer
     permission_classes = [IsOwner]
@@ -47,7 +120,7 @@ class MyRestaurantView(generics.RetrieveUpdateAPIView):
         return Restaurant.objects.prefetch_related('photos')
 
     def get_object(self):
-        return self.get_queryset().get(owner=self.request.user)
+        return self.filter_queryset(self.get_queryset()).get(owner=self.request.user)
 
 
 class MyRestaurantPhotoCreateView(generics.CreateAPIView):
@@ -1,7 +1,10 @@
 from rest_framework import generics
+from rest_framework.exceptions import ValidationError
 from django.db.models import Q
 from django.contrib.auth import get_user_model
+from ..fieldsets import SparseQuerysetMixin
 from ..models import Role
+from ..pagination import UserPagination
 from ..serializers import (
     SuperAdminUserListSerializer,
     SuperAdminUserCreateSerializer,
@@ -12,22 +15,43 @@ from ..permissions import IsSuperAdmin
 User = get_user_model()
 
 
-class SuperAdminUserListView(generics.ListAPIView):
-    """List users with optional search by name or email."""
+class SuperAdminUserListView(SparseQuerysetMixin, generics.ListAPIView):
+    """
+    User directory, newest first, cursor-paginated by (created_at, id).
+
+    ?search= matches emails starting with the term or names containing it
+    (case-insensitive); on PostgreSQL these use an UPPER(email) prefix index and
+    a trigram index on UPPER(name) (migration 0014). ?role= (one value or a
+    comma-separated list) and ?is_active=true|false filter; ?count=estimate or
+    ?count=exact add a total (see UserPagination).
+    """
     serializer_class = SuperAdminUserListSerializer
     permission_classes = [IsSuperAdmin]
+    pagination_class = UserPagination
 
     def get_queryset(self):
-        qs = User.objects.all().order_by('-created_at')
-        search = self.request.query_params.get('search', '').strip()
+        qs = User.objects.all()
+        params = self.request.query_params
+        search = params.get('search', '').strip()
         if search:
             qs = qs.filter(
-                Q(name__icontains=search) | Q(email__icontains=search)
+                Q(email__istartswith=search) | Q(name__icontains=search)
             )
+        roles = [part.strip().upper() for part in params.get('role', '').split(',') if part.strip()]
+        if roles:
+            unknown = sorted(set(roles) - set(Role.values))
+            if unknown:
+                raise ValidationError({'role': f'Unknown role: {", ".join(unknown)}.'})
+            qs = qs.filter(role__in=roles)
+        is_active = params.get('is_active', '').strip().lower()
+        if is_active in ('true', 'false'):
+            qs = qs.filter(is_active=is_active == 'true')
+        elif is_active:
+            raise ValidationError({'is_active': 'Expected "true" or "false".'})
         return qs
 
 
-class SuperAdminUserDetailView(generics.RetrieveUpdateAPIView):
+class SuperAdminUserDetailView(SparseQuerysetMixin, generics.RetrieveUpdateAPIView):
     """Retrieve or update user (role, is_active, etc.)."""
     queryset = User.objects.all()
     serializer_class = SuperAdminUserUpdateSerializer
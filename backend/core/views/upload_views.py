@@ -1,86 +1,165 @@
-import os
-import uuid
 import mimetypes
 
-import requests
 from django.conf import settings
 from rest_framework import status
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .. import metrics, storage
+from ..uploads import (
+    ALLOWED_EXTENSIONS,
+    MAX_FILE_SIZE,
+    ValidatingUploadHandler,
+    check_content_length,
+    file_extension,
+)
 
-ALLOWED_EXTENSIONS = {'pdf', 'jpg', 'jpeg', 'png', 'gif', 'webp'}
-# Strict limit: 20 MB
-MAX_FILE_SIZE = 20 * 1024 * 1024
 
+def validate_upload(file):
+    """Error message for a file we won't store, or None."""
+    ext = file_extension(file.name)
+    if ext not in ALLOWED_EXTENSIONS:
+        return f'Allowed types: {", ".join(sorted(ALLOWED_EXTENSIONS))}'
+    if file.size > MAX_FILE_SIZE:
+        return 'File too large (max 20MB).'
+    return None
 
-class FileUploadView(APIView):
+
+def object_path_for(file, digest):
+    """Content-addressed path in a mime-based folder, e.g. pdf/<sha256>.pdf."""
+    ext = file_extension(file.name)
+    # Determine folder based on extension (pdf/, jpg/, png/, etc.)
+    folder = 'jpg' if ext in {'jpg', 'jpeg'} else ext
+    return f'{folder}/{digest}.{folder}'
+
+
+def content_type_for(file):
+    return file.content_type or mimetypes.guess_type(file.name)[0] or 'application/octet-stream'
+
+
+class UploadGuardMixin(APIView):
     """
-    Uploads a file to Supabase Storage 'media' bucket and returns a public URL.
+    Validates uploads while they stream in: a too-large Content-Length is refused
+    before parsing, and ValidatingUploadHandler aborts the body on the first bad
+    file. Views call upload_rejection() after touching request.FILES.
+    """
+    max_upload_files = 1
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        check_content_length(request, self.max_upload_files)
+        self.upload_guard = ValidatingUploadHandler(request._request, max_files=self.max_upload_files)
+        request.upload_handlers.insert(0, self.upload_guard)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        guard = getattr(self, 'upload_guard', None)
+        if guard is not None:
+            outcome = 'stored' if status.is_success(response.status_code) else 'rejected'
+            metrics.record_upload(request.resolver_match.view_name, guard.total_bytes, outcome)
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def upload_items(self, files):
+        """store_uploads() input for {key: file}, using digests computed while streaming."""
+        items = {}
+        for key, file in files.items():
+            digest = self.upload_guard.digests.get(key) or storage.file_sha256(file)
+            items[key] = (file, digest, object_path_for(file, digest), content_type_for(file))
+        return items
+
+    def upload_rejection(self):
+        if self.upload_guard.error is None:
+            return None
+        status_code, detail = self.upload_guard.error
+        return Response({'detail': detail}, status=status_code)
+
+
+class FileUploadView(UploadGuardMixin, APIView):
+    """
+    Uploads a file to the configured storage backend and returns a public URL.
 
-    Files are stored in mime-based folders, e.g. pdf/<filename>, jpg/<filename>.
+    Files are stored in mime-based folders under their SHA-256, e.g.
+    pdf/<sha256>.pdf; content that was stored before is not transferred again.
     """
     parser_classes = [MultiPartParser, FormParser]
 
     def post(self, request):
         file = request.FILES.get('file')
+        invalid = self.invalid_upload(file)
+        if invalid:
+            return invalid
+
+        # Streamed through the configured backend (core.storage), unless already stored
+        try:
+            urls, errors = storage.store_uploads(self.upload_items({'file': file}))
+        except storage.StorageNotConfigured as exc:
+            return Response({'detail': str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        if errors:
+            return self.storage_failure(errors['file'])
+
+        return Response({'url': urls['file']}, status=status.HTTP_201_CREATED)
+
+    def invalid_upload(self, file):
+        """Error response for a rejected, missing or disallowed file, or None."""
+        rejection = self.upload_rejection()
+        if rejection:
+            return rejection
         if not file:
             return Response({'detail': 'No file provided.'}, status=status.HTTP_400_BAD_REQUEST)
+        error = validate_upload(file)
+        if error:
+            return Response({'detail': error}, status=status.HTTP_400_BAD_REQUEST)
+        return None
+
+    @staticmethod
+    def storage_failure(exc):
+        body = {'detail': str(exc)}
+        if exc.status_code is not None:
+            body['status_code'] = exc.status_code
+        return Response(body, status=status.HTTP_502_BAD_GATEWAY)
+
+
+class BatchFileUploadView(UploadGuardMixin, APIView):
+    """
+    Uploads several files in one multipart request, e.g. the owner application's
+    proof_document_url/business_card_url/... files, transferring the ones not
+    already stored concurrently. Returns {'urls': {<field name>: <url>}}.
+
+    Every file is validated before anything is stored. If some transfers fail,
+    the response is 502 with the URLs that did succeed plus per-field errors.
+    """
+    parser_classes = [MultiPartParser, FormParser]
+
+    @property
+    def max_upload_files(self):
+        return getattr(settings, 'MAX_BATCH_UPLOAD_FILES', 10)
+
+    def post(self, request):
+        files, errors = {}, {}
+        for key, field_files in request.FILES.lists():
+            # A repeated field would otherwise keep only its last file
+            if len(field_files) > 1:
+                errors[key] = 'Only one file per field.'
+            else:
+                files[key] = field_files[0]
+        rejection = self.upload_rejection()
+        if rejection:
+            return rejection
+        if not files and not errors:
+            return Response({'detail': 'No files provided.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        errors.update((key, error) for key, file in files.items() if (error := validate_upload(file)))
+        if errors:
+            return Response({'detail': 'Invalid files.', 'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
 
-        ext = os.path.splitext(file.name)[1].lstrip('.').lower()
-        if ext not in ALLOWED_EXTENSIONS:
-            return Response(
-                {'detail': f'Allowed types: {", ".join(sorted(ALLOWED_EXTENSIONS))}'},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        if file.size > MAX_FILE_SIZE:
-            return Response({'detail': 'File too large (max 20MB).'}, status=status.HTTP_400_BAD_REQUEST)
-
-        supabase_url = getattr(settings, 'SUPABASE_URL', None)
-        supabase_key = getattr(settings, 'SUPABASE_SERVICE_KEY', None)
-        bucket = getattr(settings, 'SUPABASE_MEDIA_BUCKET', 'media')
-        if not supabase_url or not supabase_key:
-            return Response(
-                {'detail': 'Supabase storage is not configured on the server.'},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-
-        # Determine folder based on extension (pdf/, jpg/, png/, etc.)
-        folder = ext
-        if ext in {'jpg', 'jpeg'}:
-            folder = 'jpg'
-
-        # Build safe unique filename
-        original_name = os.path.basename(file.name)
-        safe_name = original_name.replace(' ', '_')
-        unique_name = f'{uuid.uuid4().hex}_{safe_name}'
-        object_path = f'{folder}/{unique_name}'
-
-        content_type = file.content_type or mimetypes.guess_type(original_name)[0] or 'application/octet-stream'
-
-        upload_url = f'{supabase_url.rstrip("/")}/storage/v1/object/{bucket}/{object_path}'
-        headers = {
-            'Authorization': f'Bearer {supabase_key}',
-            'apikey': supabase_key,
-            'Content-Type': content_type,
-        }
-
-        # Stream file to Supabase Storage
         try:
-            resp = requests.post(upload_url, headers=headers, data=file.read())
-        except Exception as exc:
-            return Response(
-                {'detail': f'Error uploading to storage: {exc}'},
-                status=status.HTTP_502_BAD_GATEWAY,
-            )
-
-        if resp.status_code not in (200, 201):
-            return Response(
-                {'detail': 'Upload to storage failed.', 'status_code': resp.status_code},
-                status=status.HTTP_502_BAD_GATEWAY,
-            )
-
-        # Public URL for the stored object (bucket must be public in Supabase)
-        public_url = f'{supabase_url.rstrip("/")}/storage/v1/object/public/{bucket}/{object_path}'
-        return Response({'url': public_url}, status=status.HTTP_201_CREATED)
+            urls, failures = storage.store_uploads(self.upload_items(files))
+        except storage.StorageNotConfigured as exc:
+            return Response({'detail': str(exc)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        if failures:
+            return Response({
+                'detail': 'Upload to storage failed.',
+                'urls': urls,
+                'errors': {key: str(exc) for key, exc in failures.items()},
+            }, status=status.HTTP_502_BAD_GATEWAY)
+        return Response({'urls': urls}, status=status.HTTP_201_CREATED)
@@ -0,0 +1,31 @@
+"""
+Gunicorn hooks for multiprocess Prometheus metrics (core.metrics) and database
+connection pools (core.backends.postgresql_pool).
+
+Loaded automatically from the working directory. Worker count, threads and
+bind address stay on the command line in the Dockerfile.
+"""
+import os
+import shutil
+
+
+def on_starting(server):
+    # Samples from a previous run must not leak into this one
+    path = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def worker_exit(server, worker):
+    # Close pooled connections cleanly instead of leaving Postgres to notice dead sockets
+    from django.db import connections
+    for conn in connections.all():
+        if hasattr(conn, 'close_pool'):
+            conn.close_pool()
@@ -53,13 +53,26 @@ export const owner = {
       headers: { 'Content-Type': 'multipart/form-data' },
     });
   },
+  // files: { proof_document_url: File, ... } -> { urls: { proof_document_url: url, ... } }
+  uploadBatch: (files) => {
+    const form = new FormData();
+    Object.entries(files).forEach(([field, file]) => form.append(field, file));
+    return api.post('/owner/upload/batch/', form, {
+      headers: { 'Content-Type': 'multipart/form-data' },
+    });
+  },
 };
 
 export const admin = {
-  listApplications: () => api.get('/admin/owner-applications/'),
+  listApplications: (params = {}) => api.get('/admin/owner-applications/', { params }),
   getApplication: (id) => api.get(`/admin/owner-applications/${id}/`),
   approve: (id, review_notes = '') => api.patch(`/admin/owner-applications/${id}/approve/`, { review_notes }),
   reject: (id, review_notes = '') => api.patch(`/admin/owner-applications/${id}/reject/`, { review_notes }),
+  claimNext: (count = 10) => api.post('/admin/owner-applications/claim/', { count }),
+  renewClaims: (ids) => api.post('/admin/owner-applications/claim/renew/', ids ? { ids } : {}),
+  releaseClaims: (ids) => api.post('/admin/owner-applications/claim/release/', ids ? { ids } : {}),
+  bulkReview: (action, ids, review_notes = '') =>
+    api.post('/admin/owner-applications/bulk-review/', { action, ids, review_notes }),
 };
 
 export const restaurants = {
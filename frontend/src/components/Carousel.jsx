@@ -1,7 +1,8 @@
 import { useState, useEffect } from 'react';
 import './Carousel.css';
 
-export default function Carousel({ images, alt = '', intervalMs = 0, className = '' }) {
+// images: URLs, or { image_url, srcset } objects; `sizes` goes with the srcsets
+export default function Carousel({ images, alt = '', intervalMs = 0, className = '', sizes }) {
   const [index, setIndex] = useState(0);
   const list = Array.isArray(images) && images.length > 0 ? images : [];
 
@@ -19,16 +20,16 @@ export default function Carousel({ images, alt = '', intervalMs = 0, className =
     );
   }
 
-  const current = typeof list[index] === 'object' && list[index]?.image_url
-    ? list[index].image_url
-    : list[index];
+  const item = list[index];
+  const current = typeof item === 'object' && item?.image_url ? item.image_url : item;
+  const srcSet = typeof item === 'object' ? item?.srcset || undefined : undefined;
 
   const stopNav = (e) => e.stopPropagation();
 
   return (
     <div className={`carousel ${className}`.trim()} onClick={stopNav}>
       <div className="carousel-slide">
-        <img src={current} alt={alt} />
+        <img src={current} srcSet={srcSet} sizes={srcSet ? sizes : undefined} alt={alt} />
       </div>
       {list.length > 1 && (
         <>
@@ -24,7 +24,8 @@ const initial = {
 
 export default function Apply() {
   const [form, setForm] = useState(initial);
-  const [uploading, setUploading] = useState(null);
+  // Chosen documents by form field; all of them go up in one batch on submit
+  const [files, setFiles] = useState({});
   const [error, setError] = useState('');
   const [submitting, setSubmitting] = useState(false);
   const navigate = useNavigate();
@@ -34,19 +35,14 @@ export default function Apply() {
     setForm((prev) => ({ ...prev, [name]: type === 'checkbox' ? checked : value }));
   };
 
-  const handleFile = async (e, field) => {
+  const handleFile = (e, field) => {
     const file = e.target.files?.[0];
-    if (!file) return;
-    setUploading(field);
-    setError('');
-    try {
-      const { data } = await owner.upload(file);
-      setForm((prev) => ({ ...prev, [field]: data.url }));
-    } catch (err) {
-      setError(err.response?.data?.detail || 'Upload failed.');
-    } finally {
-      setUploading(null);
-    }
+    setFiles((prev) => {
+      const next = { ...prev };
+      if (file) next[field] = file;
+      else delete next[field];
+      return next;
+    });
   };
 
   const handleSubmit = async (e) => {
@@ -54,14 +50,22 @@ export default function Apply() {
     setError('');
     setSubmitting(true);
     try {
-      await owner.apply(form);
+      let body = form;
+      if (Object.keys(files).length) {
+        const { data } = await owner.uploadBatch(files);
+        body = { ...form, ...data.urls };
+        // Keep the URLs so a retry after a validation error doesn't upload again
+        setForm(body);
+        setFiles({});
+      }
+      await owner.apply(body);
       navigate('/application-status');
     } catch (err) {
       const d = err.response?.data;
       if (typeof d === 'string') {
         setError(d);
       } else if (d && typeof d === 'object') {
-        const first = d.detail || (typeof d.declaration_accepted !== 'undefined' && d.declaration_accepted?.[0])
+        const first = (d.errors && Object.values(d.errors).find(Boolean)) || d.detail || (typeof d.declaration_accepted !== 'undefined' && d.declaration_accepted?.[0])
           || d.google_maps_link?.[0] || Object.values(d).flat().find(Boolean);
         setError(first || 'Submission failed. Please check required fields and try again.');
       } else {
@@ -121,9 +125,7 @@ export default function Apply() {
             <div key={key} className="apply-file-row">
               <label>{label}{required ? ' *' : ''}</label>
               <div className="apply-file-wrap">
-                <input type="file" accept=".pdf,.jpg,.jpeg,.png,.gif,.webp" onChange={(e) => handleFile(e, key)} disabled={!!uploading} />
-                {form[key] && <a href={form[key]} target="_blank" rel="noreferrer" className="apply-link">View</a>}
-                {uploading === key && <span className="apply-uploading">Uploading...</span>}
+                <input type="file" accept=".pdf,.jpg,.jpeg,.png,.gif,.webp" onChange={(e) => handleFile(e, key)} disabled={submitting} />
               </div>
             </div>
           ))}
@@ -135,9 +137,7 @@ export default function Apply() {
             <div key={key} className="apply-file-row">
               <label>{label}</label>
               <div className="apply-file-wrap">
-                <input type="file" accept=".jpg,.jpeg,.png,.gif,.webp" onChange={(e) => handleFile(e, key)} disabled={!!uploading} />
-                {form[key] && <a href={form[key]} target="_blank" rel="noreferrer" className="apply-link">View</a>}
-                {uploading === key && <span className="apply-uploading">Uploading...</span>}
+                <input type="file" accept=".jpg,.jpeg,.png,.gif,.webp" onChange={(e) => handleFile(e, key)} disabled={submitting} />
               </div>
             </div>
           ))}
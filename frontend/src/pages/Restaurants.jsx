@@ -8,6 +8,14 @@ import 'leaflet/dist/leaflet.css';
 import './Restaurants.css';
 
 const DEBOUNCE_MS = 400;
+const NEAR_RADIUS_KM = 10;
+// Cards are at least 280px wide (Restaurants.css), one per row on phones
+const CARD_IMAGE_SIZES = '(max-width: 640px) 100vw, 400px';
+// The map plots every match, not just the loaded list pages, so it pages
+// through the results itself with only the fields a marker needs.
+const MAP_FIELDS = 'id,name,address,city,latitude,longitude,google_maps_link';
+const MAP_PAGE_SIZE = 100;
+const MAP_MAX_PAGES = 20;
 
 // Fix default marker icon in react-leaflet
 delete L.Icon.Default.prototype._getIconUrl;
@@ -20,6 +28,15 @@ L.Icon.Default.mergeOptions({
 const DEFAULT_CENTER = [20.5937, 78.9629]; // India
 const DEFAULT_ZOOM = 5;
 
+function cursorFromUrl(url) {
+  if (!url) return null;
+  try {
+    return new URL(url).searchParams.get('cursor');
+  } catch (_) {
+    return null;
+  }
+}
+
 function MapFitBounds({ locations }) {
   const map = useMap();
   const hasPoints = locations.length > 0;
@@ -42,7 +59,12 @@ export default function Restaurants() {
   const [search, setSearch] = useState('');
   const [cityFilter, setCityFilter] = useState('');
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [near, setNear] = useState(null); // { lat, lng } when "Near me" is on
+  const [locating, setLocating] = useState(false);
   const [view, setView] = useState('list'); // 'list' | 'map'
+  const [mapPoints, setMapPoints] = useState(null); // all matches, loaded when the map is shown
 
   // Debounce search and city before calling API
   useEffect(() => {
@@ -53,19 +75,96 @@ export default function Restaurants() {
     return () => clearTimeout(t);
   }, [searchInput, cityInput]);
 
-  useEffect(() => {
+  const buildParams = () => {
     const params = {};
     if (search) params.search = search;
     if (cityFilter) params.city = cityFilter;
+    if (near) {
+      params.near = `${near.lat},${near.lng}`;
+      params.radius_km = NEAR_RADIUS_KM;
+    }
+    return params;
+  };
+
+  const toggleNear = () => {
+    if (near) {
+      setNear(null);
+      return;
+    }
+    if (!navigator.geolocation) return;
+    setLocating(true);
+    navigator.geolocation.getCurrentPosition(
+      (pos) => {
+        setNear({ lat: pos.coords.latitude.toFixed(6), lng: pos.coords.longitude.toFixed(6) });
+        setLocating(false);
+      },
+      () => setLocating(false),
+    );
+  };
+
+  useEffect(() => {
     setLoading(true);
     restaurants
-      .list(params)
-      .then(({ data }) => setList(Array.isArray(data) ? data : []))
-      .catch(() => setList([]))
+      .list(buildParams())
+      .then(({ data }) => {
+        setList(Array.isArray(data?.results) ? data.results : []);
+        setNextCursor(cursorFromUrl(data?.next));
+      })
+      .catch(() => {
+        setList([]);
+        setNextCursor(null);
+      })
       .finally(() => setLoading(false));
-  }, [search, cityFilter]);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [search, cityFilter, near]);
+
+  const loadMore = () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    restaurants
+      .list({ ...buildParams(), cursor: nextCursor })
+      .then(({ data }) => {
+        setList((prev) => [...prev, ...(Array.isArray(data?.results) ? data.results : [])]);
+        setNextCursor(cursorFromUrl(data?.next));
+      })
+      .catch(() => setNextCursor(null))
+      .finally(() => setLoadingMore(false));
+  };
 
-  const withCoords = useMemo(() => list.filter((r) => r.latitude != null && r.longitude != null), [list]);
+  // Filters changed: the map's results are stale
+  useEffect(() => {
+    setMapPoints(null);
+  }, [search, cityFilter, near]);
+
+  useEffect(() => {
+    if (view !== 'map' || mapPoints !== null) return undefined;
+    let cancelled = false;
+    const loadAll = async () => {
+      const points = [];
+      let cursor = null;
+      for (let page = 0; page < MAP_MAX_PAGES; page += 1) {
+        const params = { ...buildParams(), fields: MAP_FIELDS, page_size: MAP_PAGE_SIZE };
+        if (cursor) params.cursor = cursor;
+        const { data } = await restaurants.list(params);
+        points.push(...(Array.isArray(data?.results) ? data.results : []));
+        cursor = cursorFromUrl(data?.next);
+        if (!cursor) break;
+      }
+      return points;
+    };
+    loadAll()
+      .then((points) => !cancelled && setMapPoints(points))
+      .catch(() => !cancelled && setMapPoints(list));
+    return () => {
+      cancelled = true;
+    };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [view, mapPoints, search, cityFilter, near]);
+
+  const withCoords = useMemo(
+    () => (mapPoints ?? list).filter((r) => r.latitude != null && r.longitude != null),
+    [mapPoints, list],
+  );
 
   return (
     <div className="restaurants-page">
@@ -90,6 +189,14 @@ export default function Restaurants() {
             />
           </div>
           <div className="restaurants-view-toggle">
+            <button
+              type="button"
+              className={near ? 'active' : ''}
+              onClick={toggleNear}
+              disabled={locating}
+            >
+              {locating ? 'Locating...' : 'Near me'}
+            </button>
             <button
               type="button"
               className={view === 'list' ? 'active' : ''}
@@ -119,14 +226,21 @@ export default function Restaurants() {
               {list.map((r) => (
                 <li key={r.id} className="restaurant-card">
                   <div className="restaurant-card-carousel-wrap">
-                    <Carousel images={r.photos || []} alt={r.name} intervalMs={4000} className="restaurant-card-carousel" />
+                    <Carousel
+                      images={r.cover_photo_url ? [{ image_url: r.cover_photo_url, srcset: r.cover_photo_variants?.webp }] : []}
+                      sizes={CARD_IMAGE_SIZES}
+                      alt={r.name}
+                      className="restaurant-card-carousel"
+                    />
                   </div>
                   <Link to={`/restaurants/${r.id}`} className="restaurant-card-link">
                     <div className="restaurant-card-body">
                       <h3>{r.name}</h3>
                       <p className="restaurant-address">{r.address}</p>
                       <p className="restaurant-city">{r.city}</p>
+                      {r.distance_km != null && <p className="restaurant-distance">{r.distance_km.toFixed(1)} km away</p>}
                       {r.operating_hours && <p className="restaurant-hours">{r.operating_hours}</p>}
+                      {r.photo_count > 1 && <p className="restaurant-photo-count">{r.photo_count} photos</p>}
                     </div>
                   </Link>
                   {r.google_maps_link && (
@@ -138,6 +252,13 @@ export default function Restaurants() {
               ))}
             </ul>
           )}
+          {nextCursor && (
+            <div className="restaurants-load-more">
+              <button type="button" onClick={loadMore} disabled={loadingMore}>
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       ) : (
         <div className="restaurants-map-wrap">
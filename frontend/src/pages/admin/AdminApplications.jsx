@@ -3,45 +3,166 @@ import { Link } from 'react-router-dom';
 import { admin } from '../../api';
 import './AdminApplications.css';
 
-export default function AdminApplications() {
+function cursorFromUrl(url) {
+  if (!url) return null;
+  try {
+    return new URL(url).searchParams.get('cursor');
+  } catch (_) {
+    return null;
+  }
+}
+
+const MINE = { status: 'PENDING', claimed: 'mine' };
+const AVAILABLE = { status: 'PENDING', claimed: 'available' };
+const REVIEWED = { status: 'APPROVED,REJECTED' };
+const CLAIM_COUNT = 10;
+
+// One cursor-paginated slice of the queue (filters are query params), loaded a page at a time
+function useApplicationPages(filters) {
   const [list, setList] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState('');
+  const [version, setVersion] = useState(0);
 
   useEffect(() => {
     admin
-      .listApplications()
-      .then(({ data }) => setList(data))
+      .listApplications(filters)
+      .then(({ data }) => {
+        setList(data.results);
+        setNextCursor(cursorFromUrl(data.next));
+      })
       .catch((err) => setError(err.response?.data?.detail || 'Failed to load'))
       .finally(() => setLoading(false));
-  }, []);
+  }, [filters, version]);
+
+  const loadMore = () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    admin
+      .listApplications({ ...filters, cursor: nextCursor })
+      .then(({ data }) => {
+        setList((prev) => [...prev, ...data.results]);
+        setNextCursor(cursorFromUrl(data.next));
+      })
+      .catch(() => setNextCursor(null))
+      .finally(() => setLoadingMore(false));
+  };
+
+  const reload = () => setVersion((v) => v + 1);
+
+  return { list, hasMore: Boolean(nextCursor), loading, loadingMore, error, loadMore, reload };
+}
+
+function LoadMore({ pages }) {
+  if (!pages.hasMore) return null;
+  return (
+    <div className="admin-load-more">
+      <button type="button" onClick={pages.loadMore} disabled={pages.loadingMore}>
+        {pages.loadingMore ? 'Loading...' : 'Load more'}
+      </button>
+    </div>
+  );
+}
+
+function ApplicationLink({ app }) {
+  return (
+    <li className="admin-list-item pending">
+      <Link to={`/admin/applications/${app.id}`}>
+        <strong>{app.restaurant_name}</strong> — {app.user_name} ({app.user_email})
+      </Link>
+      <span className="admin-date">{new Date(app.submitted_at).toLocaleString()}</span>
+    </li>
+  );
+}
+
+export default function AdminApplications() {
+  // Admins claim work from the pending queue so two of them never review the same application
+  const minePages = useApplicationPages(MINE);
+  const pendingPages = useApplicationPages(AVAILABLE);
+  const reviewedPages = useApplicationPages(REVIEWED);
+  const [claiming, setClaiming] = useState(false);
+  const [claimError, setClaimError] = useState('');
+
+  const changeClaims = (request) => {
+    setClaiming(true);
+    setClaimError('');
+    request()
+      .then(() => {
+        minePages.reload();
+        pendingPages.reload();
+        reviewedPages.reload();
+      })
+      .catch((err) => setClaimError(err.response?.data?.detail || 'Claim failed'))
+      .finally(() => setClaiming(false));
+  };
 
-  if (loading) return <div className="admin-loading">Loading applications...</div>;
+  if (minePages.loading || pendingPages.loading || reviewedPages.loading) {
+    return <div className="admin-loading">Loading applications...</div>;
+  }
+  const error = minePages.error || pendingPages.error || reviewedPages.error;
   if (error) return <div className="admin-error">{error}</div>;
 
-  const pending = list.filter((a) => a.status === 'PENDING');
-  const others = list.filter((a) => a.status !== 'PENDING');
+  const mine = minePages.list;
+  const pending = pendingPages.list;
+  const others = reviewedPages.list;
 
   return (
     <div className="admin-apps-page">
       <h1>Owner applications</h1>
-      {list.length === 0 ? (
+      <div className="admin-claim-bar">
+        <button type="button" onClick={() => changeClaims(() => admin.claimNext(CLAIM_COUNT))} disabled={claiming}>
+          Claim next {CLAIM_COUNT}
+        </button>
+        {mine.length > 0 && (
+          <>
+            <button type="button" onClick={() => changeClaims(() => admin.renewClaims())} disabled={claiming}>
+              Keep my claims
+            </button>
+            <button type="button" onClick={() => changeClaims(() => admin.releaseClaims())} disabled={claiming}>
+              Release my claims
+            </button>
+          </>
+        )}
+        {claimError && <span className="admin-error">{claimError}</span>}
+      </div>
+      {mine.length === 0 && pending.length === 0 && others.length === 0 ? (
         <p className="admin-empty">No applications yet.</p>
       ) : (
         <>
+          {mine.length > 0 && (
+            <section className="admin-section">
+              <h2>Claimed by you (until {new Date(mine[0].claim_expires_at).toLocaleTimeString()})</h2>
+              <div className="admin-claim-bar">
+                <button
+                  type="button"
+                  onClick={() => changeClaims(() => admin.bulkReview('approve', mine.map((app) => app.id)))}
+                  disabled={claiming}
+                >
+                  Approve all {mine.length}
+                </button>
+                <button
+                  type="button"
+                  onClick={() => changeClaims(() => admin.bulkReview('reject', mine.map((app) => app.id)))}
+                  disabled={claiming}
+                >
+                  Reject all {mine.length}
+                </button>
+              </div>
+              <ul className="admin-list">
+                {mine.map((app) => <ApplicationLink key={app.id} app={app} />)}
+              </ul>
+              <LoadMore pages={minePages} />
+            </section>
+          )}
           {pending.length > 0 && (
             <section className="admin-section">
-              <h2>Pending ({pending.length})</h2>
+              <h2>Pending, unclaimed ({pending.length}{pendingPages.hasMore ? '+' : ''})</h2>
               <ul className="admin-list">
-                {pending.map((app) => (
-                  <li key={app.id} className="admin-list-item pending">
-                    <Link to={`/admin/applications/${app.id}`}>
-                      <strong>{app.restaurant_name}</strong> — {app.user_name} ({app.user_email})
-                    </Link>
-                    <span className="admin-date">{new Date(app.submitted_at).toLocaleString()}</span>
-                  </li>
-                ))}
+                {pending.map((app) => <ApplicationLink key={app.id} app={app} />)}
               </ul>
+              <LoadMore pages={pendingPages} />
             </section>
           )}
           {others.length > 0 && (
@@ -57,6 +178,7 @@ export default function AdminApplications() {
                   </li>
                 ))}
               </ul>
+              <LoadMore pages={reviewedPages} />
             </section>
           )}
         </>
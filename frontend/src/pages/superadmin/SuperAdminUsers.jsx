@@ -4,12 +4,35 @@ import { superadmin } from '../../api';
 import './SuperAdminUsers.css';
 
 const DEBOUNCE_MS = 350;
+const ROLES = ['USER', 'OWNER', 'AUDITOR', 'ADMIN', 'SUPER_ADMIN'];
+
+function cursorFromUrl(url) {
+  if (!url) return null;
+  try {
+    return new URL(url).searchParams.get('cursor');
+  } catch (_) {
+    return null;
+  }
+}
 
 export default function SuperAdminUsers() {
   const [list, setList] = useState([]);
   const [searchInput, setSearchInput] = useState('');
   const [search, setSearch] = useState('');
+  const [role, setRole] = useState('');
+  const [active, setActive] = useState('');
+  const [total, setTotal] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  const buildParams = () => {
+    const params = {};
+    if (search) params.search = search;
+    if (role) params.role = role;
+    if (active) params.is_active = active;
+    return params;
+  };
 
   useEffect(() => {
     const t = setTimeout(() => setSearch(searchInput.trim()), DEBOUNCE_MS);
@@ -19,17 +42,40 @@ export default function SuperAdminUsers() {
   useEffect(() => {
     setLoading(true);
     superadmin
-      .listUsers(search ? { search } : {})
-      .then(({ data }) => setList(Array.isArray(data) ? data : []))
-      .catch(() => setList([]))
+      // The planner's estimate is free; an exact count would scan every matching user
+      .listUsers({ ...buildParams(), count: 'estimate' })
+      .then(({ data }) => {
+        setList(Array.isArray(data?.results) ? data.results : []);
+        setTotal(data?.count ?? null);
+        setNextCursor(cursorFromUrl(data?.next));
+      })
+      .catch(() => {
+        setList([]);
+        setTotal(null);
+        setNextCursor(null);
+      })
       .finally(() => setLoading(false));
-  }, [search]);
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [search, role, active]);
+
+  const loadMore = () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    superadmin
+      .listUsers({ ...buildParams(), cursor: nextCursor })
+      .then(({ data }) => {
+        setList((prev) => [...prev, ...(Array.isArray(data?.results) ? data.results : [])]);
+        setNextCursor(cursorFromUrl(data?.next));
+      })
+      .catch(() => setNextCursor(null))
+      .finally(() => setLoadingMore(false));
+  };
 
   return (
     <div className="superadmin-users-page">
       <div className="superadmin-users-header">
         <h1>User management</h1>
-        <p className="superadmin-users-sub">Search by name or email. Change roles or create new users.</p>
+        <p className="superadmin-users-sub">Search by name or email prefix. Change roles or create new users.</p>
         <div className="superadmin-users-toolbar">
           <input
             type="text"
@@ -38,6 +84,17 @@ export default function SuperAdminUsers() {
             onChange={(e) => setSearchInput(e.target.value)}
             className="superadmin-users-search"
           />
+          <select value={role} onChange={(e) => setRole(e.target.value)} className="superadmin-users-filter">
+            <option value="">All roles</option>
+            {ROLES.map((r) => (
+              <option key={r} value={r}>{r}</option>
+            ))}
+          </select>
+          <select value={active} onChange={(e) => setActive(e.target.value)} className="superadmin-users-filter">
+            <option value="">Active and inactive</option>
+            <option value="true">Active</option>
+            <option value="false">Inactive</option>
+          </select>
           <Link to="/superadmin/users/create" className="superadmin-users-create-btn">Create user</Link>
         </div>
       </div>
@@ -75,6 +132,18 @@ export default function SuperAdminUsers() {
               )}
             </tbody>
           </table>
+          {total != null && (
+            <p className="superadmin-users-count">
+              Showing {list.length} of about {total.toLocaleString()}
+            </p>
+          )}
+          {nextCursor && (
+            <div className="superadmin-users-load-more">
+              <button type="button" onClick={loadMore} disabled={loadingMore}>
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>